@@ -9,6 +9,7 @@ https://docs.djangoproject.com/en/4.2/topics/settings/
 For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
+
 import os
 from pathlib import Path
 
@@ -83,9 +84,47 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": os.path.join(BASE_DIR, "db.sqlite3"),
+        # A file keeps the concurrency tests running, in-memory SQLite locks
+        # whole tables between the connections of different threads.
+        "TEST": {"NAME": os.path.join(BASE_DIR, "test_db.sqlite3")},
     }
 }
 
+GAME_STATE_TABLE_PATH = os.path.join(BASE_DIR, "game_state_table.bin")
+
+OPEN_MATCHES_CACHE_TTL = 2
+
+USER_CACHE_TTL = 30
+USER_CACHE_SIZE = 10000
+
+TOKEN_CACHE_TTL = 300
+TOKEN_CACHE_SIZE = 10000
+
+USER_REVOCATION_REFRESH_INTERVAL = 5
+
+PASSWORD_HASHING_WORKERS = os.cpu_count() or 1
+PASSWORD_HASHING_PENDING = 64
+
+TOKEN_REVOCATION_REFRESH_INTERVAL = 5
+TOKEN_REVOCATION_CAPACITY = 100000
+TOKEN_REVOCATION_FALSE_POSITIVE_RATE = 0.01
+# Each refresh reads again the revocations among the last ids it loaded. A
+# revocation that commits after this many greater ids were already read is
+# only picked up by the next rebuild.
+TOKEN_REVOCATION_REFRESH_OVERLAP = 1000
+
+USERNAME_FILTER_REFRESH_INTERVAL = 5
+USERNAME_FILTER_CAPACITY = 1000000
+USERNAME_FILTER_FALSE_POSITIVE_RATE = 0.01
+# Each refresh reads again the users among the last ids it loaded. A user that
+# commits after this many greater ids were already read is only picked up by
+# the next rebuild, until then it is reported as available.
+USERNAME_FILTER_REFRESH_OVERLAP = 1000
+
+MATCHMAKING_QUEUE_SIZE = 10000
+MATCHMAKING_MAXIMUM_WAIT = 300
+MATCHMAKING_POLL_TIMEOUT = 25
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
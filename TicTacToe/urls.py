@@ -2,21 +2,39 @@ from django.urls import path
 
 from core.views import schema_view
 from core.infrastructure.views.post_user_view import PostUserView
+from core.infrastructure.views.get_username_availability_view import (
+    GetUsernameAvailabilityView,
+)
 from core.infrastructure.views.post_login_view import PostLoginView
 from core.infrastructure.views.post_refresh_view import PostRefreshView
+from core.infrastructure.views.post_logout_view import PostLogoutView
 from core.infrastructure.views.post_match_view import PostMatchView
 from core.infrastructure.views.post_join_view import PostJoinView
+from core.infrastructure.views.post_join_any_view import PostJoinAnyView
 from core.infrastructure.views.post_movement_view import PostMovementView
 from core.infrastructure.views.get_match_view import GetMatchView
 from core.infrastructure.views.get_matches_view import GetMatchesView
+from core.infrastructure.views.get_open_matches_view import GetOpenMatchesView
+from core.infrastructure.views.matchmaking_view import MatchmakingView
+from core.infrastructure.views.get_matchmaking_metrics_view import (
+    GetMatchmakingMetricsView,
+)
 
 urlpatterns = [
     path("", schema_view.with_ui("swagger", cache_timeout=0), name="openapi"),
     path("users/", PostUserView.as_view(), name="create_user"),
+    path(
+        "users/available/",
+        GetUsernameAvailabilityView.as_view(),
+        name="get_username_availability",
+    ),
     path("login/", PostLoginView.as_view(), name="login_user"),
     path("login/refresh/", PostRefreshView.as_view(), name="refresh_token"),
+    path("logout/", PostLogoutView.as_view(), name="logout_user"),
     path("matches/", PostMatchView.as_view(), name="create_match"),
     path("matches/all/", GetMatchesView.as_view(), name="get_matches"),
+    path("matches/open/", GetOpenMatchesView.as_view(), name="get_open_matches"),
+    path("matches/join-any/", PostJoinAnyView.as_view(), name="join_any_match"),
     path("matches/<int:match_id>/", GetMatchView.as_view(), name="get_match"),
     path("matches/<int:match_id>/join/", PostJoinView.as_view(), name="join_match"),
     path(
@@ -24,4 +42,10 @@ urlpatterns = [
         PostMovementView.as_view(),
         name="make_movement",
     ),
+    path("matchmaking/", MatchmakingView.as_view(), name="matchmaking"),
+    path(
+        "matchmaking/metrics/",
+        GetMatchmakingMetricsView.as_view(),
+        name="get_matchmaking_metrics",
+    ),
 ]
@@ -0,0 +1,62 @@
+import random
+import timeit
+
+from core.domain.models.match import Match
+from core.infrastructure.checkers.board_outcome_table import BoardOutcomeTable
+from core.infrastructure.checkers.victory_checker import VictoryChecker
+from core.infrastructure.generators.board_generator import BoardGenerator
+
+BOARDS = [(3, 3, 3), (7, 7, 4), (11, 11, 5), (15, 15, 5), (19, 19, 5)]
+NUMBER_OF_RUNS = 2_000
+
+
+class SingleMatchRepository:
+    def __init__(self, match: Match):
+        self.match = match
+
+    def find_or_fail_by_id(self, match_id: int) -> Match:
+        return self.match
+
+
+def half_filled_match(width: int, height: int, line_length: int) -> Match:
+    slots = random.sample(range(width * height), width * height // 2)
+
+    return Match(
+        width=width,
+        height=height,
+        line_length=line_length,
+        first_player_board=sum(1 << slot for slot in slots[0::2]),
+        second_player_board=sum(1 << slot for slot in slots[1::2]),
+    )
+
+
+def microseconds(statement) -> float:
+    return timeit.timeit(statement, number=NUMBER_OF_RUNS) * 1e6 / NUMBER_OF_RUNS
+
+
+def main() -> None:
+    random.seed(0)
+    board_generator = BoardGenerator()
+
+    print(f"{'board':<14}{'last move':>12}{'full board':>13}{'generate':>13}")
+    for width, height, line_length in BOARDS:
+        match = half_filled_match(width, height, line_length)
+        victory_checker = VictoryChecker(
+            SingleMatchRepository(match), BoardOutcomeTable()
+        )
+        x, y = width // 2, height // 2
+
+        last_move = microseconds(
+            lambda: victory_checker.check_movement(match, x, y, "first player")
+        )
+        full_board = microseconds(lambda: victory_checker.check(match.id))
+        generate = microseconds(lambda: board_generator.generate(match, True))
+
+        print(
+            f"{f'{width}x{height}, k={line_length}':<14}{last_move:9.2f} us"
+            f"{full_board:10.2f} us{generate:10.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
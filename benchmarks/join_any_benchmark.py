@@ -0,0 +1,91 @@
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection
+
+from core.dependency_injection_factories.infrastructure.repositories.db_match_repository_factory import (
+    DbMatchRepositoryFactory,
+)
+from core.domain.exceptions.match_not_accepting_guests_exception import (
+    MatchNotAcceptingGuestsException,
+)
+from core.domain.exceptions.open_match_not_found_exception import (
+    OpenMatchNotFoundException,
+)
+from core.domain.models.match import Match
+from core.domain.models.user import User
+
+NUMBER_OF_CLIENTS = 8
+NUMBER_OF_MATCHES = 2_000
+
+
+def join_from_lobby(guest: User) -> Counter:
+    repository = DbMatchRepositoryFactory.create()
+    results = Counter()
+
+    try:
+        while True:
+            open_matches = repository.find_open(None, 1)
+            if not open_matches:
+                return results
+
+            try:
+                repository.save_guest(guest, open_matches[0].id)
+                results["joined"] = results["joined"] + 1
+            except MatchNotAcceptingGuestsException:
+                results["conflicts"] = results["conflicts"] + 1
+    finally:
+        connection.close()
+
+
+def join_any(guest: User) -> Counter:
+    repository = DbMatchRepositoryFactory.create()
+    results = Counter()
+
+    try:
+        while True:
+            try:
+                repository.save_any_guest(guest)
+                results["joined"] = results["joined"] + 1
+            except OpenMatchNotFoundException:
+                return results
+    finally:
+        connection.close()
+
+
+def run(name: str, join, creator: User, guests: list[User]) -> None:
+    repository = DbMatchRepositoryFactory.create()
+    for _ in range(NUMBER_OF_MATCHES):
+        repository.save(creator)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(NUMBER_OF_CLIENTS) as executor:
+        results = sum(executor.map(join, guests), Counter())
+    seconds = time.perf_counter() - start
+
+    print(
+        f"{name:>10}: {results['joined'] / seconds:8.0f} joins/s, "
+        f"{results['conflicts']} conflicts"
+    )
+
+
+def main() -> None:
+    creator = User.objects.create(username="join_any_creator", password="1234")
+    guests = [
+        User.objects.create(username=f"join_any_{guest}", password="1234")
+        for guest in range(NUMBER_OF_CLIENTS)
+    ]
+
+    try:
+        run("lobby", join_from_lobby, creator, guests)
+        run("join any", join_any, creator, guests)
+    finally:
+        Match.objects.filter(first_player=creator).delete()
+        User.objects.filter(
+            id__in=[creator.id, *(guest.id for guest in guests)]
+        ).delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import timeit
+from unittest.mock import Mock
+
+from core.domain.models.user import User
+from core.infrastructure.caches.ttl_cache import TtlCache
+from core.infrastructure.generators.jwt_generator import JWTGenerator
+from core.infrastructure.verifiers.jwt_verifier import JWTVerifier
+
+NUMBER_OF_TOKENS = 100
+NUMBER_OF_VERIFICATIONS = 100_000
+
+
+def microseconds(verifier: JWTVerifier, tokens: list[str]) -> float:
+    seconds = timeit.timeit(
+        lambda: [verifier.verify(token) for token in tokens],
+        number=NUMBER_OF_VERIFICATIONS // len(tokens),
+    )
+
+    return seconds * 1e6 / NUMBER_OF_VERIFICATIONS
+
+
+def main() -> None:
+    jwt_generator = JWTGenerator()
+    tokens = [
+        jwt_generator.generate(Mock(spec=User, id=user_id, username=f"user{user_id}"))
+        for user_id in range(NUMBER_OF_TOKENS)
+    ]
+
+    uncached = microseconds(JWTVerifier(), tokens)
+    cached = microseconds(JWTVerifier(TtlCache(ttl=300, maximum_size=1000)), tokens)
+
+    print(f"uncached: {uncached:6.2f} us/verification")
+    print(f"  cached: {cached:6.2f} us/verification ({uncached / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
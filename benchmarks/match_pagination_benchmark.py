@@ -0,0 +1,62 @@
+import timeit
+
+from django.core.paginator import Paginator
+
+from core.domain.models.match import Match
+from core.domain.models.user import User
+from core.infrastructure.repositories.db_match_repository import DbMatchRepository
+
+NUMBER_OF_MATCHES = 50_000
+PAGE_SIZE = 10
+DEPTHS = [1, 100, 1_000, 4_999]
+NUMBER_OF_RUNS = 20
+
+
+def milliseconds(statement) -> float:
+    return timeit.timeit(statement, number=NUMBER_OF_RUNS) * 1e3 / NUMBER_OF_RUNS
+
+
+def main() -> None:
+    user = User.objects.create(username="pagination_user", password="1234")
+    rival = User.objects.create(username="pagination_rival", password="1234")
+
+    try:
+        Match.objects.bulk_create(
+            (
+                (
+                    Match(first_player=user, second_player=rival)
+                    if number % 2
+                    else Match(first_player=rival, second_player=user)
+                )
+                for number in range(NUMBER_OF_MATCHES)
+            ),
+            batch_size=5_000,
+        )
+        match_repository = DbMatchRepository()
+        match_ids = list(
+            match_repository.find_by_user_id(user.id)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        paginator = Paginator(
+            match_repository.find_by_user_id(user.id).order_by("id"), PAGE_SIZE
+        )
+
+        print(f"{'page':>6}{'page number':>15}{'cursor':>12}")
+        for depth in DEPTHS:
+            after_match_id = match_ids[(depth - 1) * PAGE_SIZE - 1] if depth > 1 else 0
+            page_number = milliseconds(lambda: list(paginator.page(depth)))
+            cursor = milliseconds(
+                lambda: match_repository.find_page_by_user_id(
+                    user.id, after_match_id, PAGE_SIZE
+                )
+            )
+
+            print(f"{depth:>6}{page_number:12.2f} ms{cursor:9.2f} ms")
+    finally:
+        Match.objects.filter(first_player__in=[user, rival]).delete()
+        User.objects.filter(id__in=[user.id, rival.id]).delete()
+
+
+if __name__ == "__main__":
+    main()
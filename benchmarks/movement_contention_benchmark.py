@@ -0,0 +1,96 @@
+import random
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection
+
+from core.dependency_injection_factories.application.make_movement.make_movement_command_factory import (
+    MakeMovementCommandFactory,
+)
+from core.domain.exceptions.concurrent_movement_exception import (
+    ConcurrentMovementException,
+)
+from core.domain.models.match import Match, MatchStatuses
+from core.domain.models.user import User
+
+NUMBER_OF_CLIENTS = 8
+MOVEMENTS_PER_CLIENT = 200
+BOARD_SIZE = 15
+
+
+def create_match(first_player: User, second_player: User) -> Match:
+    return Match.objects.create(
+        first_player=first_player,
+        second_player=second_player,
+        status=MatchStatuses.IN_PROGRESS,
+        width=BOARD_SIZE,
+        height=BOARD_SIZE,
+        line_length=BOARD_SIZE,
+    )
+
+
+def hammer(match_id: int, players: list[User], seed: int) -> Counter:
+    command = MakeMovementCommandFactory.create()
+    randomizer = random.Random(seed)
+    results = Counter()
+
+    try:
+        for _ in range(MOVEMENTS_PER_CLIENT):
+            x, y = randomizer.randrange(BOARD_SIZE), randomizer.randrange(BOARD_SIZE)
+            try:
+                command.handle(match_id, randomizer.choice(players), x, y)
+                results["committed"] = results["committed"] + 1
+            except ConcurrentMovementException:
+                results["conflicts"] = results["conflicts"] + 1
+            except Exception:
+                results["rejected"] = results["rejected"] + 1
+    finally:
+        connection.close()
+
+    return results
+
+
+def run(name: str, match_ids: list[int], players: list[User]) -> None:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(NUMBER_OF_CLIENTS) as executor:
+        results = sum(
+            executor.map(
+                hammer,
+                match_ids,
+                [players] * NUMBER_OF_CLIENTS,
+                range(NUMBER_OF_CLIENTS),
+            ),
+            Counter(),
+        )
+    seconds = time.perf_counter() - start
+
+    attempts = NUMBER_OF_CLIENTS * MOVEMENTS_PER_CLIENT
+    print(
+        f"{name:>17}: {attempts / seconds:8.0f} attempts/s, "
+        f"{results['committed'] / seconds:8.0f} movements/s, "
+        f"{results['conflicts']} conflicts, {results['rejected']} rejected"
+    )
+
+
+def main() -> None:
+    players = [
+        User.objects.create(username=f"contention_{player}", password="1234")
+        for player in range(2)
+    ]
+
+    try:
+        same_match = create_match(*players)
+        run("same match", [same_match.id] * NUMBER_OF_CLIENTS, players)
+
+        different_matches = [
+            create_match(*players).id for _ in range(NUMBER_OF_CLIENTS)
+        ]
+        run("different matches", different_matches, players)
+    finally:
+        Match.objects.filter(first_player__in=players).delete()
+        User.objects.filter(id__in=[player.id for player in players]).delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import time
+import timeit
+import tracemalloc
+
+from core.infrastructure.checkers.board_outcome_table import FULL_BOARD, WIN_MASKS
+from core.infrastructure.generators.canonical_board_generator import (
+    CanonicalBoardGenerator,
+)
+from core.infrastructure.solvers import negamax_solver
+from core.infrastructure.solvers.negamax_solver import NegamaxSolver
+
+
+def reachable_positions() -> list[tuple[int, int]]:
+    positions = set()
+    pending = [(0, 0)]
+    while pending:
+        first_player_board, second_player_board = pending.pop()
+        if (first_player_board, second_player_board) in positions:
+            continue
+        positions.add((first_player_board, second_player_board))
+
+        first_player_turn = bin(first_player_board).count("1") == bin(
+            second_player_board
+        ).count("1")
+        last_board = second_player_board if first_player_turn else first_player_board
+        if any(last_board & mask == mask for mask in WIN_MASKS):
+            continue
+
+        free_slots = FULL_BOARD & ~(first_player_board | second_player_board)
+        for slot in range(9):
+            if free_slots >> slot & 1:
+                if first_player_turn:
+                    pending.append(
+                        (first_player_board | 1 << slot, second_player_board)
+                    )
+                else:
+                    pending.append(
+                        (first_player_board, second_player_board | 1 << slot)
+                    )
+
+    return list(positions)
+
+
+def main() -> None:
+    positions = reachable_positions()
+    solver = NegamaxSolver(CanonicalBoardGenerator())
+    negamax_solver._TRANSPOSITION_TABLE.clear()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    solver.solve(0, 0)
+    cold_seconds = time.perf_counter() - start
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    warm_seconds = timeit.timeit(
+        lambda: [solver.solve(*position) for position in positions], number=10
+    )
+
+    print(f"reachable positions: {len(positions)}")
+    print(f"transposition table entries: {solver.transposition_table_size()}")
+    print(f"cold solve of the whole game: {cold_seconds * 1e3:.1f} ms")
+    print(f"transposition table memory: {peak_memory / 1024:.1f} KiB")
+    print(f"warm solve: {warm_seconds * 1e6 / (10 * len(positions)):.2f} us/position")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password
+
+from core.application.login_user.login_user_command_info import LoginUserCommandInfo
+from core.dependency_injection_factories.application.login_user.login_user_command_factory import (
+    LoginUserCommandFactory,
+)
+from core.domain.models.token_family import TokenFamily
+from core.domain.models.user import User
+
+NUMBER_OF_LOGINS = 64
+CONCURRENT_LOGINS = 16
+
+
+def inline_logins(user: User) -> float:
+    start = time.perf_counter()
+    for _ in range(NUMBER_OF_LOGINS):
+        user = User.objects.get(username=user.username)
+        check_password("1234", user.password)
+
+    return NUMBER_OF_LOGINS / (time.perf_counter() - start)
+
+
+def pooled_logins(user: User) -> float:
+    login_user_command = LoginUserCommandFactory.create()
+
+    def log_in(_: int) -> None:
+        try:
+            login_user_command.handle(user.username, "1234")
+        except LoginUserCommandInfo:
+            pass
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(CONCURRENT_LOGINS) as executor:
+        list(executor.map(log_in, range(NUMBER_OF_LOGINS)))
+
+    return NUMBER_OF_LOGINS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    user = User.objects.create(username=f"hashing_{uuid4().hex[:8]}", password="1234")
+
+    try:
+        inline = inline_logins(user)
+        pooled = pooled_logins(user)
+    finally:
+        TokenFamily.objects.filter(user_id=user.id).delete()
+        user.delete()
+
+    print(f"hashing workers: {settings.PASSWORD_HASHING_WORKERS}")
+    print(f"   inline: {inline:6.1f} logins/s per worker")
+    print(f"   pooled: {pooled:6.1f} logins/s per worker ({pooled / inline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
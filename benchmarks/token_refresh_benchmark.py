@@ -0,0 +1,73 @@
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from django.test import Client
+from rest_framework.reverse import reverse
+
+from core.domain.models.token_family import TokenFamily
+from core.domain.models.user import User
+from core.infrastructure.repositories.db_token_family_repository import _digest
+
+NUMBER_OF_LIVE_SESSIONS = 1_000_000
+NUMBER_OF_REQUESTS = 200
+BATCH_SIZE = 10_000
+
+
+def percentiles(name: str, milliseconds: list[float]) -> None:
+    milliseconds = sorted(milliseconds)
+    p99 = milliseconds[max(0, round(len(milliseconds) * 0.99) - 1)]
+
+    print(
+        f"{name:>7}: p50 {statistics.median(milliseconds):6.2f} ms, p99 {p99:6.2f} ms"
+    )
+
+
+def main() -> None:
+    user = User.objects.create(username=f"refresh_{uuid4().hex[:8]}", password="1234")
+    expires_at = datetime.now(timezone.utc) + timedelta(days=1)
+
+    for first in range(0, NUMBER_OF_LIVE_SESSIONS, BATCH_SIZE):
+        TokenFamily.objects.bulk_create(
+            TokenFamily(
+                family_hash=_digest(uuid4().hex),
+                user_id=user.id,
+                token_hash=_digest(uuid4().hex),
+                expires_at=expires_at,
+            )
+            for _ in range(first, min(first + BATCH_SIZE, NUMBER_OF_LIVE_SESSIONS))
+        )
+
+    client = Client(HTTP_HOST="localhost")
+    login_times, refresh_times = [], []
+
+    try:
+        for _ in range(NUMBER_OF_REQUESTS // 10):
+            start = time.perf_counter()
+            refresh_token = client.post(
+                reverse("login_user"),
+                {"username": user.username, "password": "1234"},
+                content_type="application/json",
+            ).json()["refresh_token"]
+            login_times.append((time.perf_counter() - start) * 1000)
+
+            for _ in range(10):
+                start = time.perf_counter()
+                refresh_token = client.post(
+                    reverse("refresh_token"),
+                    {"refresh_token": refresh_token},
+                    content_type="application/json",
+                ).json()["refresh_token"]
+                refresh_times.append((time.perf_counter() - start) * 1000)
+    finally:
+        TokenFamily.objects.filter(user_id=user.id).delete()
+        user.delete()
+
+    print(f"{NUMBER_OF_LIVE_SESSIONS} live sessions")
+    percentiles("login", login_times)
+    percentiles("refresh", refresh_times)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import time
+import timeit
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+from uuid import uuid4
+
+from django.conf import settings
+
+from core.domain.models.revoked_token import RevokedToken
+from core.domain.models.user import User
+from core.infrastructure.caches.ttl_cache import TtlCache
+from core.infrastructure.generators.jwt_generator import JWTGenerator
+from core.infrastructure.verifiers.jwt_verifier import JWTVerifier
+from core.infrastructure.verifiers.token_revocation_list import TokenRevocationList
+
+NUMBER_OF_REVOKED_TOKENS = 50_000
+NUMBER_OF_NEW_REVOKED_TOKENS = 100
+NUMBER_OF_TOKENS = 100
+NUMBER_OF_VERIFICATIONS = 100_000
+
+
+def microseconds(verifier: JWTVerifier, tokens: list[str]) -> float:
+    seconds = timeit.timeit(
+        lambda: [verifier.verify(token) for token in tokens],
+        number=NUMBER_OF_VERIFICATIONS // len(tokens),
+    )
+
+    return seconds * 1e6 / NUMBER_OF_VERIFICATIONS
+
+
+def main() -> None:
+    expires_at = datetime.now(timezone.utc) + timedelta(days=1)
+    RevokedToken.objects.bulk_create(
+        RevokedToken(jti=uuid4().hex, expires_at=expires_at)
+        for _ in range(NUMBER_OF_REVOKED_TOKENS)
+    )
+
+    try:
+        token_revocation_list = TokenRevocationList(
+            refresh_interval=3600,
+            capacity=settings.TOKEN_REVOCATION_CAPACITY,
+            false_positive_rate=settings.TOKEN_REVOCATION_FALSE_POSITIVE_RATE,
+            refresh_overlap=settings.TOKEN_REVOCATION_REFRESH_OVERLAP,
+        )
+        start = time.perf_counter()
+        token_revocation_list.refresh()
+        rebuild = time.perf_counter() - start
+
+        RevokedToken.objects.bulk_create(
+            RevokedToken(jti=uuid4().hex, expires_at=expires_at)
+            for _ in range(NUMBER_OF_NEW_REVOKED_TOKENS)
+        )
+        start = time.perf_counter()
+        token_revocation_list.refresh()
+        incremental = time.perf_counter() - start
+
+        jwt_generator = JWTGenerator()
+        tokens = [
+            jwt_generator.generate(
+                Mock(spec=User, id=user_id, username=f"user{user_id}")
+            )
+            for user_id in range(NUMBER_OF_TOKENS)
+        ]
+
+        unchecked = microseconds(
+            JWTVerifier(TtlCache(ttl=300, maximum_size=1000)), tokens
+        )
+        checked = microseconds(
+            JWTVerifier(TtlCache(ttl=300, maximum_size=1000), token_revocation_list),
+            tokens,
+        )
+    finally:
+        RevokedToken.objects.all().delete()
+
+    print(
+        f"rebuild: {rebuild * 1000:6.2f} ms for {NUMBER_OF_REVOKED_TOKENS} revoked tokens"
+    )
+    print(
+        f"refresh: {incremental * 1000:6.2f} ms for {NUMBER_OF_NEW_REVOKED_TOKENS} "
+        "new revoked tokens"
+    )
+    print(f"unchecked: {unchecked:6.2f} us/verification")
+    print(f"  checked: {checked:6.2f} us/verification (+{checked - unchecked:.2f} us)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import time
+
+import jwt
+from django.conf import settings
+from django.db import connection
+from django.test import RequestFactory
+
+from core.dependency_injection_factories.infrastructure.verifiers.jwt_verifier_factory import (
+    JWTVerifierFactory,
+)
+from core.domain.models.user import User
+from core.infrastructure.caches.ttl_cache import TtlCache
+from core.infrastructure.repositories.cached_user_repository import (
+    CachedUserRepository,
+)
+from core.infrastructure.repositories.db_user_repository import DbUserRepository
+from core.infrastructure.verifiers.user_authentication_verifier import (
+    UserAuthenticationVerifier,
+)
+
+NUMBER_OF_USERS = 100
+NUMBER_OF_REQUESTS = 20_000
+
+
+def run(name: str, verifier: UserAuthenticationVerifier, requests: list) -> None:
+    queries = []
+
+    def count_query(execute, sql, params, many, context):
+        queries.append(sql)
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count_query):
+        start = time.perf_counter()
+        for request in requests:
+            verifier.verify(request)
+        seconds = time.perf_counter() - start
+
+    print(
+        f"{name:>8}: {len(requests) / seconds:8.0f} requests/s, "
+        f"{len(queries) / len(requests):.3f} queries/request"
+    )
+
+
+def main() -> None:
+    users = [
+        User.objects.create(username=f"user_cache_{user}", password="1234")
+        for user in range(NUMBER_OF_USERS)
+    ]
+    expiration = int(time.time()) + 3600
+    request_factory = RequestFactory()
+    requests = [
+        request_factory.get(
+            "/matches/all/",
+            HTTP_AUTHORIZATION="Bearer "
+            + jwt.encode(
+                {
+                    "user_id": users[number % NUMBER_OF_USERS].id,
+                    "exp": expiration,
+                    "refresh_token": False,
+                },
+                settings.SECRET_KEY,
+                algorithm="HS256",
+            ),
+        )
+        for number in range(NUMBER_OF_REQUESTS)
+    ]
+
+    try:
+        user_cache = TtlCache(ttl=settings.USER_CACHE_TTL, maximum_size=1000)
+        run(
+            "database",
+            UserAuthenticationVerifier(DbUserRepository(), JWTVerifierFactory.create()),
+            requests,
+        )
+        run(
+            "cached",
+            UserAuthenticationVerifier(
+                CachedUserRepository(DbUserRepository(), user_cache),
+                JWTVerifierFactory.create(),
+            ),
+            requests,
+        )
+        print(f"cache hits: {user_cache.hits}, misses: {user_cache.misses}")
+    finally:
+        User.objects.filter(id__in=[user.id for user in users]).delete()
+
+
+if __name__ == "__main__":
+    main()
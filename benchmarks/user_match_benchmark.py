@@ -0,0 +1,74 @@
+import random
+import sys
+import timeit
+
+from django.db.models import Q
+
+from core.domain.models.match import Match, MatchPlayer
+from core.domain.models.user import User
+from core.domain.models.user_match import UserMatch
+from core.infrastructure.repositories.db_match_repository import DbMatchRepository
+
+NUMBER_OF_MATCHES = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+NUMBER_OF_USERS = 1_000
+BATCH_SIZE = 10_000
+PAGE_SIZE = 10
+NUMBER_OF_RUNS = 200
+
+
+def milliseconds(statement) -> float:
+    return timeit.timeit(statement, number=NUMBER_OF_RUNS) * 1e3 / NUMBER_OF_RUNS
+
+
+def populate(users: list[User]) -> None:
+    randomizer = random.Random(0)
+    for start in range(0, NUMBER_OF_MATCHES, BATCH_SIZE):
+        players = [
+            randomizer.sample(users, 2)
+            for _ in range(min(BATCH_SIZE, NUMBER_OF_MATCHES - start))
+        ]
+        matches = Match.objects.bulk_create(
+            Match(first_player=first_player, second_player=second_player)
+            for first_player, second_player in players
+        )
+        UserMatch.objects.bulk_create(
+            UserMatch(user=user, match=match, role=role)
+            for match, (first_player, second_player) in zip(matches, players)
+            for user, role in (
+                (first_player, MatchPlayer.FIRST_PLAYER),
+                (second_player, MatchPlayer.SECOND_PLAYER),
+            )
+        )
+
+
+def main() -> None:
+    users = User.objects.bulk_create(
+        User(username=f"user_match_{user}", _password="1234")
+        for user in range(NUMBER_OF_USERS)
+    )
+
+    try:
+        populate(users)
+        match_repository = DbMatchRepository()
+        user_id = users[0].id
+
+        or_query = Match.objects.filter(
+            Q(first_player_id=user_id) | Q(second_player_id=user_id)
+        ).order_by("id")
+        results = {
+            "or query": milliseconds(lambda: list(or_query[:PAGE_SIZE])),
+            "user match": milliseconds(
+                lambda: match_repository.find_page_by_user_id(user_id, 0, PAGE_SIZE)
+            ),
+        }
+
+        print(f"{NUMBER_OF_MATCHES:,} matches, {NUMBER_OF_USERS:,} users")
+        for name, page_milliseconds in results.items():
+            print(f"{name:>11}: {page_milliseconds:8.3f} ms/page")
+    finally:
+        Match.objects.filter(first_player__in=users).delete()
+        User.objects.filter(id__in=[user.id for user in users]).delete()
+
+
+if __name__ == "__main__":
+    main()
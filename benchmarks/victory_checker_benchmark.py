@@ -0,0 +1,82 @@
+import random
+import timeit
+from typing import Optional
+
+from core.domain.models.match import MatchPlayer
+from core.infrastructure.checkers.board_outcome_table import (
+    WIN_PATTERNS,
+    BoardOutcomeTable,
+)
+
+NUMBER_OF_BOARDS = 100_000
+
+
+def pattern_loop_check(board: list[list[Optional[str]]]) -> Optional[str]:
+    for position_1, position_2, position_3 in WIN_PATTERNS:
+        x_1, y_1 = position_1
+        x_2, y_2 = position_2
+        x_3, y_3 = position_3
+
+        slots = [board[x_1][y_1], board[x_2][y_2], board[x_3][y_3]]
+
+        if all(map(lambda slot: slot == MatchPlayer.FIRST_PLAYER.value, slots)) is True:
+            return MatchPlayer.FIRST_PLAYER.value
+        elif (
+            all(map(lambda slot: slot == MatchPlayer.SECOND_PLAYER.value, slots))
+            is True
+        ):
+            return MatchPlayer.SECOND_PLAYER.value
+
+
+def random_boards(number_of_boards: int) -> list[tuple[int, int]]:
+    boards = []
+    for _ in range(number_of_boards):
+        slots = random.sample(range(9), random.randint(0, 9))
+        first_player_board = sum(1 << slot for slot in slots[0::2])
+        second_player_board = sum(1 << slot for slot in slots[1::2])
+        boards.append((first_player_board, second_player_board))
+
+    return boards
+
+
+def to_board(
+    first_player_board: int, second_player_board: int
+) -> list[list[Optional[str]]]:
+    board: list[list[Optional[str]]] = [[None] * 3 for _ in range(3)]
+    for slot in range(9):
+        if first_player_board >> slot & 1:
+            board[slot // 3][slot % 3] = MatchPlayer.FIRST_PLAYER.value
+        elif second_player_board >> slot & 1:
+            board[slot // 3][slot % 3] = MatchPlayer.SECOND_PLAYER.value
+
+    return board
+
+
+def main() -> None:
+    random.seed(0)
+    boards = random_boards(NUMBER_OF_BOARDS)
+    list_boards = [to_board(*board) for board in boards]
+    table = BoardOutcomeTable()
+    codes = [table.encode(*board) for board in boards]
+
+    results = {
+        "pattern loop": timeit.timeit(
+            lambda: [pattern_loop_check(board) for board in list_boards], number=1
+        ),
+        "outcome table": timeit.timeit(
+            lambda: [table.classify(*board) for board in boards], number=1
+        ),
+        "outcome table (batch)": timeit.timeit(
+            lambda: table.classify_codes(codes), number=1
+        ),
+    }
+
+    for name, seconds in results.items():
+        print(
+            f"{name:>22}: {seconds * 1e9 / NUMBER_OF_BOARDS:8.1f} ns/board "
+            f"({NUMBER_OF_BOARDS / seconds:,.0f} boards/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
+from typing import Union
+
 from core.application.command import Command
 from core.application.create_match.create_match_command_info import (
     CreateMatchCommandInfo,
 )
+from core.domain.models.principal import Principal
 from core.domain.models.user import User
 from core.domain.repositories.match_repository import MatchRepository
 
@@ -12,7 +15,15 @@ class CreateMatchCommand(Command):
     def __init__(self, match_repository: MatchRepository):
         self.__match_repository = match_repository
 
-    def handle(self, creator: User) -> None:
-        created_match = self.__match_repository.save(creator)
+    def handle(
+        self,
+        creator: Union[User, Principal],
+        width: int = 3,
+        height: int = 3,
+        line_length: int = 3,
+    ) -> None:
+        created_match = self.__match_repository.save(
+            creator, width, height, line_length
+        )
 
         raise CreateMatchCommandInfo(created_match.id)
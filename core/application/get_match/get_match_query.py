@@ -1,10 +1,16 @@
+from typing import Optional, Union
+
 from django.contrib.auth.models import User
 
 from core.application.get_match.get_match_query_response import GetMatchQueryResponse
 from core.application.query import Query
 from core.domain.exceptions.not_in_game_exception import NotInGameException
+from core.domain.models.principal import Principal
 from core.domain.repositories.match_repository import MatchRepository
-from core.infrastructure.generators.board_generator import BoardGenerator
+from core.infrastructure.generators.board_generator import (
+    BoardFormats,
+    BoardGenerator,
+)
 
 
 class GetMatchQuery(Query):
@@ -16,7 +22,12 @@ class GetMatchQuery(Query):
         self.__match_repository = match_repository
         self.__board_generator = board_generator
 
-    def handle(self, match_id: int, user: User) -> GetMatchQueryResponse:
+    def handle(
+        self,
+        match_id: int,
+        user: Union[User, Principal],
+        board_format: str = BoardFormats.NESTED,
+    ) -> GetMatchQueryResponse:
         match = self.__match_repository.find_or_fail_by_id(match_id)
 
         is_user_in_match = (
@@ -25,11 +36,20 @@ class GetMatchQuery(Query):
         if is_user_in_match is False:
             raise NotInGameException()
 
-        game_board = self.__board_generator.generate(match, True)
+        game_board: Union[list[list[Optional[str]]], str, int]
+        if board_format == BoardFormats.STRING:
+            game_board = self.__board_generator.generate_string(match)
+        elif board_format == BoardFormats.CODE:
+            game_board = self.__board_generator.generate_code(match)
+        else:
+            game_board = self.__board_generator.generate(match, True)
 
         return GetMatchQueryResponse(
             status=match.status,
             number_of_movements=match.number_of_movements,
+            width=match.width,
+            height=match.height,
+            line_length=match.line_length,
             board=game_board,
             first_player=match.first_player,
             second_player=match.second_player,
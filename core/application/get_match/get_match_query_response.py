@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Union
 
 from core.application.query_response import QueryResponse
 from core.domain.models.user import User
@@ -9,7 +9,10 @@ from core.domain.models.user import User
 class GetMatchQueryResponse(QueryResponse):
     status: str
     number_of_movements: int
-    board: list[list[Optional[str]]]
+    width: int
+    height: int
+    line_length: int
+    board: Union[list[list[Optional[str]]], str, int]
     first_player: User
     second_player: Optional[User]
     winner: Optional[str]
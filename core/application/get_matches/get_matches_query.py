@@ -1,3 +1,5 @@
+from typing import Optional
+
 from core.application.get_matches.get_matches_query_response import (
     GetMatchesQueryResponse,
 )
@@ -11,7 +13,17 @@ class GetMatchesQuery(Query):
     def __init__(self, match_repository: MatchRepository):
         self.__match_repository = match_repository
 
-    def handle(self, user_id: int) -> GetMatchesQueryResponse:
-        matches = self.__match_repository.find_by_user_id(user_id)
+    def handle(
+        self,
+        user_id: int,
+        after_match_id: Optional[int] = None,
+        page_size: Optional[int] = None,
+    ) -> GetMatchesQueryResponse:
+        if after_match_id is None:
+            matches = self.__match_repository.find_by_user_id(user_id)
+        else:
+            matches = self.__match_repository.find_page_by_user_id(
+                user_id, after_match_id, page_size
+            )
 
         return GetMatchesQueryResponse(matches)
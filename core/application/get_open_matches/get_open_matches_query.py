@@ -0,0 +1,21 @@
+from typing import Optional
+
+from core.application.get_open_matches.get_open_matches_query_response import (
+    GetOpenMatchesQueryResponse,
+)
+from core.application.query import Query
+from core.domain.repositories.match_repository import MatchRepository
+
+
+class GetOpenMatchesQuery(Query):
+    __slots__ = "__match_repository"
+
+    def __init__(self, match_repository: MatchRepository):
+        self.__match_repository = match_repository
+
+    def handle(
+        self, before_match_id: Optional[int], page_size: int
+    ) -> GetOpenMatchesQueryResponse:
+        matches = self.__match_repository.find_open(before_match_id, page_size)
+
+        return GetOpenMatchesQueryResponse(matches)
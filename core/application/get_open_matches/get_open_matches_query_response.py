@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+from core.application.query_response import QueryResponse
+from core.domain.models.match import Match
+
+
+@dataclass(frozen=True)
+class GetOpenMatchesQueryResponse(QueryResponse):
+    matches: list[Match]
@@ -0,0 +1,26 @@
+from core.application.get_username_availability.get_username_availability_query_response import (
+    GetUsernameAvailabilityQueryResponse,
+)
+from core.application.query import Query
+from core.domain.repositories.user_repository import UserRepository
+from core.infrastructure.caches.username_filter import UsernameFilter
+
+
+class GetUsernameAvailabilityQuery(Query):
+    __slots__ = ("__user_repository", "__username_filter")
+
+    def __init__(
+        self, user_repository: UserRepository, username_filter: UsernameFilter
+    ):
+        self.__user_repository = user_repository
+        self.__username_filter = username_filter
+
+    def handle(self, username: str) -> GetUsernameAvailabilityQueryResponse:
+        # The filter has no false negatives, so only a possible hit needs the
+        # unique index to tell a taken username from a false positive.
+        if self.__username_filter.might_exist(username) is False:
+            return GetUsernameAvailabilityQueryResponse(available=True)
+
+        user = self.__user_repository.find_user_by_username(username)
+
+        return GetUsernameAvailabilityQueryResponse(available=user is None)
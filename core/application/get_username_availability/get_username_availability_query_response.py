@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+from core.application.query_response import QueryResponse
+
+
+@dataclass(frozen=True)
+class GetUsernameAvailabilityQueryResponse(QueryResponse):
+    available: bool
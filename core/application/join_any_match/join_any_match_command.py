@@ -0,0 +1,21 @@
+from typing import Union
+
+from core.application.command import Command
+from core.application.join_any_match.join_any_match_command_info import (
+    JoinAnyMatchCommandInfo,
+)
+from core.domain.models.principal import Principal
+from core.domain.models.user import User
+from core.domain.repositories.match_repository import MatchRepository
+
+
+class JoinAnyMatchCommand(Command):
+    __slots__ = "__match_repository"
+
+    def __init__(self, match_repository: MatchRepository):
+        self.__match_repository = match_repository
+
+    def handle(self, guest: Union[User, Principal]) -> None:
+        joined_match = self.__match_repository.save_any_guest(guest)
+
+        raise JoinAnyMatchCommandInfo(joined_match.id)
@@ -1,4 +1,7 @@
+from typing import Union
+
 from core.application.command import Command
+from core.domain.models.principal import Principal
 from core.domain.models.user import User
 from core.domain.repositories.match_repository import MatchRepository
 
@@ -9,5 +12,5 @@ class JoinMatchCommand(Command):
     def __init__(self, match_repository: MatchRepository):
         self.__match_repository = match_repository
 
-    def handle(self, guest: User, match_id: int) -> None:
+    def handle(self, guest: Union[User, Principal], match_id: int) -> None:
         self.__match_repository.save_guest(guest, match_id)
@@ -1,6 +1,7 @@
 from typing import Optional
+from uuid import uuid4
 
-from django.contrib.auth.hashers import check_password
+from django.utils import timezone
 
 from core.application.command import Command
 from core.application.login_user.login_user_command_info import LoginUserCommandInfo
@@ -9,22 +10,60 @@ from core.domain.exceptions.incorrect_user_password_exception import (
 )
 from core.domain.exceptions.user_not_found_exception import UserNotFoundException
 from core.domain.models.user import User
+from core.domain.repositories.token_family_repository import TokenFamilyRepository
 from core.domain.repositories.user_repository import UserRepository
+from core.infrastructure.generators.jwt_generator import TOKEN_LIFETIME
+from core.infrastructure.hashers.password_hasher import PasswordHasher
 
 
 class LoginUserCommand(Command):
-    __slots__ = ("username", "password", "__user_repository")
+    __slots__ = (
+        "username",
+        "password",
+        "__user_repository",
+        "__token_family_repository",
+        "__password_hasher",
+    )
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        token_family_repository: TokenFamilyRepository,
+        password_hasher: PasswordHasher,
+    ):
         self.__user_repository = user_repository
+        self.__token_family_repository = token_family_repository
+        self.__password_hasher = password_hasher
 
     def handle(self, username: str, password: str) -> None:
+        user = self.__find_user(username)
+
+        is_correct, new_password_hash = self.__password_hasher.verify(
+            password, user.password
+        )
+
+        self.__log_in(user, is_correct, new_password_hash)
+
+    def __find_user(self, username: str) -> User:
         user: Optional[User] = self.__user_repository.find_user_by_username(username)
 
         if user is None:
             raise UserNotFoundException()
 
-        if check_password(password, user.password) is False:
+        return user
+
+    def __log_in(
+        self, user: User, is_correct: bool, new_password_hash: Optional[str]
+    ) -> None:
+        if is_correct is False:
             raise IncorrectUserPasswordException()
 
-        raise LoginUserCommandInfo(user)
+        if new_password_hash is not None:
+            self.__user_repository.update_password_hash(user, new_password_hash)
+
+        family, jti = uuid4().hex, uuid4().hex
+        self.__token_family_repository.save(
+            family, user.id, jti, timezone.now() + TOKEN_LIFETIME
+        )
+
+        raise LoginUserCommandInfo(user, family, jti)
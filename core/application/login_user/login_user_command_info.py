@@ -2,7 +2,9 @@ from core.domain.models.user import User
 
 
 class LoginUserCommandInfo(Exception):
-    __slots__ = "user"
+    __slots__ = ("user", "family", "jti")
 
-    def __init__(self, user: User):
+    def __init__(self, user: User, family: str, jti: str):
         self.user = user
+        self.family = family
+        self.jti = jti
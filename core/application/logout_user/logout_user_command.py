@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from core.application.command import Command
+from core.domain.exceptions.jwt_verification_exception import JWTVerificationException
+from core.domain.repositories.token_family_repository import TokenFamilyRepository
+from core.infrastructure.verifiers.jwt_verifier import JWTVerifier
+from core.infrastructure.verifiers.token_revocation_list import TokenRevocationList
+
+
+class LogoutUserCommand(Command):
+    __slots__ = (
+        "__jwt_verifier",
+        "__token_revocation_list",
+        "__token_family_repository",
+    )
+
+    def __init__(
+        self,
+        jwt_verifier: JWTVerifier,
+        token_revocation_list: TokenRevocationList,
+        token_family_repository: TokenFamilyRepository,
+    ):
+        self.__jwt_verifier = jwt_verifier
+        self.__token_revocation_list = token_revocation_list
+        self.__token_family_repository = token_family_repository
+
+    def handle(self, access_token: str, refresh_token: Optional[str] = None) -> None:
+        payloads = [self.__jwt_verifier.verify(access_token)]
+
+        if refresh_token is not None:
+            refresh_payload = self.__jwt_verifier.verify(refresh_token)
+            if refresh_payload.get("user_id") != payloads[0].get("user_id"):
+                raise JWTVerificationException()
+
+            payloads.append(refresh_payload)
+
+            if "family" in refresh_payload:
+                self.__token_family_repository.delete(refresh_payload["family"])
+
+        for payload in payloads:
+            self.__revoke(payload)
+
+    def __revoke(self, payload: dict[str, Any]) -> None:
+        # Tokens issued before the jti claim existed cannot be revoked one by
+        # one, they simply expire.
+        if "jti" not in payload:
+            return
+
+        self.__token_revocation_list.revoke(
+            payload["jti"], datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+        )
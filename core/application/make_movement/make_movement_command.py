@@ -1,34 +1,44 @@
+from typing import Union
+
 from core.application.command import Command
-from core.domain.exceptions.last_movement_made_exception import (
-    LastMovementMadeException,
+from core.domain.exceptions.concurrent_movement_exception import (
+    ConcurrentMovementException,
 )
+from core.domain.models.principal import Principal
 from core.domain.models.user import User
-from core.domain.repositories.match_repository import MatchRepository
-from core.domain.repositories.movement_repository import MovementRepository
+from core.domain.repositories.match_unit_of_work import MatchUnitOfWork
 from core.infrastructure.checkers.victory_checker import VictoryChecker
 
 
 class MakeMovementCommand(Command):
-    __slots__ = ("__movement_repository", "__victory_checker", "__match_repository")
+    MAXIMUM_ATTEMPTS = 3
+    __slots__ = ("__match_unit_of_work", "__victory_checker")
 
     def __init__(
-        self,
-        movement_repository: MovementRepository,
-        victory_checker: VictoryChecker,
-        match_repository: MatchRepository,
+        self, match_unit_of_work: MatchUnitOfWork, victory_checker: VictoryChecker
     ):
-        self.__movement_repository = movement_repository
+        self.__match_unit_of_work = match_unit_of_work
         self.__victory_checker = victory_checker
-        self.__match_repository = match_repository
 
-    def handle(self, match_id: int, player: User, x: int, y: int) -> None:
-        is_last = False
-        try:
-            self.__movement_repository.save(match_id, player, x, y)
-        except LastMovementMadeException:
-            is_last = True
+    def handle(
+        self, match_id: int, player: Union[User, Principal], x: int, y: int
+    ) -> None:
+        for attempt in range(1, self.MAXIMUM_ATTEMPTS + 1):
+            try:
+                return self.__make_movement(match_id, player, x, y)
+            except ConcurrentMovementException:
+                if attempt == self.MAXIMUM_ATTEMPTS:
+                    raise
+
+    def __make_movement(
+        self, match_id: int, player: Union[User, Principal], x: int, y: int
+    ) -> None:
+        match = self.__match_unit_of_work.find_or_fail_by_id(match_id)
+
+        turn = match.play(player, x, y)
+        winner = self.__victory_checker.check_movement(match, x, y, turn)
 
-        winner = self.__victory_checker.check(match_id)
+        if winner is not None or match.is_board_full:
+            match.finish(winner)
 
-        if is_last is True or winner is not None:
-            self.__match_repository.end_match(match_id, winner)
+        self.__match_unit_of_work.commit(match, x, y)
@@ -1,26 +1,74 @@
+import hashlib
+from datetime import datetime, timezone
+from uuid import uuid4
+
 from core.application.command import Command
 from core.application.refresh_token.refresh_token_command_info import (
     RefreshTokenCommandInfo,
 )
+from core.domain.exceptions.jwt_verification_exception import JWTVerificationException
 from core.domain.exceptions.user_not_found_exception import UserNotFoundException
+from core.domain.repositories.token_family_repository import TokenFamilyRepository
 from core.domain.repositories.user_repository import UserRepository
+from core.infrastructure.generators.jwt_generator import TOKEN_LIFETIME
 from core.infrastructure.verifiers.jwt_verifier import JWTVerifier
+from core.infrastructure.verifiers.token_revocation_list import TokenRevocationList
 
 
 class RefreshTokenCommand(Command):
-    __slots__ = ("__user_repository", "__jwt_verifier")
+    __slots__ = (
+        "__user_repository",
+        "__jwt_verifier",
+        "__token_family_repository",
+        "__token_revocation_list",
+    )
 
-    def __init__(self, user_repository: UserRepository, jwt_verifier: JWTVerifier):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        jwt_verifier: JWTVerifier,
+        token_family_repository: TokenFamilyRepository,
+        token_revocation_list: TokenRevocationList,
+    ):
         self.__user_repository = user_repository
         self.__jwt_verifier = jwt_verifier
+        self.__token_family_repository = token_family_repository
+        self.__token_revocation_list = token_revocation_list
 
     def handle(self, refresh_token: str) -> None:
         payload = self.__jwt_verifier.verify(refresh_token)
 
+        if payload.get("refresh_token") is not True:
+            raise JWTVerificationException()
+
         user_id = payload.get("user_id")
 
         user = self.__user_repository.find_by_id(user_id)
         if user is None:
             raise UserNotFoundException()
 
-        raise RefreshTokenCommandInfo(user)
+        jti = uuid4().hex
+        expires_at = datetime.now(timezone.utc) + TOKEN_LIFETIME
+
+        family = payload.get("family")
+        if family is None:
+            # Tokens issued before rotation existed start a family of their own
+            # and are revoked, so that each one is exchanged only once. Those
+            # issued before the jti claim existed are revoked by their digest.
+            legacy_jti = payload.get("jti")
+            if legacy_jti is None:
+                legacy_jti = hashlib.sha256(refresh_token.encode()).hexdigest()[:32]
+
+            if not self.__token_revocation_list.revoke(
+                legacy_jti, datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+            ):
+                raise JWTVerificationException()
+
+            family = uuid4().hex
+            self.__token_family_repository.save(family, user.id, jti, expires_at)
+        elif not self.__token_family_repository.rotate(
+            family, payload.get("jti"), jti, expires_at
+        ):
+            raise JWTVerificationException()
+
+        raise RefreshTokenCommandInfo(user, family, jti)
@@ -1,4 +1,7 @@
+from uuid import uuid4
+
 from django.db.utils import IntegrityError
+from django.utils import timezone
 
 from core.application.command import Command
 from core.application.register_user.register_user_command_info import (
@@ -7,19 +10,60 @@ from core.application.register_user.register_user_command_info import (
 from core.domain.exceptions.user_already_exists_exception import (
     UserAlreadyExistsException,
 )
+from core.domain.repositories.token_family_repository import TokenFamilyRepository
 from core.domain.repositories.user_repository import UserRepository
+from core.infrastructure.caches.username_filter import UsernameFilter
+from core.infrastructure.generators.jwt_generator import TOKEN_LIFETIME
+from core.infrastructure.hashers.password_hasher import PasswordHasher
 
 
 class RegisterUserCommand(Command):
-    __slots__ = "__user_repository"
+    __slots__ = (
+        "__user_repository",
+        "__token_family_repository",
+        "__password_hasher",
+        "__username_filter",
+    )
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        token_family_repository: TokenFamilyRepository,
+        password_hasher: PasswordHasher,
+        username_filter: UsernameFilter,
+    ):
         self.__user_repository = user_repository
+        self.__token_family_repository = token_family_repository
+        self.__password_hasher = password_hasher
+        self.__username_filter = username_filter
 
     def handle(self, username: str, password: str) -> None:
+        self.__check_username(username)
+        password_hash = self.__password_hasher.hash(password)
+
+        self.__register(username, password_hash)
+
+    def __check_username(self, username: str) -> None:
+        # Rejects taken usernames before paying for the hash. A username
+        # registered elsewhere after the last filter refresh is still caught
+        # by the unique index when saving.
+        if (
+            self.__username_filter.might_exist(username)
+            and self.__user_repository.find_user_by_username(username) is not None
+        ):
+            raise UserAlreadyExistsException(username)
+
+    def __register(self, username: str, password_hash: str) -> None:
         try:
-            user = self.__user_repository.save(username, password)
+            user = self.__user_repository.save_hashed(username, password_hash)
         except IntegrityError:
             raise UserAlreadyExistsException(username)
 
-        raise RegisterUserCommandInfo(user)
+        self.__username_filter.add(username)
+
+        family, jti = uuid4().hex, uuid4().hex
+        self.__token_family_repository.save(
+            family, user.id, jti, timezone.now() + TOKEN_LIFETIME
+        )
+
+        raise RegisterUserCommandInfo(user, family, jti)
@@ -1,6 +1,33 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
+
+    def ready(self) -> None:
+        from core.dependency_injection_factories.infrastructure.caches.user_cache_factory import (
+            UserCacheFactory,
+        )
+        from core.dependency_injection_factories.infrastructure.verifiers.user_revocation_set_factory import (
+            UserRevocationSetFactory,
+        )
+        from core.domain.models.user import User
+
+        user_cache = UserCacheFactory.create()
+        user_revocation_set = UserRevocationSetFactory.create()
+
+        def forget_user(instance: User, **kwargs) -> None:
+            user_cache.delete(instance.id)
+
+        def revoke_user(instance: User, **kwargs) -> None:
+            user_cache.delete(instance.id)
+            user_revocation_set.revoke(instance.id)
+
+        post_save.connect(
+            forget_user, sender=User, weak=False, dispatch_uid="forget_cached_user"
+        )
+        post_delete.connect(
+            revoke_user, sender=User, weak=False, dispatch_uid="revoke_deleted_user"
+        )
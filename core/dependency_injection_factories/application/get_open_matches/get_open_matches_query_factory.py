@@ -0,0 +1,12 @@
+from core.application.get_open_matches.get_open_matches_query import (
+    GetOpenMatchesQuery,
+)
+from core.dependency_injection_factories.infrastructure.repositories.db_match_repository_factory import (
+    DbMatchRepositoryFactory,
+)
+
+
+class GetOpenMatchesQueryFactory:
+    @staticmethod
+    def create() -> GetOpenMatchesQuery:
+        return GetOpenMatchesQuery(match_repository=DbMatchRepositoryFactory.create())
@@ -0,0 +1,18 @@
+from core.application.get_username_availability.get_username_availability_query import (
+    GetUsernameAvailabilityQuery,
+)
+from core.dependency_injection_factories.infrastructure.caches.username_filter_factory import (
+    UsernameFilterFactory,
+)
+from core.dependency_injection_factories.infrastructure.repositories.db_user_repository_factory import (
+    DbUserRepositoryFactory,
+)
+
+
+class GetUsernameAvailabilityQueryFactory:
+    @staticmethod
+    def create() -> GetUsernameAvailabilityQuery:
+        return GetUsernameAvailabilityQuery(
+            user_repository=DbUserRepositoryFactory.create(),
+            username_filter=UsernameFilterFactory.create(),
+        )
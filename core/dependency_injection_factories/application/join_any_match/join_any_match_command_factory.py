@@ -0,0 +1,12 @@
+from core.application.join_any_match.join_any_match_command import (
+    JoinAnyMatchCommand,
+)
+from core.dependency_injection_factories.infrastructure.repositories.db_match_repository_factory import (
+    DbMatchRepositoryFactory,
+)
+
+
+class JoinAnyMatchCommandFactory:
+    @staticmethod
+    def create() -> JoinAnyMatchCommand:
+        return JoinAnyMatchCommand(match_repository=DbMatchRepositoryFactory.create())
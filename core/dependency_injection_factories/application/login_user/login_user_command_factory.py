@@ -1,4 +1,10 @@
 from core.application.login_user.login_user_command import LoginUserCommand
+from core.dependency_injection_factories.infrastructure.hashers.password_hasher_factory import (
+    PasswordHasherFactory,
+)
+from core.dependency_injection_factories.infrastructure.repositories.db_token_family_repository_factory import (
+    DbTokenFamilyRepositoryFactory,
+)
 from core.dependency_injection_factories.infrastructure.repositories.db_user_repository_factory import (
     DbUserRepositoryFactory,
 )
@@ -9,4 +15,6 @@ class LoginUserCommandFactory:
     def create() -> LoginUserCommand:
         return LoginUserCommand(
             user_repository=DbUserRepositoryFactory.create(),
+            token_family_repository=DbTokenFamilyRepositoryFactory.create(),
+            password_hasher=PasswordHasherFactory.create(),
         )
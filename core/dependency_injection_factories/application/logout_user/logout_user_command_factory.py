@@ -0,0 +1,20 @@
+from core.application.logout_user.logout_user_command import LogoutUserCommand
+from core.dependency_injection_factories.infrastructure.repositories.db_token_family_repository_factory import (
+    DbTokenFamilyRepositoryFactory,
+)
+from core.dependency_injection_factories.infrastructure.verifiers.jwt_verifier_factory import (
+    JWTVerifierFactory,
+)
+from core.dependency_injection_factories.infrastructure.verifiers.token_revocation_list_factory import (
+    TokenRevocationListFactory,
+)
+
+
+class LogoutUserCommandFactory:
+    @staticmethod
+    def create() -> LogoutUserCommand:
+        return LogoutUserCommand(
+            jwt_verifier=JWTVerifierFactory.create(),
+            token_revocation_list=TokenRevocationListFactory.create(),
+            token_family_repository=DbTokenFamilyRepositoryFactory.create(),
+        )
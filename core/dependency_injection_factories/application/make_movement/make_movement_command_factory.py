@@ -2,11 +2,8 @@ from core.application.make_movement.make_movement_command import MakeMovementCom
 from core.dependency_injection_factories.infrastructure.checkers.victory_checker_factory import (
     VictoryCheckerFactory,
 )
-from core.dependency_injection_factories.infrastructure.repositories.db_match_repository_factory import (
-    DbMatchRepositoryFactory,
-)
-from core.dependency_injection_factories.infrastructure.repositories.db_movement_repository_factory import (
-    DbMovementRepositoryFactory,
+from core.dependency_injection_factories.infrastructure.repositories.db_match_unit_of_work_factory import (
+    DbMatchUnitOfWorkFactory,
 )
 
 
@@ -14,7 +11,6 @@ class MakeMovementCommandFactory:
     @staticmethod
     def create() -> MakeMovementCommand:
         return MakeMovementCommand(
-            movement_repository=DbMovementRepositoryFactory.create(),
+            match_unit_of_work=DbMatchUnitOfWorkFactory.create(),
             victory_checker=VictoryCheckerFactory.create(),
-            match_repository=DbMatchRepositoryFactory.create(),
         )
@@ -1,16 +1,24 @@
 from core.application.refresh_token.refresh_token_command import RefreshTokenCommand
-from core.dependency_injection_factories.infrastructure.repositories.db_user_repository_factory import (
-    DbUserRepositoryFactory,
+from core.dependency_injection_factories.infrastructure.repositories.cached_user_repository_factory import (
+    CachedUserRepositoryFactory,
+)
+from core.dependency_injection_factories.infrastructure.repositories.db_token_family_repository_factory import (
+    DbTokenFamilyRepositoryFactory,
 )
 from core.dependency_injection_factories.infrastructure.verifiers.jwt_verifier_factory import (
     JWTVerifierFactory,
 )
+from core.dependency_injection_factories.infrastructure.verifiers.token_revocation_list_factory import (
+    TokenRevocationListFactory,
+)
 
 
 class RefreshTokenCommandFactory:
     @staticmethod
     def create() -> RefreshTokenCommand:
         return RefreshTokenCommand(
-            user_repository=DbUserRepositoryFactory.create(),
+            user_repository=CachedUserRepositoryFactory.create(),
             jwt_verifier=JWTVerifierFactory.create(),
+            token_family_repository=DbTokenFamilyRepositoryFactory.create(),
+            token_revocation_list=TokenRevocationListFactory.create(),
         )
@@ -1,4 +1,13 @@
 from core.application.register_user.register_user_command import RegisterUserCommand
+from core.dependency_injection_factories.infrastructure.caches.username_filter_factory import (
+    UsernameFilterFactory,
+)
+from core.dependency_injection_factories.infrastructure.hashers.password_hasher_factory import (
+    PasswordHasherFactory,
+)
+from core.dependency_injection_factories.infrastructure.repositories.db_token_family_repository_factory import (
+    DbTokenFamilyRepositoryFactory,
+)
 from core.dependency_injection_factories.infrastructure.repositories.db_user_repository_factory import (
     DbUserRepositoryFactory,
 )
@@ -9,4 +18,7 @@ class RegisterUserCommandFactory:
     def create() -> RegisterUserCommand:
         return RegisterUserCommand(
             user_repository=DbUserRepositoryFactory.create(),
+            token_family_repository=DbTokenFamilyRepositoryFactory.create(),
+            password_hasher=PasswordHasherFactory.create(),
+            username_filter=UsernameFilterFactory.create(),
         )
@@ -0,0 +1,16 @@
+from core.dependency_injection_factories.infrastructure.checkers.board_outcome_table_factory import (
+    BoardOutcomeTableFactory,
+)
+from core.dependency_injection_factories.infrastructure.checkers.victory_checker_factory import (
+    VictoryCheckerFactory,
+)
+from core.infrastructure.auditors.match_auditor import MatchAuditor
+
+
+class MatchAuditorFactory:
+    @staticmethod
+    def create() -> MatchAuditor:
+        return MatchAuditor(
+            victory_checker=VictoryCheckerFactory.create(),
+            board_outcome_table=BoardOutcomeTableFactory.create(),
+        )
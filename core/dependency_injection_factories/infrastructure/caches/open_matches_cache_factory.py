@@ -0,0 +1,11 @@
+from django.conf import settings
+
+from core.infrastructure.caches.ttl_cache import TtlCache
+
+_OPEN_MATCHES_CACHE = TtlCache(ttl=settings.OPEN_MATCHES_CACHE_TTL, maximum_size=256)
+
+
+class OpenMatchesCacheFactory:
+    @staticmethod
+    def create() -> TtlCache:
+        return _OPEN_MATCHES_CACHE
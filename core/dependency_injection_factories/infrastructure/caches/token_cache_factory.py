@@ -0,0 +1,13 @@
+from django.conf import settings
+
+from core.infrastructure.caches.ttl_cache import TtlCache
+
+_TOKEN_CACHE = TtlCache(
+    ttl=settings.TOKEN_CACHE_TTL, maximum_size=settings.TOKEN_CACHE_SIZE
+)
+
+
+class TokenCacheFactory:
+    @staticmethod
+    def create() -> TtlCache:
+        return _TOKEN_CACHE
@@ -0,0 +1,13 @@
+from django.conf import settings
+
+from core.infrastructure.caches.ttl_cache import TtlCache
+
+_USER_CACHE = TtlCache(
+    ttl=settings.USER_CACHE_TTL, maximum_size=settings.USER_CACHE_SIZE
+)
+
+
+class UserCacheFactory:
+    @staticmethod
+    def create() -> TtlCache:
+        return _USER_CACHE
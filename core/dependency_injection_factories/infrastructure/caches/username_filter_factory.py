@@ -0,0 +1,16 @@
+from django.conf import settings
+
+from core.infrastructure.caches.username_filter import UsernameFilter
+
+_USERNAME_FILTER = UsernameFilter(
+    refresh_interval=settings.USERNAME_FILTER_REFRESH_INTERVAL,
+    capacity=settings.USERNAME_FILTER_CAPACITY,
+    false_positive_rate=settings.USERNAME_FILTER_FALSE_POSITIVE_RATE,
+    refresh_overlap=settings.USERNAME_FILTER_REFRESH_OVERLAP,
+)
+
+
+class UsernameFilterFactory:
+    @staticmethod
+    def create() -> UsernameFilter:
+        return _USERNAME_FILTER
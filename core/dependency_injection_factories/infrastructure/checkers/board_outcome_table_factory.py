@@ -0,0 +1,7 @@
+from core.infrastructure.checkers.board_outcome_table import BoardOutcomeTable
+
+
+class BoardOutcomeTableFactory:
+    @staticmethod
+    def create() -> BoardOutcomeTable:
+        return BoardOutcomeTable()
@@ -1,9 +1,9 @@
-from core.dependency_injection_factories.infrastructure.generators.board_generator_factory import (
-    BoardGeneratorFactory,
-)
 from core.dependency_injection_factories.infrastructure.repositories.db_match_repository_factory import (
     DbMatchRepositoryFactory,
 )
+from core.dependency_injection_factories.infrastructure.solvers.game_state_table_factory import (
+    GameStateTableFactory,
+)
 from core.infrastructure.checkers.victory_checker import VictoryChecker
 
 
@@ -12,5 +12,5 @@ class VictoryCheckerFactory:
     def create() -> VictoryChecker:
         return VictoryChecker(
             match_repository=DbMatchRepositoryFactory.create(),
-            board_generator=BoardGeneratorFactory.create(),
+            board_outcome_table=GameStateTableFactory.create(),
         )
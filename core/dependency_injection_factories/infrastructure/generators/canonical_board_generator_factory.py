@@ -0,0 +1,9 @@
+from core.infrastructure.generators.canonical_board_generator import (
+    CanonicalBoardGenerator,
+)
+
+
+class CanonicalBoardGeneratorFactory:
+    @staticmethod
+    def create() -> CanonicalBoardGenerator:
+        return CanonicalBoardGenerator()
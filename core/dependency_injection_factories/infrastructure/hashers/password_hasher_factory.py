@@ -0,0 +1,14 @@
+from django.conf import settings
+
+from core.infrastructure.hashers.password_hasher import PasswordHasher
+
+_PASSWORD_HASHER = PasswordHasher(
+    maximum_workers=settings.PASSWORD_HASHING_WORKERS,
+    maximum_pending=settings.PASSWORD_HASHING_PENDING,
+)
+
+
+class PasswordHasherFactory:
+    @staticmethod
+    def create() -> PasswordHasher:
+        return _PASSWORD_HASHER
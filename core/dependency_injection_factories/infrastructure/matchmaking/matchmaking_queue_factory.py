@@ -0,0 +1,18 @@
+from django.conf import settings
+
+from core.dependency_injection_factories.infrastructure.repositories.db_match_repository_factory import (
+    DbMatchRepositoryFactory,
+)
+from core.infrastructure.matchmaking.matchmaking_queue import MatchmakingQueue
+
+_MATCHMAKING_QUEUE = MatchmakingQueue(
+    match_repository=DbMatchRepositoryFactory.create(),
+    maximum_size=settings.MATCHMAKING_QUEUE_SIZE,
+    maximum_wait=settings.MATCHMAKING_MAXIMUM_WAIT,
+)
+
+
+class MatchmakingQueueFactory:
+    @staticmethod
+    def create() -> MatchmakingQueue:
+        return _MATCHMAKING_QUEUE
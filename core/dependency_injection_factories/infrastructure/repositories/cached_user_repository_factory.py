@@ -0,0 +1,18 @@
+from core.dependency_injection_factories.infrastructure.caches.user_cache_factory import (
+    UserCacheFactory,
+)
+from core.dependency_injection_factories.infrastructure.repositories.db_user_repository_factory import (
+    DbUserRepositoryFactory,
+)
+from core.infrastructure.repositories.cached_user_repository import (
+    CachedUserRepository,
+)
+
+
+class CachedUserRepositoryFactory:
+    @staticmethod
+    def create() -> CachedUserRepository:
+        return CachedUserRepository(
+            user_repository=DbUserRepositoryFactory.create(),
+            user_cache=UserCacheFactory.create(),
+        )
@@ -1,7 +1,16 @@
+from core.dependency_injection_factories.infrastructure.caches.open_matches_cache_factory import (
+    OpenMatchesCacheFactory,
+)
+from core.dependency_injection_factories.infrastructure.caches.user_cache_factory import (
+    UserCacheFactory,
+)
 from core.infrastructure.repositories.db_match_repository import DbMatchRepository
 
 
 class DbMatchRepositoryFactory:
     @staticmethod
     def create() -> DbMatchRepository:
-        return DbMatchRepository()
+        return DbMatchRepository(
+            open_matches_cache=OpenMatchesCacheFactory.create(),
+            user_cache=UserCacheFactory.create(),
+        )
@@ -0,0 +1,10 @@
+from core.dependency_injection_factories.infrastructure.caches.user_cache_factory import (
+    UserCacheFactory,
+)
+from core.infrastructure.repositories.db_match_unit_of_work import DbMatchUnitOfWork
+
+
+class DbMatchUnitOfWorkFactory:
+    @staticmethod
+    def create() -> DbMatchUnitOfWork:
+        return DbMatchUnitOfWork(user_cache=UserCacheFactory.create())
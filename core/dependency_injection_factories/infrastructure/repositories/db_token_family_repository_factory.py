@@ -0,0 +1,9 @@
+from core.infrastructure.repositories.db_token_family_repository import (
+    DbTokenFamilyRepository,
+)
+
+
+class DbTokenFamilyRepositoryFactory:
+    @staticmethod
+    def create() -> DbTokenFamilyRepository:
+        return DbTokenFamilyRepository()
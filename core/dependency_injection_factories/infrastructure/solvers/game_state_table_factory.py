@@ -0,0 +1,9 @@
+from django.conf import settings
+
+from core.infrastructure.solvers.game_state_table import GameStateTable
+
+
+class GameStateTableFactory:
+    @staticmethod
+    def create() -> GameStateTable:
+        return GameStateTable(path=settings.GAME_STATE_TABLE_PATH)
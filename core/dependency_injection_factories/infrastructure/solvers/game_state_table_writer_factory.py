@@ -0,0 +1,19 @@
+from core.dependency_injection_factories.infrastructure.checkers.board_outcome_table_factory import (
+    BoardOutcomeTableFactory,
+)
+from core.dependency_injection_factories.infrastructure.generators.canonical_board_generator_factory import (
+    CanonicalBoardGeneratorFactory,
+)
+from core.infrastructure.solvers.game_state_table_writer import GameStateTableWriter
+from core.infrastructure.solvers.negamax_solver import NegamaxSolver
+
+
+class GameStateTableWriterFactory:
+    @staticmethod
+    def create() -> GameStateTableWriter:
+        return GameStateTableWriter(
+            solver=NegamaxSolver(
+                canonical_board_generator=CanonicalBoardGeneratorFactory.create()
+            ),
+            board_outcome_table=BoardOutcomeTableFactory.create(),
+        )
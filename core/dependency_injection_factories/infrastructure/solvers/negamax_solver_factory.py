@@ -0,0 +1,16 @@
+from core.dependency_injection_factories.infrastructure.generators.canonical_board_generator_factory import (
+    CanonicalBoardGeneratorFactory,
+)
+from core.dependency_injection_factories.infrastructure.solvers.game_state_table_factory import (
+    GameStateTableFactory,
+)
+from core.infrastructure.solvers.negamax_solver import NegamaxSolver
+
+
+class NegamaxSolverFactory:
+    @staticmethod
+    def create() -> NegamaxSolver:
+        return NegamaxSolver(
+            canonical_board_generator=CanonicalBoardGeneratorFactory.create(),
+            game_state_table=GameStateTableFactory.create(),
+        )
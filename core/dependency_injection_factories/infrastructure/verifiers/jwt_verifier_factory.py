@@ -1,7 +1,16 @@
+from core.dependency_injection_factories.infrastructure.caches.token_cache_factory import (
+    TokenCacheFactory,
+)
+from core.dependency_injection_factories.infrastructure.verifiers.token_revocation_list_factory import (
+    TokenRevocationListFactory,
+)
 from core.infrastructure.verifiers.jwt_verifier import JWTVerifier
 
 
 class JWTVerifierFactory:
     @staticmethod
     def create() -> JWTVerifier:
-        return JWTVerifier()
+        return JWTVerifier(
+            token_cache=TokenCacheFactory.create(),
+            token_revocation_list=TokenRevocationListFactory.create(),
+        )
@@ -0,0 +1,16 @@
+from django.conf import settings
+
+from core.infrastructure.verifiers.token_revocation_list import TokenRevocationList
+
+_TOKEN_REVOCATION_LIST = TokenRevocationList(
+    refresh_interval=settings.TOKEN_REVOCATION_REFRESH_INTERVAL,
+    capacity=settings.TOKEN_REVOCATION_CAPACITY,
+    false_positive_rate=settings.TOKEN_REVOCATION_FALSE_POSITIVE_RATE,
+    refresh_overlap=settings.TOKEN_REVOCATION_REFRESH_OVERLAP,
+)
+
+
+class TokenRevocationListFactory:
+    @staticmethod
+    def create() -> TokenRevocationList:
+        return _TOKEN_REVOCATION_LIST
@@ -1,9 +1,12 @@
-from core.dependency_injection_factories.infrastructure.repositories.db_user_repository_factory import (
-    DbUserRepositoryFactory,
+from core.dependency_injection_factories.infrastructure.repositories.cached_user_repository_factory import (
+    CachedUserRepositoryFactory,
 )
 from core.dependency_injection_factories.infrastructure.verifiers.jwt_verifier_factory import (
     JWTVerifierFactory,
 )
+from core.dependency_injection_factories.infrastructure.verifiers.user_revocation_set_factory import (
+    UserRevocationSetFactory,
+)
 from core.infrastructure.verifiers.user_authentication_verifier import (
     UserAuthenticationVerifier,
 )
@@ -14,5 +17,6 @@ class UserAuthenticationVerifierFactory:
     def create() -> UserAuthenticationVerifier:
         return UserAuthenticationVerifier(
             jwt_verifier=JWTVerifierFactory.create(),
-            user_repository=DbUserRepositoryFactory.create(),
+            user_repository=CachedUserRepositoryFactory.create(),
+            user_revocation_set=UserRevocationSetFactory.create(),
         )
@@ -0,0 +1,13 @@
+from django.conf import settings
+
+from core.infrastructure.verifiers.user_revocation_set import UserRevocationSet
+
+_USER_REVOCATION_SET = UserRevocationSet(
+    refresh_interval=settings.USER_REVOCATION_REFRESH_INTERVAL
+)
+
+
+class UserRevocationSetFactory:
+    @staticmethod
+    def create() -> UserRevocationSet:
+        return _USER_REVOCATION_SET
@@ -0,0 +1,2 @@
+class BoardCodeTooLargeException(Exception):
+    pass
@@ -0,0 +1,2 @@
+class ConcurrentMovementException(Exception):
+    pass
@@ -1,2 +0,0 @@
-class LastMovementMadeException(Exception):
-    pass
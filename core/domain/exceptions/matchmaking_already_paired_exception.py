@@ -0,0 +1,2 @@
+class MatchmakingAlreadyPairedException(Exception):
+    pass
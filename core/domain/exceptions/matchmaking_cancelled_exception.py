@@ -0,0 +1,2 @@
+class MatchmakingCancelledException(Exception):
+    pass
@@ -0,0 +1,2 @@
+class MatchmakingQueueFullException(Exception):
+    pass
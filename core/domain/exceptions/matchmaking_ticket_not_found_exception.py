@@ -0,0 +1,2 @@
+class MatchmakingTicketNotFoundException(Exception):
+    pass
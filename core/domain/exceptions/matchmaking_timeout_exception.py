@@ -0,0 +1,2 @@
+class MatchmakingTimeoutException(Exception):
+    pass
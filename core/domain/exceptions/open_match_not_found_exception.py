@@ -0,0 +1,2 @@
+class OpenMatchNotFoundException(Exception):
+    pass
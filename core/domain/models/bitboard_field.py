@@ -0,0 +1,38 @@
+from base64 import b64decode, b64encode
+from typing import Any, Optional, Union
+
+from django.db import models
+
+
+class BitboardField(models.BinaryField):
+    description = "Bitboard of arbitrary size stored as little endian bytes"
+
+    def from_db_value(
+        self, value: Optional[Union[bytes, memoryview]], expression, connection
+    ) -> Optional[int]:
+        if value is None:
+            return None
+
+        return int.from_bytes(value, "little")
+
+    def to_python(self, value: Any) -> Optional[int]:
+        if value is None or isinstance(value, int):
+            return value
+
+        if isinstance(value, str):
+            value = b64decode(value.encode("ascii"))
+
+        return int.from_bytes(value, "little")
+
+    def get_prep_value(self, value: Any) -> Any:
+        value = super().get_prep_value(value)
+
+        if isinstance(value, int):
+            return value.to_bytes((value.bit_length() + 7) // 8, "little")
+
+        return value
+
+    def value_to_string(self, obj: models.Model) -> str:
+        return b64encode(self.get_prep_value(self.value_from_object(obj))).decode(
+            "ascii"
+        )
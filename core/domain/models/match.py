@@ -1,12 +1,27 @@
-from typing import Optional
+from typing import Optional, Union
 
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import TextChoices
 from rest_framework import serializers
 
+from core.domain.exceptions.illegal_movement_exception import IllegalMovementException
+from core.domain.exceptions.invalid_turn_exception import InvalidTurnException
+from core.domain.exceptions.match_not_accepting_movements_exception import (
+    MatchNotAcceptingMovementsException,
+)
+from core.domain.exceptions.maximum_number_of_movements_exceeded_exception import (
+    MaximumNumberOfMovementsExceededException,
+)
+from core.domain.exceptions.not_in_game_exception import NotInGameException
+from core.domain.exceptions.repeated_movement_exception import RepeatedMovementException
+from core.domain.models.bitboard_field import BitboardField
+from core.domain.models.principal import Principal
 from core.domain.models.user import User
 
+CLASSIC_BOARD_SIZE = 3
+MAXIMUM_BOARD_SIZE = 19
+
 
 class MatchStatuses(TextChoices):
     AWAITING = "awaiting"
@@ -63,6 +78,95 @@ class Match(models.Model):
 
     number_of_movements = models.PositiveIntegerField(default=0)
 
+    width = models.PositiveSmallIntegerField(
+        default=CLASSIC_BOARD_SIZE, help_text="Number of slots in the x axis"
+    )
+    height = models.PositiveSmallIntegerField(
+        default=CLASSIC_BOARD_SIZE, help_text="Number of slots in the y axis"
+    )
+    line_length = models.PositiveSmallIntegerField(
+        default=CLASSIC_BOARD_SIZE,
+        help_text="Number of slots in a row needed to win the match",
+    )
+
+    first_player_board = BitboardField(
+        default=0, help_text="Bitboard with the slots taken by the first player"
+    )
+    second_player_board = BitboardField(
+        default=0, help_text="Bitboard with the slots taken by the second player"
+    )
+
+    @property
+    def number_of_slots(self) -> int:
+        return self.width * self.height
+
+    @property
+    def is_classic(self) -> bool:
+        return (
+            self.width == CLASSIC_BOARD_SIZE
+            and self.height == CLASSIC_BOARD_SIZE
+            and self.line_length == CLASSIC_BOARD_SIZE
+        )
+
+    def get_slot(self, x: int, y: int) -> Optional[str]:
+        slot = 1 << (x * self.height + y)
+
+        if self.first_player_board & slot:
+            return MatchPlayer.FIRST_PLAYER.value
+        if self.second_player_board & slot:
+            return MatchPlayer.SECOND_PLAYER.value
+        return None
+
+    def is_slot_taken(self, x: int, y: int) -> bool:
+        slot = 1 << (x * self.height + y)
+
+        return bool((self.first_player_board | self.second_player_board) & slot)
+
+    def take_slot(self, player: str, x: int, y: int) -> None:
+        slot = 1 << (x * self.height + y)
+
+        if player == MatchPlayer.FIRST_PLAYER.value:
+            self.first_player_board = self.first_player_board | slot
+        elif player == MatchPlayer.SECOND_PLAYER.value:
+            self.second_player_board = self.second_player_board | slot
+
+    def play(self, player: Union[User, Principal], x: int, y: int) -> str:
+        if self.status != MatchStatuses.IN_PROGRESS.value:
+            raise MatchNotAcceptingMovementsException()
+
+        if self.first_player_id != player.id and self.second_player_id != player.id:
+            raise NotInGameException()
+
+        turn = self.turn
+        if turn == MatchPlayer.FIRST_PLAYER.value:
+            turn_player_id = self.first_player_id
+        else:
+            turn_player_id = self.second_player_id
+        if turn_player_id != player.id:
+            raise InvalidTurnException()
+
+        if self.number_of_movements >= self.number_of_slots:
+            raise MaximumNumberOfMovementsExceededException()
+
+        if x < 0 or x >= self.width or y < 0 or y >= self.height:
+            raise IllegalMovementException()
+
+        if self.is_slot_taken(x, y):
+            raise RepeatedMovementException()
+
+        self.number_of_movements = self.number_of_movements + 1
+        self.take_slot(turn, x, y)
+
+        return turn
+
+    @property
+    def is_board_full(self) -> bool:
+        return self.number_of_movements == self.number_of_slots
+
+    def finish(self, winner: Optional[str]) -> None:
+        self.status = MatchStatuses.FINISHED
+        self._winner = winner
+
     def set_which_player_wins(self, winner: Optional[str]) -> None:
         self._winner = winner
 
@@ -78,14 +182,24 @@ class Match(models.Model):
         return MatchPlayer.SECOND_PLAYER.value
 
     def save(self, *args, **kwargs) -> None:
-        if self.number_of_movements > 9:
+        if self.number_of_movements > self.number_of_slots:
             raise ValidationError(
-                f"The maximum number of movements is 9. You inserted {self.number_of_movements}",
+                f"The maximum number of movements is {self.number_of_slots}. "
+                f"You inserted {self.number_of_movements}",
                 code="limit_value",
             )
 
         super().save(*args, **kwargs)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["id"],
+                condition=models.Q(status=MatchStatuses.AWAITING),
+                name="match_awaiting_idx",
+            )
+        ]
+
 
 class MatchSerializer(serializers.ModelSerializer):
     class Meta:
@@ -94,4 +208,7 @@ class MatchSerializer(serializers.ModelSerializer):
             "id",
             "status",
             "number_of_movements",
+            "width",
+            "height",
+            "line_length",
         )
@@ -36,14 +36,14 @@ class Movement(models.Model):
         return self._player
 
     def save(self, *args, **kwargs) -> None:
-        if self.x > 2:
+        if self.x >= self.match.width:
             raise ValidationError(
-                f"The maximum x position is 2. You inserted {self.x}",
+                f"The maximum x position is {self.match.width - 1}. You inserted {self.x}",
                 code="limit_value",
             )
-        if self.y > 2:
+        if self.y >= self.match.height:
             raise ValidationError(
-                f"The maximum y position is 9. You inserted {self.y}",
+                f"The maximum y position is {self.match.height - 1}. You inserted {self.y}",
                 code="limit_value",
             )
 
@@ -52,9 +52,10 @@ class Movement(models.Model):
                 f"The minimum number of movement is 1. You inserted {self.number}",
                 code="limit_value",
             )
-        if self.number > 9:
+        if self.number > self.match.number_of_slots:
             raise ValidationError(
-                f"The maximum number of movement is 9. You inserted {self.number}",
+                f"The maximum number of movement is {self.match.number_of_slots}. "
+                f"You inserted {self.number}",
                 code="limit_value",
             )
 
@@ -0,0 +1,13 @@
+from django.db import models
+
+
+class RevokedToken(models.Model):
+    jti = models.CharField(
+        max_length=32, unique=True, help_text="Unique id claim of the revoked token"
+    )
+    expires_at = models.DateTimeField(
+        db_index=True, help_text="When the revoked token would have expired"
+    )
+    revoked_at = models.DateTimeField(
+        auto_now_add=True, help_text="When the token was revoked"
+    )
@@ -0,0 +1,10 @@
+from django.db import models
+
+
+class RevokedUser(models.Model):
+    user_id = models.PositiveBigIntegerField(
+        unique=True, help_text="Id of the user whose tokens are no longer accepted"
+    )
+    revoked_at = models.DateTimeField(
+        auto_now_add=True, help_text="When the tokens of the user were revoked"
+    )
@@ -0,0 +1,17 @@
+from django.db import models
+
+
+class TokenFamily(models.Model):
+    family_hash = models.BigIntegerField(
+        unique=True,
+        help_text="64-bit digest of the family claim shared by the refresh tokens "
+        "issued since a login",
+    )
+    user_id = models.PositiveBigIntegerField(help_text="Id of the logged in user")
+    token_hash = models.BigIntegerField(
+        help_text="64-bit digest of the jti of the only refresh token of the family "
+        "that is still accepted"
+    )
+    expires_at = models.DateTimeField(
+        db_index=True, help_text="When the last refresh token of the family expires"
+    )
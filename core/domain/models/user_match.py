@@ -0,0 +1,36 @@
+from django.db import models
+
+from core.domain.models.match import Match, MatchPlayer, MatchStatuses
+from core.domain.models.user import User
+
+
+class UserMatch(models.Model):
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="user_matches"
+    )
+    match = models.ForeignKey(
+        Match, on_delete=models.CASCADE, related_name="user_matches"
+    )
+    role = models.CharField(
+        null=False,
+        choices=MatchPlayer.choices,
+        max_length=100,
+        help_text="Whether the user is the first or the second player of the match",
+    )
+    status = models.CharField(
+        null=False,
+        default=MatchStatuses.AWAITING,
+        choices=MatchStatuses.choices,
+        max_length=100,
+        help_text="Copy of the status of the match",
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "match"], name="unique_user_match")
+        ]
+        indexes = [
+            models.Index(
+                fields=["user", "status", "match"], name="user_match_status_idx"
+            )
+        ]
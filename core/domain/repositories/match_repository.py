@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Union
 
 from core.domain.models.match import Match
+from core.domain.models.principal import Principal
 from core.domain.models.user import User
 
 
@@ -10,18 +11,42 @@ class MatchRepository(ABC):
     def find_by_user_id(self, user_id: int) -> list[Match]:
         pass
 
+    @abstractmethod
+    def find_page_by_user_id(
+        self, user_id: int, after_match_id: int, page_size: int
+    ) -> list[Match]:
+        pass
+
+    @abstractmethod
+    def find_open(self, before_match_id: Optional[int], page_size: int) -> list[Match]:
+        pass
+
     @abstractmethod
     def find_or_fail_by_id(self, match_id: int) -> Match:
         pass
 
     @abstractmethod
-    def save(self, creator: User) -> Match:
+    def save(
+        self,
+        creator: Union[User, Principal],
+        width: int = 3,
+        height: int = 3,
+        line_length: int = 3,
+    ) -> Match:
+        pass
+
+    @abstractmethod
+    def save_pair(
+        self,
+        first_player: Union[User, Principal],
+        second_player: Union[User, Principal],
+    ) -> Match:
         pass
 
     @abstractmethod
-    def save_guest(self, guest: User, match_id: int) -> None:
+    def save_guest(self, guest: Union[User, Principal], match_id: int) -> None:
         pass
 
     @abstractmethod
-    def end_match(self, match_id: int, winner: Optional[str]) -> None:
+    def save_any_guest(self, guest: Union[User, Principal]) -> Match:
         pass
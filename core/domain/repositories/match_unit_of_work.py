@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from core.domain.models.match import Match
+
+
+class MatchUnitOfWork(ABC):
+    @abstractmethod
+    def find_or_fail_by_id(self, match_id: int) -> Match:
+        pass
+
+    @abstractmethod
+    def commit(self, match: Match, x: int, y: int) -> None:
+        pass
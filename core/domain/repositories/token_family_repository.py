@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class TokenFamilyRepository(ABC):
+    @abstractmethod
+    def save(self, family: str, user_id: int, jti: str, expires_at: datetime) -> None:
+        pass
+
+    @abstractmethod
+    def rotate(self, family: str, jti: str, new_jti: str, expires_at: datetime) -> bool:
+        pass
+
+    @abstractmethod
+    def delete(self, family: str) -> None:
+        pass
+
+    @abstractmethod
+    def purge_expired(self, chunk_size: int) -> int:
+        pass
@@ -16,3 +16,15 @@ class UserRepository(ABC):
     @abstractmethod
     def save(self, username: str, password: str) -> User:
         pass
+
+    @abstractmethod
+    def save_hashed(self, username: str, password_hash: str) -> User:
+        pass
+
+    @abstractmethod
+    def update_password_hash(self, user: User, password_hash: str) -> None:
+        pass
+
+    @abstractmethod
+    def save_many_hashed(self, credentials: list[tuple[str, str]]) -> list[int]:
+        pass
@@ -0,0 +1,177 @@
+from itertools import islice
+from typing import Iterator, Optional
+
+from django.db import transaction
+
+from core.domain.models.match import (
+    CLASSIC_BOARD_SIZE,
+    Match,
+    MatchPlayer,
+    MatchStatuses,
+)
+from core.domain.models.movement import Movement
+from core.domain.models.user_match import UserMatch
+from core.infrastructure.auditors.match_mismatch import MatchMismatch
+from core.infrastructure.checkers.board_outcome_table import (
+    BoardOutcome,
+    BoardOutcomeTable,
+)
+from core.infrastructure.checkers.victory_checker import VictoryChecker
+
+_WINNERS = {
+    BoardOutcome.FIRST_PLAYER_WINS: MatchPlayer.FIRST_PLAYER.value,
+    BoardOutcome.SECOND_PLAYER_WINS: MatchPlayer.SECOND_PLAYER.value,
+}
+_CLASSIC_DIMENSIONS = (CLASSIC_BOARD_SIZE, CLASSIC_BOARD_SIZE, CLASSIC_BOARD_SIZE)
+
+
+class MatchAuditor:
+    __slots__ = ("__victory_checker", "__board_outcome_table")
+
+    def __init__(
+        self, victory_checker: VictoryChecker, board_outcome_table: BoardOutcomeTable
+    ):
+        self.__victory_checker = victory_checker
+        self.__board_outcome_table = board_outcome_table
+
+    def audit(
+        self,
+        first_match_id: Optional[int] = None,
+        last_match_id: Optional[int] = None,
+        chunk_size: int = 10_000,
+    ) -> tuple[int, list[MatchMismatch]]:
+        matches = Match.objects.order_by("id")
+        movements = Movement.objects.order_by("match_id")
+        if first_match_id is not None:
+            matches = matches.filter(id__gte=first_match_id)
+            movements = movements.filter(match_id__gte=first_match_id)
+        if last_match_id is not None:
+            matches = matches.filter(id__lte=last_match_id)
+            movements = movements.filter(match_id__lte=last_match_id)
+
+        match_rows = matches.values_list(
+            "id",
+            "status",
+            "_winner",
+            "second_player_id",
+            "number_of_movements",
+            "width",
+            "height",
+            "line_length",
+        ).iterator(chunk_size=chunk_size)
+        movement_rows = movements.values_list("match_id", "x", "y", "_player").iterator(
+            chunk_size=chunk_size
+        )
+        audited_matches = self.__build_boards(match_rows, movement_rows)
+
+        number_of_matches = 0
+        mismatches = []
+        while True:
+            chunk = list(islice(audited_matches, chunk_size))
+            if not chunk:
+                break
+
+            number_of_matches = number_of_matches + len(chunk)
+            mismatches.extend(self.__audit_chunk(chunk))
+
+        return number_of_matches, mismatches
+
+    def fix(self, mismatches: list[MatchMismatch], batch_size: int = 1_000) -> None:
+        matches = [
+            Match(
+                id=mismatch.match_id,
+                status=mismatch.expected_status,
+                _winner=mismatch.expected_winner,
+            )
+            for mismatch in mismatches
+        ]
+
+        match_ids_by_status: dict[str, list[int]] = {}
+        for mismatch in mismatches:
+            match_ids_by_status.setdefault(mismatch.expected_status, []).append(
+                mismatch.match_id
+            )
+
+        with transaction.atomic():
+            Match.objects.bulk_update(
+                matches, ["status", "_winner"], batch_size=batch_size
+            )
+            for status, match_ids in match_ids_by_status.items():
+                UserMatch.objects.filter(match_id__in=match_ids).update(status=status)
+
+    def __build_boards(
+        self, match_rows: Iterator[tuple], movement_rows: Iterator[tuple]
+    ) -> Iterator[tuple[tuple, int, int]]:
+        movement = next(movement_rows, None)
+        for row in match_rows:
+            match_id, height = row[0], row[6]
+            while movement is not None and movement[0] < match_id:
+                movement = next(movement_rows, None)
+
+            first_player_board = 0
+            second_player_board = 0
+            while movement is not None and movement[0] == match_id:
+                _, x, y, player = movement
+                if player == MatchPlayer.FIRST_PLAYER.value:
+                    first_player_board = first_player_board | 1 << (x * height + y)
+                else:
+                    second_player_board = second_player_board | 1 << (x * height + y)
+                movement = next(movement_rows, None)
+
+            yield row, first_player_board, second_player_board
+
+    def __audit_chunk(self, chunk: list[tuple[tuple, int, int]]) -> list[MatchMismatch]:
+        winners: list[Optional[str]] = []
+        classic_positions = []
+        classic_codes = []
+        for position, (row, first_player_board, second_player_board) in enumerate(
+            chunk
+        ):
+            dimensions = row[5:8]
+            if dimensions == _CLASSIC_DIMENSIONS:
+                classic_positions.append(position)
+                classic_codes.append(
+                    self.__board_outcome_table.encode(
+                        first_player_board, second_player_board
+                    )
+                )
+                winners.append(None)
+            else:
+                width, height, line_length = dimensions
+                match = Match(
+                    width=width,
+                    height=height,
+                    line_length=line_length,
+                    first_player_board=first_player_board,
+                    second_player_board=second_player_board,
+                )
+                winners.append(self.__victory_checker.check_match(match))
+
+        outcomes = self.__board_outcome_table.classify_codes(classic_codes)
+        for position, outcome in zip(classic_positions, outcomes):
+            winners[position] = _WINNERS.get(outcome)
+
+        mismatches = []
+        for (row, _, _), winner in zip(chunk, winners):
+            match_id, status, stored_winner, second_player_id = row[:4]
+            number_of_movements, width, height = row[4:7]
+
+            if winner is not None or number_of_movements == width * height:
+                expected_status = MatchStatuses.FINISHED.value
+            elif second_player_id is None:
+                expected_status = MatchStatuses.AWAITING.value
+            else:
+                expected_status = MatchStatuses.IN_PROGRESS.value
+
+            if status != expected_status or stored_winner != winner:
+                mismatches.append(
+                    MatchMismatch(
+                        match_id=match_id,
+                        stored_status=status,
+                        stored_winner=stored_winner,
+                        expected_status=expected_status,
+                        expected_winner=winner,
+                    )
+                )
+
+        return mismatches
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class MatchMismatch:
+    match_id: int
+    stored_status: str
+    stored_winner: Optional[str]
+    expected_status: str
+    expected_winner: Optional[str]
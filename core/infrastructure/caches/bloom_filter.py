@@ -0,0 +1,53 @@
+import math
+from typing import Hashable
+
+
+class BloomFilter:
+    __slots__ = ("__size", "__number_of_hashes", "__bits", "__length")
+
+    def __init__(self, capacity: int, false_positive_rate: float):
+        capacity = max(1, capacity)
+        self.__size = max(
+            8,
+            math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2),
+        )
+        self.__number_of_hashes = max(1, round(self.__size / capacity * math.log(2)))
+        self.__bits = bytearray((self.__size + 7) // 8)
+        self.__length = 0
+
+    def add(self, key: Hashable) -> None:
+        key_hash = hash(key)
+        index, step = key_hash % self.__size, key_hash >> 32 | 1
+
+        bits = self.__bits
+        for _ in range(self.__number_of_hashes):
+            bits[index >> 3] |= 1 << (index & 7)
+            index = (index + step) % self.__size
+
+        self.__length += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        if self.__length == 0:
+            return False
+
+        # Double hashing: the k probes are h, h + step, h + 2 * step... taken
+        # from the built-in hash, which str caches per object. Most misses stop
+        # at the first probe, so it is checked before entering the loop.
+        key_hash = hash(key)
+        size = self.__size
+        index = key_hash % size
+
+        bits = self.__bits
+        if not bits[index >> 3] >> (index & 7) & 1:
+            return False
+
+        step = key_hash >> 32 | 1
+        for _ in range(self.__number_of_hashes - 1):
+            index = (index + step) % size
+            if not bits[index >> 3] >> (index & 7) & 1:
+                return False
+
+        return True
+
+    def __len__(self) -> int:
+        return self.__length
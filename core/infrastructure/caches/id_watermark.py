@@ -0,0 +1,31 @@
+from typing import Any
+
+
+class IdWatermark:
+    __slots__ = ("__overlap", "__last_id", "__recent_ids")
+
+    def __init__(self, overlap: int):
+        self.__overlap = overlap
+        self.__last_id = 0
+        self.__recent_ids: set[int] = set()
+
+    def since(self) -> int:
+        # Ids are taken when rows are inserted but become visible when their
+        # transaction commits, so a row can show up after greater ids were
+        # already read. Reading again the last ids catches those late rows.
+        return max(0, self.__last_id - self.__overlap)
+
+    def unseen(self, rows: list[tuple[int, Any]]) -> list[Any]:
+        values = [value for row_id, value in rows if row_id not in self.__recent_ids]
+
+        self.__recent_ids.update(row_id for row_id, _ in rows)
+        if self.__recent_ids:
+            self.__last_id = max(self.__last_id, max(self.__recent_ids))
+        since = self.since()
+        self.__recent_ids = {row_id for row_id in self.__recent_ids if row_id > since}
+
+        return values
+
+    def reset(self) -> None:
+        self.__last_id = 0
+        self.__recent_ids = set()
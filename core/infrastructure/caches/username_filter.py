@@ -0,0 +1,89 @@
+import time
+from threading import Lock
+from typing import Optional
+
+from core.domain.models.user import User
+from core.infrastructure.caches.bloom_filter import BloomFilter
+from core.infrastructure.caches.id_watermark import IdWatermark
+
+
+class UsernameFilter:
+    __slots__ = (
+        "__refresh_interval",
+        "__capacity",
+        "__false_positive_rate",
+        "__user_manager",
+        "__bloom_filter",
+        "__watermark",
+        "__refreshed_at",
+        "__lock",
+    )
+
+    def __init__(
+        self,
+        refresh_interval: float,
+        capacity: int,
+        false_positive_rate: float,
+        refresh_overlap: int,
+    ):
+        self.__refresh_interval = refresh_interval
+        self.__capacity = capacity
+        self.__false_positive_rate = false_positive_rate
+        self.__user_manager = User.objects
+        self.__bloom_filter = BloomFilter(capacity, false_positive_rate)
+        self.__watermark = IdWatermark(refresh_overlap)
+        self.__refreshed_at: Optional[float] = None
+        self.__lock = Lock()
+
+    def might_exist(self, username: str) -> bool:
+        if (
+            self.__refreshed_at is None
+            or time.monotonic() - self.__refreshed_at >= self.__refresh_interval
+        ):
+            self.refresh()
+
+        return username in self.__bloom_filter
+
+    def add(self, username: str) -> None:
+        with self.__lock:
+            self.__bloom_filter.add(username)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__bloom_filter = BloomFilter(
+                self.__capacity, self.__false_positive_rate
+            )
+            self.__watermark.reset()
+            self.__refreshed_at = None
+
+    def refresh(self) -> None:
+        # Users registered by other processes since the last refresh are the
+        # ones past the watermark, which also reads again the last ids in case
+        # they committed out of order. Deleted users stay in the filter and are
+        # answered by the unique index instead.
+        with self.__lock:
+            new_users = list(
+                self.__user_manager.filter(id__gt=self.__watermark.since()).values_list(
+                    "id", "username"
+                )
+            )
+            usernames = self.__watermark.unseen(new_users)
+
+            if len(self.__bloom_filter) + len(usernames) > self.__capacity:
+                self.__rebuild()
+            else:
+                for username in usernames:
+                    self.__bloom_filter.add(username)
+
+            self.__refreshed_at = time.monotonic()
+
+    def __rebuild(self) -> None:
+        users = list(self.__user_manager.values_list("id", "username"))
+
+        self.__capacity = max(self.__capacity, 2 * len(users))
+        bloom_filter = BloomFilter(self.__capacity, self.__false_positive_rate)
+        self.__watermark.reset()
+        for username in self.__watermark.unseen(users):
+            bloom_filter.add(username)
+
+        self.__bloom_filter = bloom_filter
@@ -0,0 +1,93 @@
+from array import array
+from enum import IntEnum
+from typing import Iterable, Optional, Union
+
+
+class BoardOutcome(IntEnum):
+    ONGOING = 0
+    FIRST_PLAYER_WINS = 1
+    SECOND_PLAYER_WINS = 2
+    DRAW = 3
+
+
+WIN_PATTERNS = [
+    [(0, 0), (0, 1), (0, 2)],
+    [(0, 0), (1, 1), (2, 2)],
+    [(0, 0), (1, 0), (2, 0)],
+    [(0, 1), (1, 1), (2, 1)],
+    [(0, 2), (1, 2), (2, 2)],
+    [(0, 2), (1, 1), (2, 0)],
+    [(1, 0), (1, 1), (1, 2)],
+    [(2, 0), (2, 1), (2, 2)],
+]
+WIN_MASKS = [sum(1 << (x * 3 + y) for x, y in pattern) for pattern in WIN_PATTERNS]
+FULL_BOARD = 0b111111111
+NUMBER_OF_BOARDS = 3**9
+
+
+def _build_base_3_slots() -> array:
+    base_3_slots = array("H", bytes(2 * (FULL_BOARD + 1)))
+
+    for board in range(FULL_BOARD + 1):
+        base_3_slots[board] = sum(3**slot for slot in range(9) if board >> slot & 1)
+
+    return base_3_slots
+
+
+def _build_outcomes() -> bytes:
+    outcomes = bytearray(NUMBER_OF_BOARDS)
+
+    for first_player_board in range(FULL_BOARD + 1):
+        first_player_wins = any(first_player_board & mask == mask for mask in WIN_MASKS)
+        free_slots = FULL_BOARD & ~first_player_board
+
+        second_player_board = free_slots
+        while True:
+            code = _BASE_3_SLOTS[first_player_board] + 2 * (
+                _BASE_3_SLOTS[second_player_board]
+            )
+
+            if first_player_wins:
+                outcomes[code] = BoardOutcome.FIRST_PLAYER_WINS
+            elif any(second_player_board & mask == mask for mask in WIN_MASKS):
+                outcomes[code] = BoardOutcome.SECOND_PLAYER_WINS
+            elif first_player_board | second_player_board == FULL_BOARD:
+                outcomes[code] = BoardOutcome.DRAW
+
+            if second_player_board == 0:
+                break
+            second_player_board = (second_player_board - 1) & free_slots
+
+    return bytes(outcomes)
+
+
+_BASE_3_SLOTS = _build_base_3_slots()
+_OUTCOMES: Optional[bytes] = None
+
+
+class BoardOutcomeTable:
+    __slots__ = "_outcomes"
+
+    def __init__(self):
+        global _OUTCOMES
+
+        if _OUTCOMES is None:
+            _OUTCOMES = _build_outcomes()
+
+        self._outcomes: Union[bytes, memoryview] = _OUTCOMES
+
+    def encode(self, first_player_board: int, second_player_board: int) -> int:
+        return _BASE_3_SLOTS[first_player_board] + 2 * (
+            _BASE_3_SLOTS[second_player_board]
+        )
+
+    def classify(self, first_player_board: int, second_player_board: int) -> int:
+        return self._outcomes[
+            _BASE_3_SLOTS[first_player_board] + 2 * _BASE_3_SLOTS[second_player_board]
+        ]
+
+    def classify_code(self, code: int) -> int:
+        return self._outcomes[code]
+
+    def classify_codes(self, codes: Iterable[int]) -> bytes:
+        return bytes(map(self._outcomes.__getitem__, codes))
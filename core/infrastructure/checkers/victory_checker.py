@@ -1,48 +1,122 @@
+from functools import lru_cache
 from typing import Optional
 
-from core.domain.models.match import MatchPlayer
+from core.domain.models.match import Match, MatchPlayer
 from core.domain.repositories.match_repository import MatchRepository
-from core.infrastructure.generators.board_generator import BoardGenerator
+from core.infrastructure.checkers.board_outcome_table import (
+    WIN_MASKS,
+    BoardOutcome,
+    BoardOutcomeTable,
+)
+
+DIRECTIONS = [(0, 1), (1, 0), (1, 1), (1, -1)]
+
+
+@lru_cache(maxsize=None)
+def _line_start_masks(
+    width: int, height: int, line_length: int
+) -> tuple[tuple[int, int], ...]:
+    start_masks = []
+    for dx, dy in DIRECTIONS:
+        start_mask = 0
+        for x in range(width):
+            for y in range(height):
+                end_x = x + (line_length - 1) * dx
+                end_y = y + (line_length - 1) * dy
+                if end_x < width and 0 <= end_y < height:
+                    start_mask = start_mask | 1 << (x * height + y)
+
+        start_masks.append((dx * height + dy, start_mask))
+
+    return tuple(start_masks)
 
 
 class VictoryChecker:
-    WIN_PATTERNS = [
-        [(0, 0), (0, 1), (0, 2)],
-        [(0, 0), (1, 1), (2, 2)],
-        [(0, 0), (1, 0), (2, 0)],
-        [(0, 1), (1, 1), (2, 1)],
-        [(0, 2), (1, 2), (2, 2)],
-        [(0, 2), (1, 1), (2, 0)],
-        [(1, 0), (1, 1), (1, 2)],
-        [(2, 0), (2, 1), (2, 2)],
+    LINES_THROUGH_SLOT = [
+        [mask for mask in WIN_MASKS if mask >> slot & 1] for slot in range(9)
     ]
-    __slots__ = ("__match_repository", "__board_generator")
+    __slots__ = ("__match_repository", "__board_outcome_table")
 
     def __init__(
-        self, match_repository: MatchRepository, board_generator: BoardGenerator
+        self,
+        match_repository: MatchRepository,
+        board_outcome_table: BoardOutcomeTable,
     ):
         self.__match_repository = match_repository
-        self.__board_generator = board_generator
+        self.__board_outcome_table = board_outcome_table
 
     def check(self, match_id: int) -> Optional[str]:
         match = self.__match_repository.find_or_fail_by_id(match_id)
 
-        board = self.__board_generator.generate(match)
-
-        for position_1, position_2, position_3 in self.WIN_PATTERNS:
-            x_1, y_1 = position_1
-            x_2, y_2 = position_2
-            x_3, y_3 = position_3
-
-            slots = [board[x_1][y_1], board[x_2][y_2], board[x_3][y_3]]
-
-            if (
-                all(map(lambda slot: slot == MatchPlayer.FIRST_PLAYER.value, slots))
-                is True
-            ):
-                return MatchPlayer.FIRST_PLAYER.value
-            elif (
-                all(map(lambda slot: slot == MatchPlayer.SECOND_PLAYER.value, slots))
-                is True
-            ):
-                return MatchPlayer.SECOND_PLAYER.value
+        return self.check_match(match)
+
+    def check_match(self, match: Match) -> Optional[str]:
+        if match.is_classic is False:
+            return self.__check_board(match)
+
+        outcome = self.__board_outcome_table.classify(
+            match.first_player_board, match.second_player_board
+        )
+
+        if outcome == BoardOutcome.FIRST_PLAYER_WINS:
+            return MatchPlayer.FIRST_PLAYER.value
+        elif outcome == BoardOutcome.SECOND_PLAYER_WINS:
+            return MatchPlayer.SECOND_PLAYER.value
+
+    def check_movement(
+        self, match: Match, x: int, y: int, player: str
+    ) -> Optional[str]:
+        if player == MatchPlayer.FIRST_PLAYER.value:
+            board = match.first_player_board
+        else:
+            board = match.second_player_board
+
+        if match.is_classic is False:
+            return self.__check_lines_through_slot(match, board, x, y, player)
+
+        for line in self.LINES_THROUGH_SLOT[x * 3 + y]:
+            if board & line == line:
+                return player
+
+    def __check_board(self, match: Match) -> Optional[str]:
+        start_masks = _line_start_masks(match.width, match.height, match.line_length)
+
+        if self.__has_line(match.first_player_board, start_masks, match.line_length):
+            return MatchPlayer.FIRST_PLAYER.value
+        elif self.__has_line(match.second_player_board, start_masks, match.line_length):
+            return MatchPlayer.SECOND_PLAYER.value
+
+    def __has_line(
+        self, board: int, start_masks: tuple[tuple[int, int], ...], line_length: int
+    ) -> bool:
+        for shift, start_mask in start_masks:
+            line_starts = board & start_mask
+            for step in range(1, line_length):
+                if line_starts == 0:
+                    break
+                line_starts = line_starts & board >> (step * shift)
+
+            if line_starts != 0:
+                return True
+
+        return False
+
+    def __check_lines_through_slot(
+        self, match: Match, board: int, x: int, y: int, player: str
+    ) -> Optional[str]:
+        width, height = match.width, match.height
+
+        for dx, dy in DIRECTIONS:
+            slots_in_line = 1
+            for sign in (1, -1):
+                line_x, line_y = x + sign * dx, y + sign * dy
+                while (
+                    0 <= line_x < width
+                    and 0 <= line_y < height
+                    and board >> (line_x * height + line_y) & 1
+                ):
+                    slots_in_line = slots_in_line + 1
+                    line_x, line_y = line_x + sign * dx, line_y + sign * dy
+
+            if slots_in_line >= match.line_length:
+                return player
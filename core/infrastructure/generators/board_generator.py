@@ -1,33 +1,71 @@
 from typing import Optional
 
+from django.db.models import TextChoices
+
+from core.domain.exceptions.board_code_too_large_exception import (
+    BoardCodeTooLargeException,
+)
 from core.domain.models.match import Match, MatchPlayer
 
+_GAME_MODE_SLOTS = str.maketrans("012", "-XO")
+
+# JSON clients such as JavaScript read numbers as doubles, which only hold
+# integers exactly up to 2 ** 53. 3 ** 33 - 1 is the largest code below it.
+MAXIMUM_CODE_SLOTS = 33
+
+
+class BoardFormats(TextChoices):
+    NESTED = "nested"
+    STRING = "string"
+    CODE = "code"
+
 
 class BoardGenerator:
     def generate(
         self, match: Match, game_mode: bool = False
     ) -> list[list[Optional[str]]]:
-        board: list[list[Optional[str]]] = [
-            [None, None, None],
-            [None, None, None],
-            [None, None, None],
+        if game_mode is False:
+            first_player_slot = MatchPlayer.FIRST_PLAYER.value
+            second_player_slot = MatchPlayer.SECOND_PLAYER.value
+        else:
+            first_player_slot = "X"
+            second_player_slot = "O"
+
+        number_of_slots = match.number_of_slots
+        first_player_bits = bin(match.first_player_board)[:1:-1].ljust(
+            number_of_slots, "0"
+        )
+        second_player_bits = bin(match.second_player_board)[:1:-1].ljust(
+            number_of_slots, "0"
+        )
+
+        slots: list[Optional[str]] = [
+            (
+                first_player_slot
+                if first_player_bit == "1"
+                else second_player_slot if second_player_bit == "1" else None
+            )
+            for first_player_bit, second_player_bit in zip(
+                first_player_bits, second_player_bits
+            )
         ]
 
-        for movement in match.movements.all():
-            x: int = movement.x
-            y: int = movement.y
+        height = match.height
+        return [slots[x * height : (x + 1) * height] for x in range(match.width)]
 
-            board[x][y] = movement.get_which_player()
+    def generate_string(self, match: Match) -> str:
+        return self.__base_3_digits(match)[::-1].translate(_GAME_MODE_SLOTS)
 
-        if game_mode is False:
-            return board
+    def generate_code(self, match: Match) -> int:
+        if match.number_of_slots > MAXIMUM_CODE_SLOTS:
+            raise BoardCodeTooLargeException()
 
-        return [
-            [self.__substitute_to_game_mode(slot) for slot in line] for line in board
-        ]
+        return int(self.__base_3_digits(match), 3)
+
+    def __base_3_digits(self, match: Match) -> str:
+        first_player_bits = int(bin(match.first_player_board)[2:])
+        second_player_bits = int(bin(match.second_player_board)[2:])
 
-    def __substitute_to_game_mode(self, slot: Optional[str]) -> Optional[str]:
-        if slot == MatchPlayer.FIRST_PLAYER.value:
-            return "X"
-        elif slot == MatchPlayer.SECOND_PLAYER.value:
-            return "O"
+        return str(first_player_bits + 2 * second_player_bits).zfill(
+            match.number_of_slots
+        )
@@ -0,0 +1,72 @@
+from array import array
+from typing import Callable
+
+from core.infrastructure.checkers.board_outcome_table import FULL_BOARD
+
+SYMMETRIES: list[Callable[[int, int], tuple[int, int]]] = [
+    lambda x, y: (x, y),
+    lambda x, y: (y, 2 - x),
+    lambda x, y: (2 - x, 2 - y),
+    lambda x, y: (2 - y, x),
+    lambda x, y: (x, 2 - y),
+    lambda x, y: (2 - x, y),
+    lambda x, y: (y, x),
+    lambda x, y: (2 - y, 2 - x),
+]
+
+
+def _build_slot_permutations() -> list[list[int]]:
+    permutations = []
+    for symmetry in SYMMETRIES:
+        permutation = [0] * 9
+        for slot in range(9):
+            x, y = symmetry(slot // 3, slot % 3)
+            permutation[slot] = x * 3 + y
+        permutations.append(permutation)
+
+    return permutations
+
+
+def _build_transformed_base_3_boards() -> list[array]:
+    transformed_boards = []
+    for permutation in SLOT_PERMUTATIONS:
+        boards = array("H", bytes(2 * (FULL_BOARD + 1)))
+        for board in range(FULL_BOARD + 1):
+            boards[board] = sum(
+                3 ** permutation[slot] for slot in range(9) if board >> slot & 1
+            )
+        transformed_boards.append(boards)
+
+    return transformed_boards
+
+
+SLOT_PERMUTATIONS = _build_slot_permutations()
+INVERSE_SLOT_PERMUTATIONS = [
+    [permutation.index(slot) for slot in range(9)] for permutation in SLOT_PERMUTATIONS
+]
+_TRANSFORMED_BASE_3_BOARDS = _build_transformed_base_3_boards()
+
+
+class CanonicalBoardGenerator:
+    def generate(
+        self, first_player_board: int, second_player_board: int
+    ) -> tuple[int, int]:
+        canonical_key = None
+        canonical_symmetry = 0
+        for symmetry, boards in enumerate(_TRANSFORMED_BASE_3_BOARDS):
+            key = boards[first_player_board] + 2 * boards[second_player_board]
+            if canonical_key is None or key < canonical_key:
+                canonical_key = key
+                canonical_symmetry = symmetry
+
+        return canonical_key, canonical_symmetry
+
+    def to_canonical_slot(self, x: int, y: int, symmetry: int) -> tuple[int, int]:
+        slot = SLOT_PERMUTATIONS[symmetry][x * 3 + y]
+
+        return slot // 3, slot % 3
+
+    def to_original_slot(self, x: int, y: int, symmetry: int) -> tuple[int, int]:
+        slot = INVERSE_SLOT_PERMUTATIONS[symmetry][x * 3 + y]
+
+        return slot // 3, slot % 3
@@ -1,18 +1,35 @@
 from datetime import datetime, timedelta
+from typing import Optional
+from uuid import uuid4
 
 from django.conf import settings
 
 from core.domain.models.user import User
 import jwt
 
+TOKEN_LIFETIME = timedelta(days=1)
+
 
 class JWTGenerator:
-    def generate(self, user: User, refresh_token: bool = False) -> str:
+    def generate(
+        self,
+        user: User,
+        refresh_token: bool = False,
+        family: Optional[str] = None,
+        jti: Optional[str] = None,
+    ) -> str:
         payload = {
             "user_id": user.id,
-            "exp": datetime.utcnow() + timedelta(days=1),
+            "exp": datetime.utcnow() + TOKEN_LIFETIME,
             "iat": datetime.utcnow(),
             "refresh_token": refresh_token,
+            "jti": jti or uuid4().hex,
         }
 
+        if refresh_token is False:
+            payload["username"] = user.username
+
+        if family is not None:
+            payload["family"] = family
+
         return jwt.encode(payload, settings.SECRET_KEY, algorithm="HS256")
@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore
+from typing import Any, Callable, Optional
+
+from django.contrib.auth.hashers import check_password, make_password
+
+
+def _verify(password: str, password_hash: str) -> tuple[bool, Optional[str]]:
+    new_password_hashes = []
+
+    # Django calls the setter when the password is correct but was hashed with
+    # a hasher or parameters that are no longer the preferred ones.
+    is_correct = check_password(
+        password,
+        password_hash,
+        setter=lambda raw_password: new_password_hashes.append(
+            make_password(raw_password)
+        ),
+    )
+
+    return is_correct, next(iter(new_password_hashes), None)
+
+
+class PasswordHasher:
+    __slots__ = ("__executor", "__slots")
+
+    def __init__(self, maximum_workers: int, maximum_pending: int):
+        self.__executor = ThreadPoolExecutor(
+            max_workers=maximum_workers, thread_name_prefix="password_hasher"
+        )
+        # Callers wait for a free slot before submitting instead of piling up
+        # an unbounded queue of hashes that would finish after their requests
+        # have timed out.
+        self.__slots = BoundedSemaphore(maximum_workers + maximum_pending)
+
+    def hash(self, password: str) -> str:
+        return self.__run(make_password, password)
+
+    def verify(self, password: str, password_hash: str) -> tuple[bool, Optional[str]]:
+        return self.__run(_verify, password, password_hash)
+
+    def shutdown(self) -> None:
+        self.__executor.shutdown()
+
+    def __run(self, function: Callable[..., Any], *args: Any) -> Any:
+        self.__slots.acquire()
+        try:
+            future = self.__executor.submit(function, *args)
+        except BaseException:
+            self.__slots.release()
+            raise
+        future.add_done_callback(lambda _: self.__slots.release())
+
+        return future.result()
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class MatchmakingMetrics:
+    queue_depth: int
+    paired: int
+    cancelled: int
+    expired: int
+    wait_time_p50: Optional[float]
+    wait_time_p90: Optional[float]
+    wait_time_p99: Optional[float]
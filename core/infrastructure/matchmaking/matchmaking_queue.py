@@ -0,0 +1,220 @@
+import math
+import time
+from collections import OrderedDict, deque
+from threading import Condition, Lock
+from typing import Optional, Union
+
+from core.domain.exceptions.matchmaking_already_paired_exception import (
+    MatchmakingAlreadyPairedException,
+)
+from core.domain.exceptions.matchmaking_cancelled_exception import (
+    MatchmakingCancelledException,
+)
+from core.domain.exceptions.matchmaking_queue_full_exception import (
+    MatchmakingQueueFullException,
+)
+from core.domain.exceptions.matchmaking_ticket_not_found_exception import (
+    MatchmakingTicketNotFoundException,
+)
+from core.domain.exceptions.matchmaking_timeout_exception import (
+    MatchmakingTimeoutException,
+)
+from core.domain.models.principal import Principal
+from core.domain.models.user import User
+from core.domain.repositories.match_repository import MatchRepository
+from core.infrastructure.matchmaking.matchmaking_metrics import MatchmakingMetrics
+from core.infrastructure.matchmaking.matchmaking_ticket import (
+    MatchmakingTicket,
+    MatchmakingTicketStatuses,
+)
+
+
+class MatchmakingQueue:
+    __slots__ = (
+        "__match_repository",
+        "__maximum_size",
+        "__maximum_wait",
+        "__queued_tickets",
+        "__pairing_tickets",
+        "__paired_tickets",
+        "__wait_times",
+        "__counters",
+        "__lock",
+        "__pairing_finished",
+    )
+
+    def __init__(
+        self,
+        match_repository: MatchRepository,
+        maximum_size: int,
+        maximum_wait: float,
+        wait_time_samples: int = 1000,
+    ):
+        self.__match_repository = match_repository
+        self.__maximum_size = maximum_size
+        self.__maximum_wait = maximum_wait
+        self.__queued_tickets: OrderedDict[int, MatchmakingTicket] = OrderedDict()
+        self.__pairing_tickets: dict[int, MatchmakingTicket] = {}
+        self.__paired_tickets: dict[int, MatchmakingTicket] = {}
+        self.__wait_times: deque[float] = deque(maxlen=wait_time_samples)
+        self.__counters = {status: 0 for status in MatchmakingTicketStatuses}
+        self.__lock = Lock()
+        self.__pairing_finished = Condition(self.__lock)
+
+    def enqueue(self, user: Union[User, Principal]) -> MatchmakingTicket:
+        with self.__lock:
+            self.__expire(time.monotonic())
+
+            ticket = (
+                self.__paired_tickets.get(user.id)
+                or self.__pairing_tickets.get(user.id)
+                or self.__queued_tickets.get(user.id)
+            )
+            if ticket is not None:
+                return ticket
+
+            if len(self.__queued_tickets) >= self.__maximum_size:
+                raise MatchmakingQueueFullException()
+
+            ticket = MatchmakingTicket(user, time.monotonic())
+            self.__queued_tickets[user.id] = ticket
+            pairs = self.__pop_pairs()
+
+        for first_ticket, second_ticket in pairs:
+            self.__create_match(first_ticket, second_ticket)
+
+        return ticket
+
+    def wait(self, ticket: MatchmakingTicket, timeout: float) -> Optional[int]:
+        remaining_wait = ticket.enqueued_at + self.__maximum_wait - time.monotonic()
+        if ticket.wait(max(0.0, min(timeout, remaining_wait))) is False:
+            if timeout < remaining_wait:
+                return None
+
+            with self.__lock:
+                self.__expire(time.monotonic())
+
+        if ticket.status == MatchmakingTicketStatuses.CANCELLED:
+            raise MatchmakingCancelledException()
+
+        if ticket.status == MatchmakingTicketStatuses.EXPIRED:
+            raise MatchmakingTimeoutException()
+
+        if ticket.status == MatchmakingTicketStatuses.QUEUED:
+            return None
+
+        with self.__lock:
+            if self.__paired_tickets.get(ticket.user.id) is ticket:
+                del self.__paired_tickets[ticket.user.id]
+
+        return ticket.match_id
+
+    def cancel(self, user: Union[User, Principal]) -> None:
+        with self.__pairing_finished:
+            # A ticket being paired goes back to the queue if the match cannot
+            # be created, so the cancellation waits to know which one it is.
+            while user.id in self.__pairing_tickets:
+                self.__pairing_finished.wait()
+
+            ticket = self.__queued_tickets.pop(user.id, None)
+            if ticket is None:
+                if user.id in self.__paired_tickets:
+                    raise MatchmakingAlreadyPairedException()
+
+                raise MatchmakingTicketNotFoundException()
+
+            self.__resolve(ticket, MatchmakingTicketStatuses.CANCELLED)
+
+    def clear(self) -> None:
+        with self.__lock:
+            for ticket in self.__queued_tickets.values():
+                ticket.resolve(MatchmakingTicketStatuses.CANCELLED)
+
+            self.__queued_tickets.clear()
+            self.__pairing_tickets.clear()
+            self.__paired_tickets.clear()
+            self.__wait_times.clear()
+            self.__counters = {status: 0 for status in MatchmakingTicketStatuses}
+
+    def metrics(self) -> MatchmakingMetrics:
+        with self.__lock:
+            self.__expire(time.monotonic())
+            wait_times = sorted(self.__wait_times)
+
+            return MatchmakingMetrics(
+                queue_depth=len(self.__queued_tickets),
+                paired=self.__counters[MatchmakingTicketStatuses.PAIRED],
+                cancelled=self.__counters[MatchmakingTicketStatuses.CANCELLED],
+                expired=self.__counters[MatchmakingTicketStatuses.EXPIRED],
+                wait_time_p50=self.__percentile(wait_times, 50),
+                wait_time_p90=self.__percentile(wait_times, 90),
+                wait_time_p99=self.__percentile(wait_times, 99),
+            )
+
+    def __pop_pairs(self) -> list[tuple[MatchmakingTicket, MatchmakingTicket]]:
+        pairs = []
+        while len(self.__queued_tickets) >= 2:
+            _, first_ticket = self.__queued_tickets.popitem(last=False)
+            _, second_ticket = self.__queued_tickets.popitem(last=False)
+            self.__pairing_tickets[first_ticket.user.id] = first_ticket
+            self.__pairing_tickets[second_ticket.user.id] = second_ticket
+            pairs.append((first_ticket, second_ticket))
+
+        return pairs
+
+    def __create_match(
+        self, first_ticket: MatchmakingTicket, second_ticket: MatchmakingTicket
+    ) -> None:
+        try:
+            match = self.__match_repository.save_pair(
+                first_ticket.user, second_ticket.user
+            )
+        except Exception:
+            with self.__pairing_finished:
+                for ticket in (second_ticket, first_ticket):
+                    self.__pairing_tickets.pop(ticket.user.id, None)
+                    self.__queued_tickets[ticket.user.id] = ticket
+                    self.__queued_tickets.move_to_end(ticket.user.id, last=False)
+                self.__pairing_finished.notify_all()
+            raise
+
+        with self.__pairing_finished:
+            for ticket in (first_ticket, second_ticket):
+                self.__pairing_tickets.pop(ticket.user.id, None)
+                self.__paired_tickets[ticket.user.id] = ticket
+                self.__resolve(ticket, MatchmakingTicketStatuses.PAIRED, match.id)
+                self.__wait_times.append(ticket.resolved_at - ticket.enqueued_at)
+            self.__pairing_finished.notify_all()
+
+    def __expire(self, now: float) -> None:
+        expired_at = now - self.__maximum_wait
+
+        while self.__queued_tickets:
+            user_id, ticket = next(iter(self.__queued_tickets.items()))
+            if ticket.enqueued_at > expired_at:
+                break
+
+            del self.__queued_tickets[user_id]
+            self.__resolve(ticket, MatchmakingTicketStatuses.EXPIRED)
+
+        while self.__paired_tickets:
+            user_id, ticket = next(iter(self.__paired_tickets.items()))
+            if ticket.resolved_at > expired_at:
+                break
+
+            del self.__paired_tickets[user_id]
+
+    def __resolve(
+        self,
+        ticket: MatchmakingTicket,
+        status: MatchmakingTicketStatuses,
+        match_id: Optional[int] = None,
+    ) -> None:
+        ticket.resolve(status, match_id)
+        self.__counters[status] += 1
+
+    def __percentile(self, values: list[float], percentile: int) -> Optional[float]:
+        if not values:
+            return None
+
+        return values[max(0, math.ceil(len(values) * percentile / 100) - 1)]
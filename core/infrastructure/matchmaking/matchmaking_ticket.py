@@ -0,0 +1,44 @@
+import time
+from enum import Enum
+from threading import Event
+from typing import Optional, Union
+
+from core.domain.models.principal import Principal
+from core.domain.models.user import User
+
+
+class MatchmakingTicketStatuses(Enum):
+    QUEUED = "queued"
+    PAIRED = "paired"
+    CANCELLED = "cancelled"
+    EXPIRED = "expired"
+
+
+class MatchmakingTicket:
+    __slots__ = (
+        "user",
+        "enqueued_at",
+        "resolved_at",
+        "status",
+        "match_id",
+        "__resolved",
+    )
+
+    def __init__(self, user: Union[User, Principal], enqueued_at: float):
+        self.user = user
+        self.enqueued_at = enqueued_at
+        self.resolved_at: Optional[float] = None
+        self.status = MatchmakingTicketStatuses.QUEUED
+        self.match_id: Optional[int] = None
+        self.__resolved = Event()
+
+    def resolve(
+        self, status: MatchmakingTicketStatuses, match_id: Optional[int] = None
+    ) -> None:
+        self.resolved_at = time.monotonic()
+        self.status = status
+        self.match_id = match_id
+        self.__resolved.set()
+
+    def wait(self, timeout: float) -> bool:
+        return self.__resolved.wait(timeout)
@@ -0,0 +1,39 @@
+from typing import Optional
+
+from core.domain.models.user import User
+from core.domain.repositories.user_repository import UserRepository
+from core.infrastructure.caches.ttl_cache import TtlCache
+
+
+class CachedUserRepository(UserRepository):
+    __slots__ = ("__user_repository", "__user_cache")
+
+    def __init__(self, user_repository: UserRepository, user_cache: TtlCache):
+        self.__user_repository = user_repository
+        self.__user_cache = user_cache
+
+    def find_by_id(self, user_id: int) -> Optional[User]:
+        user = self.__user_cache.get(user_id)
+        if user is not None:
+            return user
+
+        user = self.__user_repository.find_by_id(user_id)
+        if user is not None:
+            self.__user_cache.set(user_id, user)
+
+        return user
+
+    def find_user_by_username(self, username: str) -> Optional[User]:
+        return self.__user_repository.find_user_by_username(username)
+
+    def save(self, username: str, password: str) -> User:
+        return self.__user_repository.save(username, password)
+
+    def save_hashed(self, username: str, password_hash: str) -> User:
+        return self.__user_repository.save_hashed(username, password_hash)
+
+    def update_password_hash(self, user: User, password_hash: str) -> None:
+        self.__user_repository.update_password_hash(user, password_hash)
+
+    def save_many_hashed(self, credentials: list[tuple[str, str]]) -> list[int]:
+        return self.__user_repository.save_many_hashed(credentials)
@@ -0,0 +1,14 @@
+from django.db.models import QuerySet
+
+
+def delete_in_chunks(queryset: QuerySet, chunk_size: int) -> int:
+    # Deleting a bounded number of rows per statement keeps each write lock
+    # short, so purging millions of rows does not stall the requests.
+    number_of_deleted = 0
+
+    while True:
+        ids = list(queryset.values_list("id", flat=True)[:chunk_size])
+        if not ids:
+            return number_of_deleted
+
+        number_of_deleted += queryset.model.objects.filter(id__in=ids).delete()[0]
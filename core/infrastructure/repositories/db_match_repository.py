@@ -1,27 +1,76 @@
-from typing import Optional
-from django.db.models import Q
+from typing import Optional, Union
+
+from django.db import connection, transaction
+from django.db.models import F
 
 from core.domain.exceptions.match_not_accepting_guests_exception import (
     MatchNotAcceptingGuestsException,
 )
 from core.domain.exceptions.match_not_found_exception import MatchNotFoundException
+from core.domain.exceptions.open_match_not_found_exception import (
+    OpenMatchNotFoundException,
+)
 from core.domain.exceptions.repeated_player_exception import RepeatedPlayerException
 from core.domain.models.match import Match, MatchStatuses, MatchPlayer
+from core.domain.models.principal import Principal
 from core.domain.models.user import User
+from core.domain.models.user_match import UserMatch
 from core.domain.repositories.match_repository import MatchRepository
+from core.infrastructure.caches.ttl_cache import TtlCache
 
 
 class DbMatchRepository(MatchRepository):
-    __slots__ = "__match_manager"
-
-    def __init__(self):
+    __slots__ = (
+        "__match_manager",
+        "__user_manager",
+        "__user_match_manager",
+        "__open_matches_cache",
+        "__user_cache",
+    )
+
+    def __init__(
+        self,
+        open_matches_cache: Optional[TtlCache] = None,
+        user_cache: Optional[TtlCache] = None,
+    ):
         self.__match_manager = Match.objects
+        self.__user_manager = User.objects
+        self.__user_match_manager = UserMatch.objects
+        self.__open_matches_cache = open_matches_cache
+        self.__user_cache = user_cache
 
     def find_by_user_id(self, user_id: int) -> list[Match]:
-        first_player_query = Q(first_player_id=user_id)
-        second_player_query = Q(second_player_id=user_id)
-
-        return self.__match_manager.filter(first_player_query | second_player_query)
+        return self.__match_manager.filter(user_matches__user_id=user_id)
+
+    def find_page_by_user_id(
+        self, user_id: int, after_match_id: int, page_size: int
+    ) -> list[Match]:
+        return list(
+            self.__match_manager.filter(
+                user_matches__user_id=user_id,
+                user_matches__match_id__gt=after_match_id,
+            ).order_by("user_matches__match_id")[:page_size]
+        )
+
+    def find_open(self, before_match_id: Optional[int], page_size: int) -> list[Match]:
+        if self.__open_matches_cache is not None:
+            matches = self.__open_matches_cache.get((before_match_id, page_size))
+            if matches is not None:
+                return matches
+
+        # Deleting the creator leaves the match without a first player, so
+        # nobody could play it.
+        open_matches = self.__match_manager.select_related("first_player").filter(
+            status=MatchStatuses.AWAITING, first_player__isnull=False
+        )
+        if before_match_id is not None:
+            open_matches = open_matches.filter(id__lt=before_match_id)
+        matches = list(open_matches.order_by("-id")[:page_size])
+
+        if self.__open_matches_cache is not None:
+            self.__open_matches_cache.set((before_match_id, page_size), matches)
+
+        return matches
 
     def find_or_fail_by_id(self, match_id: int) -> Match:
         try:
@@ -29,50 +78,159 @@ class DbMatchRepository(MatchRepository):
         except Match.DoesNotExist:
             raise MatchNotFoundException()
 
-    def save(self, creator: User) -> Match:
-        match = Match(first_player=creator)
-        match.save()
-
-        creator.matches_total = creator.matches_total + 1
-        creator.save()
+    def save(
+        self,
+        creator: Union[User, Principal],
+        width: int = 3,
+        height: int = 3,
+        line_length: int = 3,
+    ) -> Match:
+        match = Match(
+            first_player_id=creator.id,
+            width=width,
+            height=height,
+            line_length=line_length,
+        )
+        with transaction.atomic():
+            match.save()
+            self.__user_match_manager.create(
+                user_id=creator.id, match=match, role=MatchPlayer.FIRST_PLAYER
+            )
+            self.__user_manager.filter(id=creator.id).update(
+                matches_total=F("matches_total") + 1
+            )
+        self.__clear_open_matches()
+        self.__forget_users(creator.id)
 
         return match
 
-    def save_guest(self, guest: User, match_id: int) -> None:
-        try:
-            match = self.__match_manager.get(id=match_id)
-        except Match.DoesNotExist:
-            raise MatchNotFoundException()
+    def save_pair(
+        self,
+        first_player: Union[User, Principal],
+        second_player: Union[User, Principal],
+    ) -> Match:
+        match = Match(
+            first_player_id=first_player.id,
+            second_player_id=second_player.id,
+            status=MatchStatuses.IN_PROGRESS,
+        )
+        with transaction.atomic():
+            match.save()
+            self.__user_match_manager.bulk_create(
+                [
+                    UserMatch(
+                        user_id=first_player.id,
+                        match=match,
+                        role=MatchPlayer.FIRST_PLAYER,
+                        status=MatchStatuses.IN_PROGRESS,
+                    ),
+                    UserMatch(
+                        user_id=second_player.id,
+                        match=match,
+                        role=MatchPlayer.SECOND_PLAYER,
+                        status=MatchStatuses.IN_PROGRESS,
+                    ),
+                ]
+            )
+            self.__user_manager.filter(
+                id__in=[first_player.id, second_player.id]
+            ).update(matches_total=F("matches_total") + 1)
+        self.__forget_users(first_player.id, second_player.id)
 
-        if match.status != MatchStatuses.AWAITING.value:
-            raise MatchNotAcceptingGuestsException()
+        return match
 
-        if match.first_player_id == guest.id:
-            raise RepeatedPlayerException()
+    def save_guest(self, guest: Union[User, Principal], match_id: int) -> None:
+        with transaction.atomic():
+            # Claiming the match with a conditional update lets only one of
+            # several concurrent joiners through, the others update no row.
+            claimed_matches = (
+                self.__match_manager.filter(
+                    id=match_id,
+                    status=MatchStatuses.AWAITING,
+                    first_player__isnull=False,
+                )
+                .exclude(first_player_id=guest.id)
+                .update(second_player_id=guest.id, status=MatchStatuses.IN_PROGRESS)
+            )
+            if claimed_matches == 0:
+                self.__fail_to_claim(guest, match_id)
+
+            self.__add_guest_membership(match_id, guest)
+            self.__user_manager.filter(id=guest.id).update(
+                matches_total=F("matches_total") + 1
+            )
+        self.__clear_open_matches()
+        self.__forget_users(guest.id)
+
+    def save_any_guest(self, guest: Union[User, Principal]) -> Match:
+        with transaction.atomic():
+            # Writing first makes SQLite take its write lock before the open
+            # match is read, so concurrent joiners are serialized instead of
+            # reading the same match. Backends with row locks skip the rows
+            # other joiners are claiming.
+            self.__user_manager.filter(id=guest.id).update(
+                matches_total=F("matches_total") + 1
+            )
+
+            open_matches = (
+                self.__match_manager.filter(
+                    status=MatchStatuses.AWAITING, first_player__isnull=False
+                )
+                .exclude(first_player_id=guest.id)
+                .order_by("id")
+            )
+            if connection.features.has_select_for_update_skip_locked:
+                open_matches = open_matches.select_for_update(skip_locked=True)
+
+            match = open_matches.first()
+            if match is None:
+                raise OpenMatchNotFoundException()
+
+            self.__add_guest(match, guest)
+        self.__clear_open_matches()
+        self.__forget_users(guest.id)
 
-        match.second_player = guest
-        match.status = MatchStatuses.IN_PROGRESS
-        match.save()
+        return match
 
-        guest.matches_total = guest.matches_total + 1
-        guest.save()
+    def __add_guest(self, match: Match, guest: Union[User, Principal]) -> None:
+        match.second_player_id = guest.id
+        match.status = MatchStatuses.IN_PROGRESS
 
-    def end_match(self, match_id: int, winner: Optional[str]) -> None:
+        match.save(update_fields=["second_player", "status"])
+        self.__add_guest_membership(match.id, guest)
+
+    def __add_guest_membership(
+        self, match_id: int, guest: Union[User, Principal]
+    ) -> None:
+        self.__user_match_manager.filter(match_id=match_id).update(
+            status=MatchStatuses.IN_PROGRESS
+        )
+        self.__user_match_manager.create(
+            user_id=guest.id,
+            match_id=match_id,
+            role=MatchPlayer.SECOND_PLAYER,
+            status=MatchStatuses.IN_PROGRESS,
+        )
+
+    def __fail_to_claim(self, guest: Union[User, Principal], match_id: int) -> None:
         try:
             match = self.__match_manager.get(id=match_id)
         except Match.DoesNotExist:
             raise MatchNotFoundException()
 
-        match.status = MatchStatuses.FINISHED
-        match.set_which_player_wins(winner)
-        match.save()
-
-        if winner is not None:
-            if winner == MatchPlayer.FIRST_PLAYER.value:
-                winner_player = match.first_player
-                winner_player.matches_won = winner_player.matches_won + 1
-                winner_player.save()
-            elif winner == MatchPlayer.SECOND_PLAYER.value:
-                winner_player = match.second_player
-                winner_player.matches_won = winner_player.matches_won + 1
-                winner_player.save()
+        if (
+            match.status == MatchStatuses.AWAITING.value
+            and match.first_player_id == guest.id
+        ):
+            raise RepeatedPlayerException()
+
+        raise MatchNotAcceptingGuestsException()
+
+    def __clear_open_matches(self) -> None:
+        if self.__open_matches_cache is not None:
+            self.__open_matches_cache.clear()
+
+    def __forget_users(self, *user_ids: int) -> None:
+        if self.__user_cache is not None:
+            for user_id in user_ids:
+                self.__user_cache.delete(user_id)
@@ -0,0 +1,82 @@
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import F
+
+from core.domain.exceptions.concurrent_movement_exception import (
+    ConcurrentMovementException,
+)
+from core.domain.exceptions.match_not_found_exception import MatchNotFoundException
+from core.domain.models.match import Match, MatchPlayer, MatchStatuses
+from core.domain.models.movement import Movement
+from core.domain.models.user import User
+from core.domain.models.user_match import UserMatch
+from core.domain.repositories.match_unit_of_work import MatchUnitOfWork
+from core.infrastructure.caches.ttl_cache import TtlCache
+
+
+class DbMatchUnitOfWork(MatchUnitOfWork):
+    __slots__ = (
+        "__match_manager",
+        "__user_manager",
+        "__user_match_manager",
+        "__user_cache",
+    )
+
+    def __init__(self, user_cache: Optional[TtlCache] = None):
+        self.__match_manager = Match.objects
+        self.__user_manager = User.objects
+        self.__user_match_manager = UserMatch.objects
+        self.__user_cache = user_cache
+
+    def find_or_fail_by_id(self, match_id: int) -> Match:
+        try:
+            return self.__match_manager.get(id=match_id)
+        except Match.DoesNotExist:
+            raise MatchNotFoundException()
+
+    def commit(self, match: Match, x: int, y: int) -> None:
+        movement = Movement(
+            x=x,
+            y=y,
+            match=match,
+            _player=match.get_slot(x, y),
+            number=match.number_of_movements,
+        )
+
+        with transaction.atomic():
+            updated_matches = self.__match_manager.filter(
+                id=match.id,
+                status=MatchStatuses.IN_PROGRESS,
+                number_of_movements=match.number_of_movements - 1,
+            ).update(
+                number_of_movements=match.number_of_movements,
+                first_player_board=match.first_player_board,
+                second_player_board=match.second_player_board,
+                status=match.status,
+                _winner=match.get_which_player_wins(),
+            )
+            if updated_matches == 0:
+                raise ConcurrentMovementException()
+
+            movement.save()
+
+            if match.status == MatchStatuses.FINISHED:
+                self.__user_match_manager.filter(match_id=match.id).update(
+                    status=MatchStatuses.FINISHED
+                )
+
+            winner = match.get_which_player_wins()
+            if winner == MatchPlayer.FIRST_PLAYER.value:
+                winner_id = match.first_player_id
+            elif winner == MatchPlayer.SECOND_PLAYER.value:
+                winner_id = match.second_player_id
+            else:
+                return
+
+            self.__user_manager.filter(id=winner_id).update(
+                matches_won=F("matches_won") + 1
+            )
+
+        if self.__user_cache is not None:
+            self.__user_cache.delete(winner_id)
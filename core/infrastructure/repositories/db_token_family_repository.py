@@ -0,0 +1,54 @@
+import hashlib
+from datetime import datetime
+
+from django.utils import timezone
+
+from core.domain.models.token_family import TokenFamily
+from core.domain.repositories.token_family_repository import TokenFamilyRepository
+from core.infrastructure.repositories.chunked_deletion import delete_in_chunks
+
+
+def _digest(value: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(value.encode(), digest_size=8).digest(), "big", signed=True
+    )
+
+
+class DbTokenFamilyRepository(TokenFamilyRepository):
+    __slots__ = "__token_family_manager"
+
+    def __init__(self):
+        self.__token_family_manager = TokenFamily.objects
+
+    def save(self, family: str, user_id: int, jti: str, expires_at: datetime) -> None:
+        self.__token_family_manager.create(
+            family_hash=_digest(family),
+            user_id=user_id,
+            token_hash=_digest(jti),
+            expires_at=expires_at,
+        )
+
+    def rotate(self, family: str, jti: str, new_jti: str, expires_at: datetime) -> bool:
+        family_hash = _digest(family)
+
+        # Compare-and-swap on the current token, so two requests presenting
+        # the same refresh token can never both rotate it.
+        rotated = self.__token_family_manager.filter(
+            family_hash=family_hash, token_hash=_digest(jti)
+        ).update(token_hash=_digest(new_jti), expires_at=expires_at)
+        if rotated == 1:
+            return True
+
+        # A retired token of a live family was presented again, which means it
+        # leaked. The whole family is revoked so neither copy keeps working.
+        self.__token_family_manager.filter(family_hash=family_hash).delete()
+        return False
+
+    def delete(self, family: str) -> None:
+        self.__token_family_manager.filter(family_hash=_digest(family)).delete()
+
+    def purge_expired(self, chunk_size: int) -> int:
+        return delete_in_chunks(
+            self.__token_family_manager.filter(expires_at__lte=timezone.now()),
+            chunk_size,
+        )
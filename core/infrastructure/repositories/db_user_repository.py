@@ -1,5 +1,7 @@
 from typing import Optional
 
+from django.db import IntegrityError, transaction
+
 from core.domain.models.user import User
 from core.domain.repositories.user_repository import UserRepository
 
@@ -27,3 +29,45 @@ class DbUserRepository(UserRepository):
         user.save()
 
         return user
+
+    def save_hashed(self, username: str, password_hash: str) -> User:
+        user = User(username=username, _password=password_hash)
+        user.save()
+
+        return user
+
+    def update_password_hash(self, user: User, password_hash: str) -> None:
+        user._password = password_hash
+        user.save(update_fields=["_password"])
+
+    def save_many_hashed(self, credentials: list[tuple[str, str]]) -> list[int]:
+        existing_usernames = set(
+            self.__user_manager.filter(
+                username__in=[username for username, _ in credentials]
+            ).values_list("username", flat=True)
+        )
+
+        conflicts = []
+        users = {}
+        for index, (username, password_hash) in enumerate(credentials):
+            if username in existing_usernames:
+                conflicts.append(index)
+                continue
+
+            existing_usernames.add(username)
+            users[index] = User(username=username, _password=password_hash)
+
+        try:
+            with transaction.atomic():
+                self.__user_manager.bulk_create(users.values())
+        except IntegrityError:
+            # Another writer took some of the usernames after they were
+            # checked, so the batch is retried row by row to find them.
+            for index, user in users.items():
+                try:
+                    with transaction.atomic():
+                        user.save()
+                except IntegrityError:
+                    conflicts.append(index)
+
+        return sorted(conflicts)
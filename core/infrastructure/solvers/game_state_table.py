@@ -0,0 +1,89 @@
+import mmap
+import os
+import struct
+from threading import Lock
+from typing import Optional
+
+from core.infrastructure.checkers.board_outcome_table import (
+    NUMBER_OF_BOARDS,
+    BoardOutcomeTable,
+)
+from core.infrastructure.solvers.solved_position import SolvedPosition
+
+MAGIC = b"TTTS"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")
+RECORD_SIZE = 4
+ILLEGAL_POSITION = 0xFF
+NO_MOVE = 0xFF
+
+_MAPPED_TABLES: dict[str, Optional[memoryview]] = {}
+_MAPPED_TABLES_LOCK = Lock()
+
+
+def _map_table(path: str) -> Optional[memoryview]:
+    expected_size = HEADER.size + RECORD_SIZE * NUMBER_OF_BOARDS
+    if not os.path.exists(path) or os.path.getsize(path) != expected_size:
+        return None
+
+    with open(path, "rb") as table_file:
+        mapped_file = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, record_size, number_of_records, _ = HEADER.unpack_from(mapped_file)
+    is_valid = (
+        magic == MAGIC
+        and version == VERSION
+        and record_size == RECORD_SIZE
+        and number_of_records == NUMBER_OF_BOARDS
+    )
+    if is_valid is False:
+        mapped_file.close()
+        return None
+
+    return memoryview(mapped_file)[HEADER.size :]
+
+
+class GameStateTable(BoardOutcomeTable):
+    __slots__ = "__records"
+
+    def __init__(self, path: str):
+        records = _MAPPED_TABLES.get(path)
+        if path not in _MAPPED_TABLES:
+            with _MAPPED_TABLES_LOCK:
+                if path not in _MAPPED_TABLES:
+                    _MAPPED_TABLES[path] = _map_table(path)
+                records = _MAPPED_TABLES[path]
+
+        self.__records = records
+        if records is None:
+            super().__init__()
+        else:
+            self._outcomes = records[0::RECORD_SIZE]
+
+    def is_available(self) -> bool:
+        return self.__records is not None
+
+    def number_of_positions(self) -> int:
+        if self.is_available() is False:
+            return 0
+
+        return HEADER.unpack_from(self.__records.obj)[4]
+
+    def lookup(
+        self, first_player_board: int, second_player_board: int
+    ) -> Optional[SolvedPosition]:
+        if self.is_available() is False:
+            return None
+
+        offset = RECORD_SIZE * self.encode(first_player_board, second_player_board)
+        _, value, best_slot, depth = self.__records[offset : offset + RECORD_SIZE]
+
+        if value == ILLEGAL_POSITION:
+            return None
+
+        if best_slot == NO_MOVE:
+            return SolvedPosition(value=value - 1, best_move=None, depth=depth)
+
+        return SolvedPosition(
+            value=value - 1, best_move=(best_slot // 3, best_slot % 3), depth=depth
+        )
@@ -0,0 +1,95 @@
+import os
+
+from core.infrastructure.checkers.board_outcome_table import (
+    FULL_BOARD,
+    NUMBER_OF_BOARDS,
+    WIN_MASKS,
+    BoardOutcomeTable,
+)
+from core.infrastructure.solvers.game_state_table import (
+    HEADER,
+    ILLEGAL_POSITION,
+    MAGIC,
+    NO_MOVE,
+    RECORD_SIZE,
+    VERSION,
+)
+from core.infrastructure.solvers.negamax_solver import NegamaxSolver
+
+
+class GameStateTableWriter:
+    __slots__ = ("__solver", "__board_outcome_table")
+
+    def __init__(self, solver: NegamaxSolver, board_outcome_table: BoardOutcomeTable):
+        self.__solver = solver
+        self.__board_outcome_table = board_outcome_table
+
+    def write(self, path: str) -> int:
+        records = bytearray(RECORD_SIZE * NUMBER_OF_BOARDS)
+        for code in range(NUMBER_OF_BOARDS):
+            records[RECORD_SIZE * code] = self.__board_outcome_table.classify_code(code)
+            records[RECORD_SIZE * code + 1] = ILLEGAL_POSITION
+
+        legal_positions = self.legal_positions()
+        for first_player_board, second_player_board in legal_positions:
+            solved_position = self.__solver.solve(
+                first_player_board, second_player_board
+            )
+            best_slot = NO_MOVE
+            if solved_position.best_move is not None:
+                x, y = solved_position.best_move
+                best_slot = x * 3 + y
+
+            offset = RECORD_SIZE * self.__board_outcome_table.encode(
+                first_player_board, second_player_board
+            )
+            records[offset + 1] = solved_position.value + 1
+            records[offset + 2] = best_slot
+            records[offset + 3] = solved_position.depth
+
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as table_file:
+            table_file.write(
+                HEADER.pack(
+                    MAGIC, VERSION, RECORD_SIZE, NUMBER_OF_BOARDS, len(legal_positions)
+                )
+            )
+            table_file.write(records)
+        os.replace(temporary_path, path)
+
+        return len(legal_positions)
+
+    def legal_positions(self) -> list[tuple[int, int]]:
+        positions = set()
+        pending = [(0, 0)]
+        while pending:
+            position = pending.pop()
+            if position in positions:
+                continue
+            positions.add(position)
+
+            first_player_board, second_player_board = position
+            first_player_turn = bin(first_player_board).count("1") == bin(
+                second_player_board
+            ).count("1")
+            last_board = (
+                second_player_board if first_player_turn else first_player_board
+            )
+            if any(last_board & mask == mask for mask in WIN_MASKS):
+                continue
+
+            free_slots = FULL_BOARD & ~(first_player_board | second_player_board)
+            for slot in range(9):
+                if not free_slots >> slot & 1:
+                    continue
+
+                if first_player_turn:
+                    pending.append(
+                        (first_player_board | 1 << slot, second_player_board)
+                    )
+                else:
+                    pending.append(
+                        (first_player_board, second_player_board | 1 << slot)
+                    )
+
+        return sorted(positions)
@@ -0,0 +1,99 @@
+from typing import Optional
+
+from core.infrastructure.checkers.board_outcome_table import FULL_BOARD, WIN_MASKS
+from core.infrastructure.generators.canonical_board_generator import (
+    INVERSE_SLOT_PERMUTATIONS,
+    SLOT_PERMUTATIONS,
+    CanonicalBoardGenerator,
+)
+from core.infrastructure.solvers.game_state_table import GameStateTable
+from core.infrastructure.solvers.solved_position import SolvedPosition
+
+_TRANSPOSITION_TABLE: dict[int, tuple[int, int, int]] = {}
+_NO_MOVE = -1
+
+
+class NegamaxSolver:
+    __slots__ = ("__canonical_board_generator", "__game_state_table")
+
+    def __init__(
+        self,
+        canonical_board_generator: CanonicalBoardGenerator,
+        game_state_table: Optional[GameStateTable] = None,
+    ):
+        self.__canonical_board_generator = canonical_board_generator
+        self.__game_state_table = game_state_table
+
+    def solve(
+        self, first_player_board: int, second_player_board: int
+    ) -> SolvedPosition:
+        if self.__game_state_table is not None:
+            solved_position = self.__game_state_table.lookup(
+                first_player_board, second_player_board
+            )
+            if solved_position is not None:
+                return solved_position
+
+        if bin(first_player_board).count("1") > bin(second_player_board).count("1"):
+            mover_board, opponent_board = second_player_board, first_player_board
+        else:
+            mover_board, opponent_board = first_player_board, second_player_board
+
+        value, depth, best_slot = self.__negamax(mover_board, opponent_board)
+
+        if best_slot == _NO_MOVE:
+            return SolvedPosition(value=value, best_move=None, depth=depth)
+
+        return SolvedPosition(
+            value=value, best_move=(best_slot // 3, best_slot % 3), depth=depth
+        )
+
+    def transposition_table_size(self) -> int:
+        return len(_TRANSPOSITION_TABLE)
+
+    def __negamax(self, mover_board: int, opponent_board: int) -> tuple[int, int, int]:
+        key, symmetry = self.__canonical_board_generator.generate(
+            mover_board, opponent_board
+        )
+
+        cached = _TRANSPOSITION_TABLE.get(key)
+        if cached is None:
+            cached = self.__search(mover_board, opponent_board, symmetry)
+            _TRANSPOSITION_TABLE[key] = cached
+
+        value, depth, canonical_slot = cached
+        if canonical_slot == _NO_MOVE:
+            return value, depth, _NO_MOVE
+
+        return value, depth, INVERSE_SLOT_PERMUTATIONS[symmetry][canonical_slot]
+
+    def __search(
+        self, mover_board: int, opponent_board: int, symmetry: int
+    ) -> tuple[int, int, int]:
+        if any(opponent_board & mask == mask for mask in WIN_MASKS):
+            return -1, 0, _NO_MOVE
+
+        free_slots = FULL_BOARD & ~(mover_board | opponent_board)
+        if free_slots == 0:
+            return 0, 0, _NO_MOVE
+
+        best_score = None
+        best = (0, 0, _NO_MOVE)
+        for slot in range(9):
+            if not free_slots >> slot & 1:
+                continue
+
+            child_value, child_depth, _ = self.__negamax(
+                opponent_board, mover_board | 1 << slot
+            )
+            value, depth = -child_value, child_depth + 1
+            score = (value, -depth if value > 0 else depth)
+
+            if best_score is None or score > best_score:
+                best_score = score
+                best = (value, depth, SLOT_PERMUTATIONS[symmetry][slot])
+
+                if value > 0 and depth == 1:
+                    break
+
+        return best
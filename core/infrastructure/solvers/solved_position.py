@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class SolvedPosition:
+    value: int
+    best_move: Optional[tuple[int, int]]
+    depth: int
@@ -1,14 +1,58 @@
-from typing import Any
+import hashlib
+import time
+from typing import Any, Optional
 
 from django.conf import settings
 
 import jwt
 
 from core.domain.exceptions.jwt_verification_exception import JWTVerificationException
+from core.infrastructure.caches.ttl_cache import TtlCache
+from core.infrastructure.verifiers.token_revocation_list import TokenRevocationList
 
 
 class JWTVerifier:
+    __slots__ = ("__token_cache", "__token_revocation_list")
+
+    def __init__(
+        self,
+        token_cache: Optional[TtlCache] = None,
+        token_revocation_list: Optional[TokenRevocationList] = None,
+    ):
+        self.__token_cache = token_cache
+        self.__token_revocation_list = token_revocation_list
+
     def verify(self, token: str) -> dict[str, Any]:
+        payload = self.__verify_signature(token)
+
+        # Cached payloads are checked too, a token can be revoked after its
+        # first verification.
+        if self.__token_revocation_list is not None:
+            if self.__token_revocation_list.is_revoked(payload.get("jti")):
+                raise JWTVerificationException()
+
+        return payload
+
+    def __verify_signature(self, token: str) -> dict[str, Any]:
+        if self.__token_cache is None:
+            return self.__decode(token)
+
+        digest = hashlib.sha256(token.encode()).digest()
+        payload = self.__token_cache.get(digest)
+        if payload is not None:
+            return payload
+
+        payload = self.__decode(token)
+
+        ttl = settings.TOKEN_CACHE_TTL
+        if "exp" in payload:
+            ttl = min(ttl, payload["exp"] - time.time())
+        if ttl > 0:
+            self.__token_cache.set(digest, payload, ttl)
+
+        return payload
+
+    def __decode(self, token: str) -> dict[str, Any]:
         try:
             return jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
         except (jwt.ExpiredSignatureError, jwt.DecodeError):
@@ -0,0 +1,139 @@
+import time
+from datetime import datetime
+from threading import Lock
+from typing import Optional
+
+from django.utils import timezone
+
+from core.domain.models.revoked_token import RevokedToken
+from core.infrastructure.caches.bloom_filter import BloomFilter
+from core.infrastructure.caches.id_watermark import IdWatermark
+from core.infrastructure.repositories.chunked_deletion import delete_in_chunks
+
+
+class TokenRevocationList:
+    __slots__ = (
+        "__refresh_interval",
+        "__capacity",
+        "__false_positive_rate",
+        "__revoked_token_manager",
+        "__bloom_filter",
+        "__watermark",
+        "__refreshed_at",
+        "__lock",
+    )
+
+    def __init__(
+        self,
+        refresh_interval: float,
+        capacity: int,
+        false_positive_rate: float,
+        refresh_overlap: int,
+    ):
+        self.__refresh_interval = refresh_interval
+        self.__capacity = capacity
+        self.__false_positive_rate = false_positive_rate
+        self.__revoked_token_manager = RevokedToken.objects
+        self.__bloom_filter = BloomFilter(capacity, false_positive_rate)
+        self.__watermark = IdWatermark(refresh_overlap)
+        self.__refreshed_at: Optional[float] = None
+        self.__lock = Lock()
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        if jti is None:
+            return False
+
+        if self.__is_stale():
+            self.__refresh_if_stale()
+
+        if jti not in self.__bloom_filter:
+            return False
+
+        # The filter may report false positives and keeps expired tokens until
+        # it is rebuilt, so a hit is confirmed against the revocation table
+        # before rejecting the token.
+        return self.__revoked_token_manager.filter(
+            jti=jti, expires_at__gt=timezone.now()
+        ).exists()
+
+    def revoke(self, jti: str, expires_at: datetime) -> bool:
+        _, created = self.__revoked_token_manager.get_or_create(
+            jti=jti, defaults={"expires_at": expires_at}
+        )
+
+        with self.__lock:
+            self.__bloom_filter.add(jti)
+
+        return created
+
+    def purge_expired(self, chunk_size: int) -> int:
+        return delete_in_chunks(
+            self.__revoked_token_manager.filter(expires_at__lte=timezone.now()),
+            chunk_size,
+        )
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__bloom_filter = BloomFilter(
+                self.__capacity, self.__false_positive_rate
+            )
+            self.__watermark.reset()
+            self.__refreshed_at = None
+
+    def refresh(self) -> None:
+        with self.__lock:
+            self.__refresh()
+
+    def __is_stale(self) -> bool:
+        return (
+            self.__refreshed_at is None
+            or time.monotonic() - self.__refreshed_at >= self.__refresh_interval
+        )
+
+    def __refresh_if_stale(self) -> None:
+        # Only the first load makes requests wait. Afterwards a single request
+        # refreshes while the others keep answering from the current filter.
+        if self.__lock.acquire(blocking=self.__refreshed_at is None) is False:
+            return
+
+        try:
+            if self.__is_stale():
+                self.__refresh()
+        finally:
+            self.__lock.release()
+
+    def __refresh(self) -> None:
+        # Revocations made by other processes since the last refresh are the
+        # ones past the watermark, which also reads again the last ids in case
+        # they committed out of order.
+        revoked_tokens = list(
+            self.__revoked_token_manager.filter(
+                id__gt=self.__watermark.since(), expires_at__gt=timezone.now()
+            ).values_list("id", "jti")
+        )
+        jtis = self.__watermark.unseen(revoked_tokens)
+
+        if len(self.__bloom_filter) + len(jtis) > self.__capacity:
+            self.__rebuild()
+        else:
+            for jti in jtis:
+                self.__bloom_filter.add(jti)
+
+        self.__refreshed_at = time.monotonic()
+
+    def __rebuild(self) -> None:
+        # Expired tokens are rejected by their signature check, so only the
+        # revocations that still matter are loaded into the new filter.
+        revoked_tokens = list(
+            self.__revoked_token_manager.filter(
+                expires_at__gt=timezone.now()
+            ).values_list("id", "jti")
+        )
+
+        self.__capacity = max(self.__capacity, 2 * len(revoked_tokens))
+        bloom_filter = BloomFilter(self.__capacity, self.__false_positive_rate)
+        self.__watermark.reset()
+        for jti in self.__watermark.unseen(revoked_tokens):
+            bloom_filter.add(jti)
+
+        self.__bloom_filter = bloom_filter
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional
 
 from django.http import HttpRequest
 
@@ -6,25 +6,28 @@ from core.domain.exceptions.jwt_verification_exception import JWTVerificationExc
 from core.domain.exceptions.user_authentication_exception import (
     UserAuthenticationException,
 )
+from core.domain.models.principal import Principal
 from core.domain.models.user import User
 from core.domain.repositories.user_repository import UserRepository
 from core.infrastructure.verifiers.jwt_verifier import JWTVerifier
+from core.infrastructure.verifiers.user_revocation_set import UserRevocationSet
 
 
 class UserAuthenticationVerifier:
-    __slots__ = ("__user_repository", "__jwt_verifier")
+    __slots__ = ("__user_repository", "__jwt_verifier", "__user_revocation_set")
 
-    def __init__(self, user_repository: UserRepository, jwt_verifier: JWTVerifier):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        jwt_verifier: JWTVerifier,
+        user_revocation_set: Optional[UserRevocationSet] = None,
+    ):
         self.__user_repository = user_repository
         self.__jwt_verifier = jwt_verifier
+        self.__user_revocation_set = user_revocation_set
 
     def verify(self, request: HttpRequest) -> User:
-        token = self.__extract_token(request)
-
-        try:
-            payload = self.__jwt_verifier.verify(token)
-        except JWTVerificationException:
-            raise UserAuthenticationException()
+        payload = self.__verify_payload(request)
 
         user = self.__user_repository.find_by_id(payload.get("user_id"))
 
@@ -33,6 +36,33 @@ class UserAuthenticationVerifier:
 
         return user
 
+    def verify_principal(self, request: HttpRequest) -> Principal:
+        payload = self.__verify_payload(request)
+
+        user_id = payload.get("user_id")
+        if self.__user_revocation_set is not None:
+            if self.__user_revocation_set.is_revoked(user_id):
+                raise UserAuthenticationException()
+
+        username = payload.get("username")
+        if username is not None:
+            return Principal(id=user_id, username=username)
+
+        user = self.__user_repository.find_by_id(user_id)
+
+        if user is None:
+            raise UserAuthenticationException()
+
+        return Principal(id=user.id, username=user.username)
+
+    def __verify_payload(self, request: HttpRequest) -> dict[str, Any]:
+        token = self.__extract_token(request)
+
+        try:
+            return self.__jwt_verifier.verify(token)
+        except JWTVerificationException:
+            raise UserAuthenticationException()
+
     def __extract_token(self, request: HttpRequest) -> str:
         authorization_header: Optional[str] = request.META.get(
             "HTTP_AUTHORIZATION", None
@@ -0,0 +1,63 @@
+import time
+from threading import Lock
+from typing import Optional
+
+from django.utils import timezone
+
+from core.domain.models.revoked_user import RevokedUser
+from core.infrastructure.generators.jwt_generator import TOKEN_LIFETIME
+from core.infrastructure.repositories.chunked_deletion import delete_in_chunks
+
+
+class UserRevocationSet:
+    __slots__ = (
+        "__refresh_interval",
+        "__revoked_user_manager",
+        "__user_ids",
+        "__refreshed_at",
+        "__lock",
+    )
+
+    def __init__(self, refresh_interval: float):
+        self.__refresh_interval = refresh_interval
+        self.__revoked_user_manager = RevokedUser.objects
+        self.__user_ids: frozenset[int] = frozenset()
+        self.__refreshed_at: Optional[float] = None
+        self.__lock = Lock()
+
+    def is_revoked(self, user_id: int) -> bool:
+        if (
+            self.__refreshed_at is None
+            or time.monotonic() - self.__refreshed_at >= self.__refresh_interval
+        ):
+            self.refresh()
+
+        return user_id in self.__user_ids
+
+    def revoke(self, user_id: int) -> None:
+        self.__revoked_user_manager.get_or_create(user_id=user_id)
+
+        with self.__lock:
+            self.__user_ids = self.__user_ids | {user_id}
+
+    def purge_expired(self, chunk_size: int) -> int:
+        return delete_in_chunks(
+            self.__revoked_user_manager.filter(
+                revoked_at__lt=timezone.now() - TOKEN_LIFETIME
+            ),
+            chunk_size,
+        )
+
+    def refresh(self) -> None:
+        # Tokens issued before a revocation older than their lifetime have
+        # expired anyway, so only recent revocations are kept in memory.
+        oldest_revocation = timezone.now() - TOKEN_LIFETIME
+        user_ids = frozenset(
+            self.__revoked_user_manager.filter(
+                revoked_at__gte=oldest_revocation
+            ).values_list("user_id", flat=True)
+        )
+
+        with self.__lock:
+            self.__user_ids = user_ids
+            self.__refreshed_at = time.monotonic()
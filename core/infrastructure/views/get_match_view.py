@@ -13,12 +13,16 @@ from core.dependency_injection_factories.application.get_match.get_match_query_f
 from core.dependency_injection_factories.infrastructure.verifiers.user_authentication_verifier_factory import (
     UserAuthenticationVerifierFactory,
 )
+from core.domain.exceptions.board_code_too_large_exception import (
+    BoardCodeTooLargeException,
+)
 from core.domain.exceptions.match_not_found_exception import MatchNotFoundException
 from core.domain.exceptions.not_in_game_exception import NotInGameException
 from core.domain.exceptions.user_authentication_exception import (
     UserAuthenticationException,
 )
 from core.domain.models.match import MatchStatuses
+from core.infrastructure.generators.board_generator import BoardFormats
 from core.infrastructure.verifiers.user_authentication_verifier import (
     UserAuthenticationVerifier,
 )
@@ -45,6 +49,19 @@ class GetMatchView(APIView):
         operation_summary="Get information about a match",
         operation_description="This endpoint gets the information about a match if the user is one of the players",
         security=[{"Bearer": []}],
+        manual_parameters=[
+            openapi.Parameter(
+                "board_format",
+                openapi.IN_QUERY,
+                description="Representation of the board. 'nested' returns a list of rows, "
+                "'string' returns one character per slot ('X', 'O' or '-') and 'code' "
+                "returns the board as a base-3 integer (1 for 'X', 2 for 'O'). 'code' is "
+                "only available for boards of up to 33 slots",
+                type=openapi.TYPE_STRING,
+                enum=BoardFormats.values,
+                default=BoardFormats.NESTED.value,
+            ),
+        ],
         responses={
             200: openapi.Response(
                 description="Match retrieved successfully",
@@ -59,8 +76,22 @@ class GetMatchView(APIView):
                             type=openapi.TYPE_INTEGER,
                             example=7,
                         ),
+                        "width": openapi.Schema(
+                            type=openapi.TYPE_INTEGER,
+                            example=3,
+                        ),
+                        "height": openapi.Schema(
+                            type=openapi.TYPE_INTEGER,
+                            example=3,
+                        ),
+                        "line_length": openapi.Schema(
+                            type=openapi.TYPE_INTEGER,
+                            example=3,
+                        ),
                         "board": openapi.Schema(
                             type=openapi.TYPE_ARRAY,
+                            description="A string or an integer when board_format is "
+                            "'string' or 'code'",
                             items=openapi.Schema(
                                 type=openapi.TYPE_STRING,
                                 example="X",
@@ -91,12 +122,28 @@ class GetMatchView(APIView):
                     required=[
                         "status",
                         "number_of_movements",
+                        "width",
+                        "height",
+                        "line_length",
                         "board",
                         "first_player_id",
                         "first_player_username",
                     ],
                 ),
             ),
+            400: openapi.Response(
+                description="Could not get due to an unknown board format or a board "
+                "too large for the 'code' format",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="Unknown board format 'compact'",
+                        ),
+                    },
+                ),
+            ),
             401: openapi.Response(
                 description="Could not get due to authentication issues",
                 schema=openapi.Schema(
@@ -137,14 +184,21 @@ class GetMatchView(APIView):
     )
     def get(self, request: HttpRequest, match_id: int) -> HttpResponse:
         try:
-            user = self.__user_auth_verifier.verify(request)
+            user = self.__user_auth_verifier.verify_principal(request)
         except UserAuthenticationException:
             return JsonResponse(
                 {"error": "Authentication failed"}, status=status.HTTP_401_UNAUTHORIZED
             )
 
+        board_format = request.GET.get("board_format", BoardFormats.NESTED.value)
+        if board_format not in BoardFormats.values:
+            return JsonResponse(
+                {"error": f"Unknown board format '{board_format}'"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         try:
-            response = self.__get_match_query.handle(match_id, user)
+            response = self.__get_match_query.handle(match_id, user, board_format)
         except NotInGameException:
             return JsonResponse(
                 {
@@ -156,10 +210,18 @@ class GetMatchView(APIView):
             return JsonResponse(
                 {"error": "Match not found"}, status=status.HTTP_404_NOT_FOUND
             )
+        except BoardCodeTooLargeException:
+            return JsonResponse(
+                {"error": "The board is too large for the 'code' format"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         response_data = {
             "status": response.status,
             "number_of_movements": response.number_of_movements,
+            "width": response.width,
+            "height": response.height,
+            "line_length": response.line_length,
             "board": response.board,
             "first_player_id": response.first_player.id,
             "first_player_username": response.first_player.username,
@@ -6,6 +6,7 @@ from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
 from rest_framework.generics import ListAPIView
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 from core.application.get_matches.get_matches_query import GetMatchesQuery
 from core.dependency_injection_factories.application.get_matches.get_matches_query_factory import (
@@ -18,6 +19,7 @@ from core.domain.exceptions.user_authentication_exception import (
     UserAuthenticationException,
 )
 from core.domain.models.match import MatchSerializer
+from core.domain.models.user import User
 from core.infrastructure.verifiers.user_authentication_verifier import (
     UserAuthenticationVerifier,
 )
@@ -46,6 +48,16 @@ class GetMatchesView(ListAPIView):
         operation_summary="Get information about a match",
         operation_description="This endpoint gets the information about a match if the user is one of the players",
         security=[{"Bearer": []}],
+        manual_parameters=[
+            openapi.Parameter(
+                "after",
+                openapi.IN_QUERY,
+                description="Switches to cursor pagination and returns the matches with "
+                "an id greater than this one. Use 0 to get the first page and follow "
+                "'next' to get the rest",
+                type=openapi.TYPE_INTEGER,
+            ),
+        ],
         responses={
             200: openapi.Response(
                 description="Matches retrieved successfully",
@@ -59,11 +71,15 @@ class GetMatchesView(ListAPIView):
                         "next": openapi.Schema(
                             type=openapi.TYPE_STRING,
                             example="http://localhost:8000/matches/all/?page=2",
+                            description="When paginating with a cursor, the page after "
+                            "the last match of this one",
                             nullable=True,
                         ),
                         "previous": openapi.Schema(
                             type=openapi.TYPE_STRING,
                             example="http://localhost:8000/matches/all/?page=2",
+                            description="Always null when paginating with a cursor, "
+                            "which only moves forward",
                             nullable=True,
                         ),
                         "results": openapi.Schema(
@@ -89,6 +105,18 @@ class GetMatchesView(ListAPIView):
                     },
                 ),
             ),
+            400: openapi.Response(
+                description="Could not get due to an invalid cursor",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="The cursor must be a non negative integer",
+                        ),
+                    },
+                ),
+            ),
             401: openapi.Response(
                 description="Could not get due to authentication issues",
                 schema=openapi.Schema(
@@ -111,6 +139,10 @@ class GetMatchesView(ListAPIView):
                 {"error": "Authentication failed"}, status=status.HTTP_401_UNAUTHORIZED
             )
 
+        after_match_id = request.GET.get("after")
+        if after_match_id is not None:
+            return self.__get_page_after(request, user, after_match_id)
+
         response = self.__get_matches_query.handle(user.id)
 
         queryset = self.filter_queryset(response.matches)
@@ -122,3 +154,34 @@ class GetMatchesView(ListAPIView):
 
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
+
+    def __get_page_after(
+        self, request: HttpRequest, user: User, after_match_id: str
+    ) -> Response:
+        if after_match_id.isdigit() is False:
+            return Response(
+                {"error": "The cursor must be a non negative integer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        page_size = self.paginator.page_size
+        response = self.__get_matches_query.handle(
+            user.id, int(after_match_id), page_size + 1
+        )
+        matches = response.matches[:page_size]
+
+        next_page = None
+        if len(response.matches) > page_size:
+            next_page = replace_query_param(
+                request.build_absolute_uri(), "after", matches[-1].id
+            )
+
+        serializer = self.get_serializer(matches, many=True)
+        return Response(
+            {
+                "count": user.matches_total,
+                "next": next_page,
+                "previous": None,
+                "results": serializer.data,
+            }
+        )
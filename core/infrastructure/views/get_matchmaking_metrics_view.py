@@ -0,0 +1,112 @@
+from dataclasses import asdict
+from typing import Optional
+
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.views import APIView
+
+from core.dependency_injection_factories.infrastructure.matchmaking.matchmaking_queue_factory import (
+    MatchmakingQueueFactory,
+)
+from core.dependency_injection_factories.infrastructure.verifiers.user_authentication_verifier_factory import (
+    UserAuthenticationVerifierFactory,
+)
+from core.domain.exceptions.user_authentication_exception import (
+    UserAuthenticationException,
+)
+from core.infrastructure.matchmaking.matchmaking_queue import MatchmakingQueue
+from core.infrastructure.verifiers.user_authentication_verifier import (
+    UserAuthenticationVerifier,
+)
+
+
+class GetMatchmakingMetricsView(APIView):
+    __slots__ = ("__matchmaking_queue", "__user_auth_verifier")
+
+    def __init__(
+        self,
+        matchmaking_queue: Optional[MatchmakingQueue] = None,
+        user_auth_verifier: Optional[UserAuthenticationVerifier] = None,
+        *args,
+        **kwargs,
+    ):
+        self.__matchmaking_queue = matchmaking_queue or MatchmakingQueueFactory.create()
+        self.__user_auth_verifier = (
+            user_auth_verifier or UserAuthenticationVerifierFactory.create()
+        )
+
+        super().__init__(*args, **kwargs)
+
+    @swagger_auto_schema(
+        operation_summary="Get the matchmaking metrics",
+        operation_description="This endpoint gets the depth of the matchmaking queue, how "
+        "many tickets were paired, cancelled or expired and the percentiles in seconds "
+        "of the latest waits until pairing",
+        security=[{"Bearer": []}],
+        responses={
+            200: openapi.Response(
+                description="Metrics retrieved successfully",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "queue_depth": openapi.Schema(
+                            type=openapi.TYPE_INTEGER,
+                            example=3,
+                        ),
+                        "paired": openapi.Schema(
+                            type=openapi.TYPE_INTEGER,
+                            example=120,
+                        ),
+                        "cancelled": openapi.Schema(
+                            type=openapi.TYPE_INTEGER,
+                            example=4,
+                        ),
+                        "expired": openapi.Schema(
+                            type=openapi.TYPE_INTEGER,
+                            example=1,
+                        ),
+                        "wait_time_p50": openapi.Schema(
+                            type=openapi.TYPE_NUMBER,
+                            example=0.8,
+                            nullable=True,
+                        ),
+                        "wait_time_p90": openapi.Schema(
+                            type=openapi.TYPE_NUMBER,
+                            example=4.2,
+                            nullable=True,
+                        ),
+                        "wait_time_p99": openapi.Schema(
+                            type=openapi.TYPE_NUMBER,
+                            example=12.5,
+                            nullable=True,
+                        ),
+                    },
+                ),
+            ),
+            401: openapi.Response(
+                description="Could not get due to authentication issues",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="Authentication failed",
+                        ),
+                    },
+                ),
+            ),
+        },
+    )
+    def get(self, request: HttpRequest) -> HttpResponse:
+        try:
+            self.__user_auth_verifier.verify_principal(request)
+        except UserAuthenticationException:
+            return JsonResponse(
+                {"error": "Authentication failed"}, status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        return JsonResponse(
+            asdict(self.__matchmaking_queue.metrics()), status=status.HTTP_200_OK
+        )
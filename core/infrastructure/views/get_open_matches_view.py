@@ -0,0 +1,175 @@
+from typing import Optional
+
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+
+from core.application.get_open_matches.get_open_matches_query import (
+    GetOpenMatchesQuery,
+)
+from core.dependency_injection_factories.application.get_open_matches.get_open_matches_query_factory import (
+    GetOpenMatchesQueryFactory,
+)
+from core.dependency_injection_factories.infrastructure.verifiers.user_authentication_verifier_factory import (
+    UserAuthenticationVerifierFactory,
+)
+from core.domain.exceptions.user_authentication_exception import (
+    UserAuthenticationException,
+)
+from core.infrastructure.verifiers.user_authentication_verifier import (
+    UserAuthenticationVerifier,
+)
+
+
+class GetOpenMatchesView(APIView):
+    __slots__ = ("__get_open_matches_query", "__user_auth_verifier")
+
+    def __init__(
+        self,
+        get_open_matches_query: Optional[GetOpenMatchesQuery] = None,
+        user_auth_verifier: Optional[UserAuthenticationVerifier] = None,
+        *args,
+        **kwargs,
+    ):
+        self.__get_open_matches_query = (
+            get_open_matches_query or GetOpenMatchesQueryFactory.create()
+        )
+        self.__user_auth_verifier = (
+            user_auth_verifier or UserAuthenticationVerifierFactory.create()
+        )
+
+        super().__init__(*args, **kwargs)
+
+    @swagger_auto_schema(
+        operation_summary="Get the matches waiting for a guest",
+        operation_description="This endpoint lists the awaiting matches, newest first",
+        security=[{"Bearer": []}],
+        manual_parameters=[
+            openapi.Parameter(
+                "before",
+                openapi.IN_QUERY,
+                description="Returns the open matches with an id lower than this one. "
+                "Follow 'next' to get the following pages",
+                type=openapi.TYPE_INTEGER,
+            ),
+        ],
+        responses={
+            200: openapi.Response(
+                description="Open matches retrieved successfully",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "next": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="http://localhost:8000/matches/open/?before=10",
+                            nullable=True,
+                        ),
+                        "results": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    "id": openapi.Schema(
+                                        type=openapi.TYPE_INTEGER,
+                                        example=1,
+                                    ),
+                                    "width": openapi.Schema(
+                                        type=openapi.TYPE_INTEGER,
+                                        example=3,
+                                    ),
+                                    "height": openapi.Schema(
+                                        type=openapi.TYPE_INTEGER,
+                                        example=3,
+                                    ),
+                                    "line_length": openapi.Schema(
+                                        type=openapi.TYPE_INTEGER,
+                                        example=3,
+                                    ),
+                                    "first_player_id": openapi.Schema(
+                                        type=openapi.TYPE_INTEGER,
+                                        example=0,
+                                    ),
+                                    "first_player_username": openapi.Schema(
+                                        type=openapi.TYPE_STRING,
+                                        example="user1",
+                                    ),
+                                },
+                            ),
+                        ),
+                    },
+                ),
+            ),
+            400: openapi.Response(
+                description="Could not get due to an invalid cursor",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="The cursor must be a non negative integer",
+                        ),
+                    },
+                ),
+            ),
+            401: openapi.Response(
+                description="Could not get due to authentication issues",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="Authentication failed",
+                        ),
+                    },
+                ),
+            ),
+        },
+    )
+    def get(self, request: HttpRequest) -> HttpResponse:
+        try:
+            self.__user_auth_verifier.verify_principal(request)
+        except UserAuthenticationException:
+            return JsonResponse(
+                {"error": "Authentication failed"}, status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        before_match_id = request.GET.get("before")
+        if before_match_id is not None and before_match_id.isdigit() is False:
+            return JsonResponse(
+                {"error": "The cursor must be a non negative integer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if before_match_id is not None:
+            before_match_id = int(before_match_id)
+
+        page_size = api_settings.PAGE_SIZE
+        response = self.__get_open_matches_query.handle(before_match_id, page_size + 1)
+        matches = response.matches[:page_size]
+
+        next_page = None
+        if len(response.matches) > page_size:
+            next_page = replace_query_param(
+                request.build_absolute_uri(), "before", matches[-1].id
+            )
+
+        return JsonResponse(
+            {
+                "next": next_page,
+                "results": [
+                    {
+                        "id": match.id,
+                        "width": match.width,
+                        "height": match.height,
+                        "line_length": match.line_length,
+                        "first_player_id": match.first_player_id,
+                        "first_player_username": match.first_player.username,
+                    }
+                    for match in matches
+                ],
+            },
+            status=status.HTTP_200_OK,
+        )
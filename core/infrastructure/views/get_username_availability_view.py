@@ -0,0 +1,96 @@
+from typing import Optional
+
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.views import APIView
+
+from core.application.get_username_availability.get_username_availability_query import (
+    GetUsernameAvailabilityQuery,
+)
+from core.dependency_injection_factories.application.get_username_availability.get_username_availability_query_factory import (
+    GetUsernameAvailabilityQueryFactory,
+)
+from core.domain.models.user import User
+
+
+class GetUsernameAvailabilityView(APIView):
+    __slots__ = "__get_username_availability_query"
+
+    def __init__(
+        self,
+        get_username_availability_query: Optional[GetUsernameAvailabilityQuery] = None,
+        *args,
+        **kwargs,
+    ):
+        self.__get_username_availability_query = (
+            get_username_availability_query
+            or GetUsernameAvailabilityQueryFactory.create()
+        )
+
+        super().__init__(*args, **kwargs)
+
+    @swagger_auto_schema(
+        operation_summary="Check if a username is available",
+        operation_description="This endpoint tells whether a username can still be used "
+        "to create a new user. Another user may take it before the creation, so the "
+        "creation can still fail",
+        manual_parameters=[
+            openapi.Parameter(
+                "username",
+                openapi.IN_QUERY,
+                description="Username to check",
+                type=openapi.TYPE_STRING,
+                required=True,
+            ),
+        ],
+        responses={
+            200: openapi.Response(
+                description="Availability retrieved successfully",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "username": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="user1",
+                        ),
+                        "available": openapi.Schema(
+                            type=openapi.TYPE_BOOLEAN,
+                            example=True,
+                        ),
+                    },
+                ),
+            ),
+            400: openapi.Response(
+                description="Could not check due to an invalid username",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="The username must have between 1 and 30 characters",
+                        ),
+                    },
+                ),
+            ),
+        },
+    )
+    def get(self, request: HttpRequest) -> HttpResponse:
+        username = request.GET.get("username")
+        maximum_length = User._meta.get_field("username").max_length
+        if not username or len(username) > maximum_length:
+            return JsonResponse(
+                {
+                    "error": "The username must have between 1 and "
+                    f"{maximum_length} characters"
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        response = self.__get_username_availability_query.handle(username)
+
+        return JsonResponse(
+            {"username": username, "available": response.available},
+            status=status.HTTP_200_OK,
+        )
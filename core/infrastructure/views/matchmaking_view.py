@@ -0,0 +1,244 @@
+from typing import Optional
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.dependency_injection_factories.infrastructure.matchmaking.matchmaking_queue_factory import (
+    MatchmakingQueueFactory,
+)
+from core.dependency_injection_factories.infrastructure.verifiers.user_authentication_verifier_factory import (
+    UserAuthenticationVerifierFactory,
+)
+from core.domain.exceptions.matchmaking_already_paired_exception import (
+    MatchmakingAlreadyPairedException,
+)
+from core.domain.exceptions.matchmaking_cancelled_exception import (
+    MatchmakingCancelledException,
+)
+from core.domain.exceptions.matchmaking_queue_full_exception import (
+    MatchmakingQueueFullException,
+)
+from core.domain.exceptions.matchmaking_ticket_not_found_exception import (
+    MatchmakingTicketNotFoundException,
+)
+from core.domain.exceptions.matchmaking_timeout_exception import (
+    MatchmakingTimeoutException,
+)
+from core.domain.exceptions.user_authentication_exception import (
+    UserAuthenticationException,
+)
+from core.infrastructure.matchmaking.matchmaking_queue import MatchmakingQueue
+from core.infrastructure.verifiers.user_authentication_verifier import (
+    UserAuthenticationVerifier,
+)
+
+
+class MatchmakingView(APIView):
+    __slots__ = ("__matchmaking_queue", "__user_auth_verifier", "__poll_timeout")
+
+    def __init__(
+        self,
+        matchmaking_queue: Optional[MatchmakingQueue] = None,
+        user_auth_verifier: Optional[UserAuthenticationVerifier] = None,
+        poll_timeout: Optional[float] = None,
+        *args,
+        **kwargs,
+    ):
+        self.__matchmaking_queue = matchmaking_queue or MatchmakingQueueFactory.create()
+        self.__user_auth_verifier = (
+            user_auth_verifier or UserAuthenticationVerifierFactory.create()
+        )
+        self.__poll_timeout = (
+            settings.MATCHMAKING_POLL_TIMEOUT if poll_timeout is None else poll_timeout
+        )
+
+        super().__init__(*args, **kwargs)
+
+    @swagger_auto_schema(
+        operation_summary="Wait for an opponent",
+        operation_description="This endpoint puts the user in the matchmaking queue and "
+        "holds the request until another player is paired with them. Players are "
+        "paired in arrival order and the match is created already in progress. If no "
+        "opponent arrives before the poll timeout the user stays queued and the "
+        "request must be repeated to keep waiting",
+        security=[{"Bearer": []}],
+        responses={
+            201: openapi.Response(
+                description="Paired with an opponent",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "match_id": openapi.Schema(
+                            type=openapi.TYPE_INTEGER,
+                            example=5,
+                        ),
+                    },
+                ),
+            ),
+            202: openapi.Response(
+                description="Still waiting for an opponent",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "status": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="queued",
+                        ),
+                    },
+                ),
+            ),
+            401: openapi.Response(
+                description="Could not queue due to authentication issues",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="Authentication failed",
+                        ),
+                    },
+                ),
+            ),
+            408: openapi.Response(
+                description="No opponent was found in time",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="No opponent found in time",
+                        ),
+                    },
+                ),
+            ),
+            409: openapi.Response(
+                description="The user left the queue while waiting",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="Matchmaking was cancelled",
+                        ),
+                    },
+                ),
+            ),
+            503: openapi.Response(
+                description="Could not queue because the queue is full",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="The matchmaking queue is full",
+                        ),
+                    },
+                ),
+            ),
+        },
+    )
+    def post(self, request: HttpRequest) -> HttpResponse:
+        try:
+            user = self.__user_auth_verifier.verify_principal(request)
+        except UserAuthenticationException:
+            return JsonResponse(
+                {"error": "Authentication failed"}, status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        try:
+            ticket = self.__matchmaking_queue.enqueue(user)
+        except MatchmakingQueueFullException:
+            return JsonResponse(
+                {"error": "The matchmaking queue is full"},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+
+        try:
+            match_id = self.__matchmaking_queue.wait(ticket, self.__poll_timeout)
+        except MatchmakingTimeoutException:
+            return JsonResponse(
+                {"error": "No opponent found in time"},
+                status=status.HTTP_408_REQUEST_TIMEOUT,
+            )
+        except MatchmakingCancelledException:
+            return JsonResponse(
+                {"error": "Matchmaking was cancelled"}, status=status.HTTP_409_CONFLICT
+            )
+
+        if match_id is None:
+            return JsonResponse({"status": "queued"}, status=status.HTTP_202_ACCEPTED)
+
+        return JsonResponse({"match_id": match_id}, status=status.HTTP_201_CREATED)
+
+    @swagger_auto_schema(
+        operation_summary="Leave the matchmaking queue",
+        operation_description="This endpoint removes the user from the matchmaking queue. "
+        "A request waiting for an opponent is answered straight away",
+        security=[{"Bearer": []}],
+        responses={
+            204: openapi.Response(description="Left the queue successfully"),
+            401: openapi.Response(
+                description="Could not leave due to authentication issues",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="Authentication failed",
+                        ),
+                    },
+                ),
+            ),
+            409: openapi.Response(
+                description="Could not leave because the user was already paired",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="User already paired with an opponent",
+                        ),
+                    },
+                ),
+            ),
+            404: openapi.Response(
+                description="Could not leave because the user is not queued",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="User not in the matchmaking queue",
+                        ),
+                    },
+                ),
+            ),
+        },
+    )
+    def delete(self, request: HttpRequest) -> HttpResponse:
+        try:
+            user = self.__user_auth_verifier.verify_principal(request)
+        except UserAuthenticationException:
+            return JsonResponse(
+                {"error": "Authentication failed"}, status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        try:
+            self.__matchmaking_queue.cancel(user)
+        except MatchmakingAlreadyPairedException:
+            return JsonResponse(
+                {"error": "User already paired with an opponent"},
+                status=status.HTTP_409_CONFLICT,
+            )
+        except MatchmakingTicketNotFoundException:
+            return JsonResponse(
+                {"error": "User not in the matchmaking queue"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,111 @@
+from typing import Optional
+
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.views import APIView
+
+from core.application.join_any_match.join_any_match_command import (
+    JoinAnyMatchCommand,
+)
+from core.application.join_any_match.join_any_match_command_info import (
+    JoinAnyMatchCommandInfo,
+)
+from core.dependency_injection_factories.application.join_any_match.join_any_match_command_factory import (
+    JoinAnyMatchCommandFactory,
+)
+from core.dependency_injection_factories.infrastructure.verifiers.user_authentication_verifier_factory import (
+    UserAuthenticationVerifierFactory,
+)
+from core.domain.exceptions.open_match_not_found_exception import (
+    OpenMatchNotFoundException,
+)
+from core.domain.exceptions.user_authentication_exception import (
+    UserAuthenticationException,
+)
+from core.infrastructure.verifiers.user_authentication_verifier import (
+    UserAuthenticationVerifier,
+)
+
+
+class PostJoinAnyView(APIView):
+    __slots__ = ("__join_any_match_command", "__user_auth_verifier")
+
+    def __init__(
+        self,
+        join_any_match_command: Optional[JoinAnyMatchCommand] = None,
+        user_auth_verifier: Optional[UserAuthenticationVerifier] = None,
+        *args,
+        **kwargs
+    ):
+        self.__join_any_match_command = (
+            join_any_match_command or JoinAnyMatchCommandFactory.create()
+        )
+        self.__user_auth_verifier = (
+            user_auth_verifier or UserAuthenticationVerifierFactory.create()
+        )
+
+        super().__init__(*args, **kwargs)
+
+    @swagger_auto_schema(
+        operation_summary="Join the oldest awaiting match",
+        operation_description="This endpoint joins the oldest match in 'awaiting' status "
+        "that was not created by the user and starts it. Concurrent requests never "
+        "join the same match",
+        security=[{"Bearer": []}],
+        responses={
+            200: openapi.Response(
+                description="Joined to match successfully",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "match_id": openapi.Schema(
+                            type=openapi.TYPE_INTEGER,
+                            example=5,
+                        ),
+                    },
+                ),
+            ),
+            401: openapi.Response(
+                description="Could not join due to authentication issues",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="Authentication failed",
+                        ),
+                    },
+                ),
+            ),
+            404: openapi.Response(
+                description="Could not join because there are no open matches",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="No open match found",
+                        ),
+                    },
+                ),
+            ),
+        },
+    )
+    def post(self, request: HttpRequest) -> HttpResponse:
+        try:
+            guest = self.__user_auth_verifier.verify_principal(request)
+        except UserAuthenticationException:
+            return JsonResponse(
+                {"error": "Authentication failed"}, status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        try:
+            self.__join_any_match_command.handle(guest)
+        except OpenMatchNotFoundException:
+            return JsonResponse(
+                {"error": "No open match found"}, status=status.HTTP_404_NOT_FOUND
+            )
+        except JoinAnyMatchCommandInfo as info:
+            return JsonResponse({"match_id": info.match_id}, status=status.HTTP_200_OK)
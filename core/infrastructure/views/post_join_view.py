@@ -92,7 +92,7 @@ class PostJoinView(APIView):
     )
     def post(self, request: HttpRequest, match_id: int) -> HttpResponse:
         try:
-            guest = self.__user_auth_verifier.verify(request)
+            guest = self.__user_auth_verifier.verify_principal(request)
         except UserAuthenticationException:
             return JsonResponse(
                 {"error": "Authentication failed"}, status=status.HTTP_401_UNAUTHORIZED
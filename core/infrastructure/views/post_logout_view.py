@@ -0,0 +1,108 @@
+import json
+from typing import Optional
+
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from django.http import HttpRequest, JsonResponse, HttpResponse
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from voluptuous import Schema, Optional as OptionalKey, MultipleInvalid, Invalid
+
+from core.application.logout_user.logout_user_command import LogoutUserCommand
+from core.dependency_injection_factories.application.logout_user.logout_user_command_factory import (
+    LogoutUserCommandFactory,
+)
+from core.domain.exceptions.jwt_verification_exception import JWTVerificationException
+
+
+class PostLogoutView(APIView):
+    __slots__ = ("__logout_user_command", "schema")
+
+    def __init__(
+        self,
+        logout_user_command: Optional[LogoutUserCommand] = None,
+        *args,
+        **kwargs,
+    ):
+        self.schema = Schema(
+            {
+                OptionalKey("refresh_token"): str,
+            }
+        )
+        self.__logout_user_command = (
+            logout_user_command or LogoutUserCommandFactory.create()
+        )
+
+        super().__init__(*args, **kwargs)
+
+    @swagger_auto_schema(
+        operation_summary="Logs out a user",
+        operation_description="This endpoint revokes the access token used to call it and, "
+        "if it is sent, the refresh token of the same user. Revoked tokens are rejected "
+        "by every endpoint even before they expire",
+        security=[{"Bearer": []}],
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "refresh_token": openapi.Schema(
+                    type=openapi.TYPE_STRING,
+                    description="Refresh token to revoke",
+                    example="eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJ1c2VyX2lkIjoyLCJleHAiOjAsImlhdC"
+                    "I6MCwicmVmcmVzaF90b2tlbiI6dHJ1ZX0.tqIK9Sldk_Nn2HHZYh-tanXmKegV0RFfrWHsuAG_pO8",
+                ),
+            },
+        ),
+        responses={
+            204: openapi.Response(description="User logged out successfully"),
+            400: openapi.Response(
+                description="User could not be logged out due to errors in the schema",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="Invalid schema",
+                        ),
+                    },
+                ),
+            ),
+            401: openapi.Response(
+                description="User could not be logged out due to invalid tokens",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="Authentication failed",
+                        ),
+                    },
+                ),
+            ),
+        },
+    )
+    def post(self, request: HttpRequest) -> HttpResponse:
+        authorization_header: Optional[str] = request.META.get(
+            "HTTP_AUTHORIZATION", None
+        )
+        if authorization_header is None:
+            return JsonResponse(
+                {"error": "Authentication failed"}, status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        try:
+            data = json.loads(request.body or "{}")
+            self.schema(data)
+        except (MultipleInvalid, Invalid, json.JSONDecodeError) as e:
+            return JsonResponse({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            self.__logout_user_command.handle(
+                authorization_header.split(" ")[-1], data.get("refresh_token")
+            )
+        except JWTVerificationException:
+            return JsonResponse(
+                {"error": "Authentication failed"}, status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -1,10 +1,12 @@
-from typing import Optional
+import json
+from typing import Any, Optional
 
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
 from rest_framework.views import APIView
+from voluptuous import All, Invalid, MultipleInvalid, Range, Required, Schema
 
 from core.application.create_match.create_match_command import CreateMatchCommand
 from core.application.create_match.create_match_command_info import (
@@ -19,13 +21,14 @@ from core.dependency_injection_factories.infrastructure.verifiers.user_authentic
 from core.domain.exceptions.user_authentication_exception import (
     UserAuthenticationException,
 )
+from core.domain.models.match import CLASSIC_BOARD_SIZE, MAXIMUM_BOARD_SIZE
 from core.infrastructure.verifiers.user_authentication_verifier import (
     UserAuthenticationVerifier,
 )
 
 
 class PostMatchView(APIView):
-    __slots__ = ("__create_match_command", "__user_auth_verifier")
+    __slots__ = ("__create_match_command", "schema", "__user_auth_verifier")
 
     def __init__(
         self,
@@ -37,6 +40,17 @@ class PostMatchView(APIView):
         self.__create_match_command = (
             create_match_command or CreateMatchCommandFactory.create()
         )
+        board_size = All(int, Range(min=CLASSIC_BOARD_SIZE, max=MAXIMUM_BOARD_SIZE))
+        self.schema = Schema(
+            All(
+                {
+                    Required("width", default=CLASSIC_BOARD_SIZE): board_size,
+                    Required("height", default=CLASSIC_BOARD_SIZE): board_size,
+                    Required("line_length", default=CLASSIC_BOARD_SIZE): board_size,
+                },
+                self.__validate_line_length,
+            )
+        )
         self.__user_auth_verifier = (
             user_auth_verifier or UserAuthenticationVerifierFactory.create()
         )
@@ -46,6 +60,26 @@ class PostMatchView(APIView):
     @swagger_auto_schema(
         operation_summary="Create a new match",
         operation_description="This endpoint creates a new match with the requester user as creator",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "width": openapi.Schema(
+                    type=openapi.TYPE_INTEGER,
+                    description="Number of slots in the x axis",
+                    example=15,
+                ),
+                "height": openapi.Schema(
+                    type=openapi.TYPE_INTEGER,
+                    description="Number of slots in the y axis",
+                    example=15,
+                ),
+                "line_length": openapi.Schema(
+                    type=openapi.TYPE_INTEGER,
+                    description="Number of slots in a row needed to win",
+                    example=5,
+                ),
+            },
+        ),
         security=[{"Bearer": []}],
         responses={
             201: openapi.Response(
@@ -60,6 +94,18 @@ class PostMatchView(APIView):
                     },
                 ),
             ),
+            400: openapi.Response(
+                description="Match could not be created due to an error in the request",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="value must be at most 19 for dictionary value @ data['width']",
+                        ),
+                    },
+                ),
+            ),
             401: openapi.Response(
                 description="Match could not be created due to authentication issues",
                 schema=openapi.Schema(
@@ -76,15 +122,31 @@ class PostMatchView(APIView):
     )
     def post(self, request: HttpRequest) -> HttpResponse:
         try:
-            user = self.__user_auth_verifier.verify(request)
+            user = self.__user_auth_verifier.verify_principal(request)
         except UserAuthenticationException:
             return JsonResponse(
                 {"error": "Authentication failed"}, status=status.HTTP_401_UNAUTHORIZED
             )
 
         try:
-            self.__create_match_command.handle(user)
+            data = {}
+            if request.content_type == "application/json" and request.body:
+                data = json.loads(request.body)
+            data = self.schema(data)
+        except (MultipleInvalid, Invalid, json.JSONDecodeError) as e:
+            return JsonResponse({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            self.__create_match_command.handle(
+                user, data["width"], data["height"], data["line_length"]
+            )
         except CreateMatchCommandInfo as info:
             return JsonResponse(
                 {"match_id": info.match_id}, status=status.HTTP_201_CREATED
             )
+
+    def __validate_line_length(self, data: dict[str, Any]) -> dict[str, Any]:
+        if data["line_length"] > max(data["width"], data["height"]):
+            raise Invalid("line_length cannot be greater than the board size")
+
+        return data
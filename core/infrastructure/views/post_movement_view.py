@@ -17,6 +17,9 @@ from core.dependency_injection_factories.application.make_movement.make_movement
 from core.dependency_injection_factories.infrastructure.verifiers.user_authentication_verifier_factory import (
     UserAuthenticationVerifierFactory,
 )
+from core.domain.exceptions.concurrent_movement_exception import (
+    ConcurrentMovementException,
+)
 from core.domain.exceptions.illegal_movement_exception import IllegalMovementException
 from core.domain.exceptions.invalid_turn_exception import InvalidTurnException
 from core.domain.exceptions.match_not_accepting_movements_exception import (
@@ -136,11 +139,23 @@ class PostMovementView(APIView):
                     },
                 ),
             ),
+            409: openapi.Response(
+                description="The match kept changing while the movement was being made",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "error": openapi.Schema(
+                            type=openapi.TYPE_STRING,
+                            example="The match was modified concurrently, try again",
+                        ),
+                    },
+                ),
+            ),
         },
     )
     def post(self, request: HttpRequest, match_id: int) -> HttpResponse:
         try:
-            player = self.__user_auth_verifier.verify(request)
+            player = self.__user_auth_verifier.verify_principal(request)
         except UserAuthenticationException:
             return JsonResponse(
                 {"error": "Authentication failed"}, status=status.HTTP_401_UNAUTHORIZED
@@ -184,5 +199,10 @@ class PostMovementView(APIView):
             return JsonResponse(
                 {"error": "Match not found"}, status=status.HTTP_404_NOT_FOUND
             )
+        except ConcurrentMovementException:
+            return JsonResponse(
+                {"error": "The match was modified concurrently, try again"},
+                status=status.HTTP_409_CONFLICT,
+            )
 
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -49,7 +49,8 @@ class PostRefreshView(APIView):
         operation_summary="Refreshes the access token",
         operation_description="This endpoint refreshes the access token. It is only needed the "
         "refresh token. If everything is correct the endpoint will refresh the access token"
-        " returning the new access and refresh tokens",
+        " returning the new access and refresh tokens. Each refresh token can be used only "
+        "once, using it again revokes every refresh token issued since the same login",
         request_body=openapi.Schema(
             type=openapi.TYPE_OBJECT,
             properties={
@@ -111,7 +112,9 @@ class PostRefreshView(APIView):
             )
         except RefreshTokenCommandInfo as info:
             access_token = self.__jwt_generator.generate(info.user)
-            refresh_token = self.__jwt_generator.generate(info.user, refresh_token=True)
+            refresh_token = self.__jwt_generator.generate(
+                info.user, refresh_token=True, family=info.family, jti=info.jti
+            )
             return JsonResponse(
                 {"access_token": access_token, "refresh_token": refresh_token},
                 status=status.HTTP_200_OK,
@@ -118,7 +118,9 @@ class PostUserView(APIView):
             )
         except RegisterUserCommandInfo as info:
             access_token = self.__jwt_generator.generate(info.user)
-            refresh_token = self.__jwt_generator.generate(info.user, refresh_token=True)
+            refresh_token = self.__jwt_generator.generate(
+                info.user, refresh_token=True, family=info.family, jti=info.jti
+            )
             return JsonResponse(
                 {"access_token": access_token, "refresh_token": refresh_token},
                 status=status.HTTP_201_CREATED,
@@ -0,0 +1,111 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Optional
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.models import Max, Min
+
+from core.dependency_injection_factories.infrastructure.auditors.match_auditor_factory import (
+    MatchAuditorFactory,
+)
+from core.domain.models.match import Match
+from core.infrastructure.auditors.match_mismatch import MatchMismatch
+
+
+def _audit_range(
+    first_match_id: Optional[int],
+    last_match_id: Optional[int],
+    chunk_size: int,
+    fix: bool,
+) -> tuple[int, list[MatchMismatch]]:
+    match_auditor = MatchAuditorFactory.create()
+    number_of_matches, mismatches = match_auditor.audit(
+        first_match_id, last_match_id, chunk_size
+    )
+
+    if fix is True and mismatches:
+        match_auditor.fix(mismatches)
+
+    return number_of_matches, mismatches
+
+
+class Command(BaseCommand):
+    help = "Recomputes the winner and status of every match from its movements"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Store the expected winner and status of the mismatched matches",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=10_000,
+            help="Number of rows fetched and classified at once",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes that audit disjoint ranges of matches",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        fix = options["fix"]
+        workers = options["workers"]
+
+        if workers <= 1:
+            number_of_matches, mismatches = _audit_range(None, None, chunk_size, fix)
+        else:
+            number_of_matches, mismatches = self.__audit_in_parallel(
+                workers, chunk_size, fix
+            )
+
+        for mismatch in mismatches:
+            self.stdout.write(
+                f"Match {mismatch.match_id}: stored {mismatch.stored_status} "
+                f"({mismatch.stored_winner}), expected {mismatch.expected_status} "
+                f"({mismatch.expected_winner})"
+            )
+
+        action = "fixed" if fix is True else "found"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Audited {number_of_matches} matches, "
+                f"{action} {len(mismatches)} mismatches"
+            )
+        )
+
+    def __audit_in_parallel(
+        self, workers: int, chunk_size: int, fix: bool
+    ) -> tuple[int, list[MatchMismatch]]:
+        match_ids = Match.objects.aggregate(first=Min("id"), last=Max("id"))
+        if match_ids["first"] is None:
+            return 0, []
+
+        range_size = (match_ids["last"] - match_ids["first"]) // workers + 1
+        ranges = [
+            (first_match_id, first_match_id + range_size - 1)
+            for first_match_id in range(
+                match_ids["first"], match_ids["last"] + 1, range_size
+            )
+        ]
+
+        connections.close_all()
+        with ProcessPoolExecutor(workers, mp_context=get_context("fork")) as executor:
+            results = list(
+                executor.map(
+                    _audit_range,
+                    *zip(*ranges),
+                    [chunk_size] * len(ranges),
+                    [fix] * len(ranges),
+                )
+            )
+
+        number_of_matches = sum(result[0] for result in results)
+        mismatches = [mismatch for result in results for mismatch in result[1]]
+
+        return number_of_matches, mismatches
@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.dependency_injection_factories.infrastructure.solvers.game_state_table_writer_factory import (
+    GameStateTableWriterFactory,
+)
+
+
+class Command(BaseCommand):
+    help = "Solves every reachable classic position and writes the game-state table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path",
+            default=settings.GAME_STATE_TABLE_PATH,
+            help="File where the table is written",
+        )
+
+    def handle(self, *args, **options):
+        number_of_positions = GameStateTableWriterFactory.create().write(
+            options["path"]
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote {number_of_positions} positions to {options['path']}"
+            )
+        )
@@ -0,0 +1,157 @@
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import get_context
+from typing import Iterator, Optional, TextIO
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from core.dependency_injection_factories.infrastructure.repositories.db_user_repository_factory import (
+    DbUserRepositoryFactory,
+)
+from core.domain.models.user import User
+
+FORMATS = ("csv", "ndjson")
+
+
+def _read_csv(stream: TextIO) -> Iterator[tuple[Optional[str], Optional[str]]]:
+    for row in csv.DictReader(stream):
+        yield row.get("username"), row.get("password")
+
+
+def _read_ndjson(stream: TextIO) -> Iterator[tuple[Optional[str], Optional[str]]]:
+    for line in stream:
+        if not line.strip():
+            continue
+
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            yield None, None
+            continue
+
+        if not isinstance(row, dict):
+            yield None, None
+            continue
+
+        yield row.get("username"), row.get("password")
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates users in bulk from a CSV or NDJSON stream of usernames and passwords"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path",
+            help="File with one user per row, or '-' to read from the standard input",
+        )
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            default=None,
+            help="Format of the rows, guessed from the file extension by default",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1_000,
+            help="Number of users hashed and inserted at once",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of processes that hash the passwords",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        row_format = options["format"] or self.__guess_format(path)
+        batch_size = options["batch_size"]
+        workers = options["workers"]
+        user_repository = DbUserRepositoryFactory.create()
+
+        try:
+            stream = sys.stdin if path == "-" else open(path, newline="")
+        except OSError as e:
+            raise CommandError(f"Cannot open '{path}': {e.strerror}")
+        read = _read_csv if row_format == "csv" else _read_ndjson
+
+        number_of_created = 0
+        number_of_conflicts = 0
+        number_of_invalid = 0
+
+        connections.close_all()
+        with stream, ProcessPoolExecutor(
+            workers, mp_context=get_context("fork")
+        ) as executor:
+            rows = enumerate(read(stream), start=1)
+
+            while batch := list(islice(rows, batch_size)):
+                errors = []
+                valid_rows = []
+                for row_number, (username, password) in batch:
+                    if self.__is_valid(username, password) is False:
+                        errors.append((row_number, "invalid username or password"))
+                        continue
+
+                    valid_rows.append((row_number, username, password))
+
+                password_hashes = executor.map(
+                    make_password,
+                    [password for _, _, password in valid_rows],
+                    chunksize=max(1, len(valid_rows) // workers),
+                )
+                conflicts = user_repository.save_many_hashed(
+                    [
+                        (username, password_hash)
+                        for (_, username, _), password_hash in zip(
+                            valid_rows, password_hashes
+                        )
+                    ]
+                )
+
+                for index in conflicts:
+                    row_number, username, _ = valid_rows[index]
+                    errors.append((row_number, f"username '{username}' already exists"))
+
+                for row_number, error in sorted(errors):
+                    self.stdout.write(f"Row {row_number}: {error}")
+
+                number_of_created += len(valid_rows) - len(conflicts)
+                number_of_conflicts += len(conflicts)
+                number_of_invalid += len(batch) - len(valid_rows)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Provisioned {number_of_created} users, "
+                f"{number_of_conflicts} conflicts, {number_of_invalid} invalid rows"
+            )
+        )
+
+    def __guess_format(self, path: str) -> str:
+        extension = os.path.splitext(path)[1].lstrip(".").lower()
+        if extension in ("json", "jsonl", "ndjson"):
+            return "ndjson"
+
+        if extension == "csv" or path == "-":
+            return "csv"
+
+        raise CommandError(f"Cannot guess the format of '{path}', use --format")
+
+    def __is_valid(self, username: Optional[str], password: Optional[str]) -> bool:
+        maximum_length = User._meta.get_field("username").max_length
+
+        return (
+            isinstance(username, str)
+            and 0 < len(username) <= maximum_length
+            and isinstance(password, str)
+            and len(password) > 0
+        )
@@ -0,0 +1,57 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.dependency_injection_factories.infrastructure.repositories.db_token_family_repository_factory import (
+    DbTokenFamilyRepositoryFactory,
+)
+from core.dependency_injection_factories.infrastructure.verifiers.token_revocation_list_factory import (
+    TokenRevocationListFactory,
+)
+from core.dependency_injection_factories.infrastructure.verifiers.user_revocation_set_factory import (
+    UserRevocationSetFactory,
+)
+
+
+class Command(BaseCommand):
+    help = "Deletes the token families and revocations of tokens that have expired"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1_000,
+            help="Number of rows deleted by each statement",
+        )
+        parser.add_argument(
+            "--every",
+            type=float,
+            default=None,
+            help="Keep running and purge again after this many seconds",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        every = options["every"]
+
+        while True:
+            self.__purge(chunk_size)
+
+            if every is None:
+                return
+
+            time.sleep(every)
+
+    def __purge(self, chunk_size: int) -> None:
+        number_of_families = DbTokenFamilyRepositoryFactory.create().purge_expired(
+            chunk_size
+        )
+        number_of_tokens = TokenRevocationListFactory.create().purge_expired(chunk_size)
+        number_of_users = UserRevocationSetFactory.create().purge_expired(chunk_size)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Purged {number_of_families} token families, "
+                f"{number_of_tokens} revoked tokens and {number_of_users} revoked users"
+            )
+        )
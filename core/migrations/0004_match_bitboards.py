@@ -0,0 +1,60 @@
+# Generated by Django 4.2.4 on 2026-10-18 17:28
+
+from django.db import migrations, models
+
+
+def backfill_bitboards(apps, schema_editor):
+    Match = apps.get_model("core", "Match")
+    Movement = apps.get_model("core", "Movement")
+
+    boards = {}
+    movements = Movement.objects.order_by("match_id").values_list(
+        "match_id", "x", "y", "_player"
+    )
+    for match_id, x, y, player in movements.iterator(chunk_size=2000):
+        first_player_board, second_player_board = boards.get(match_id, (0, 0))
+        slot = 1 << (x * 3 + y)
+
+        if player == "first player":
+            first_player_board = first_player_board | slot
+        else:
+            second_player_board = second_player_board | slot
+
+        boards[match_id] = (first_player_board, second_player_board)
+
+    matches = [
+        Match(
+            id=match_id,
+            first_player_board=first_player_board,
+            second_player_board=second_player_board,
+        )
+        for match_id, (first_player_board, second_player_board) in boards.items()
+    ]
+    Match.objects.bulk_update(
+        matches, ["first_player_board", "second_player_board"], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0003_movement"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="match",
+            name="first_player_board",
+            field=models.PositiveSmallIntegerField(
+                default=0, help_text="Bitboard with the slots taken by the first player"
+            ),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="second_player_board",
+            field=models.PositiveSmallIntegerField(
+                default=0,
+                help_text="Bitboard with the slots taken by the second player",
+            ),
+        ),
+        migrations.RunPython(backfill_bitboards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,87 @@
+from django.db import migrations, models
+
+import core.domain.models.bitboard_field
+
+
+def copy_bitboards(apps, schema_editor):
+    Match = apps.get_model("core", "Match")
+
+    matches = []
+    for match in Match.objects.only(
+        "legacy_first_player_board", "legacy_second_player_board"
+    ).iterator(chunk_size=2000):
+        match.first_player_board = match.legacy_first_player_board
+        match.second_player_board = match.legacy_second_player_board
+        matches.append(match)
+
+        if len(matches) == 2000:
+            Match.objects.bulk_update(
+                matches, ["first_player_board", "second_player_board"]
+            )
+            matches = []
+
+    Match.objects.bulk_update(matches, ["first_player_board", "second_player_board"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0004_match_bitboards"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="match",
+            name="width",
+            field=models.PositiveSmallIntegerField(
+                default=3, help_text="Number of slots in the x axis"
+            ),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="height",
+            field=models.PositiveSmallIntegerField(
+                default=3, help_text="Number of slots in the y axis"
+            ),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="line_length",
+            field=models.PositiveSmallIntegerField(
+                default=3, help_text="Number of slots in a row needed to win the match"
+            ),
+        ),
+        migrations.RenameField(
+            model_name="match",
+            old_name="first_player_board",
+            new_name="legacy_first_player_board",
+        ),
+        migrations.RenameField(
+            model_name="match",
+            old_name="second_player_board",
+            new_name="legacy_second_player_board",
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="first_player_board",
+            field=core.domain.models.bitboard_field.BitboardField(
+                default=0, help_text="Bitboard with the slots taken by the first player"
+            ),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="second_player_board",
+            field=core.domain.models.bitboard_field.BitboardField(
+                default=0,
+                help_text="Bitboard with the slots taken by the second player",
+            ),
+        ),
+        migrations.RunPython(copy_bitboards, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name="match",
+            name="legacy_first_player_board",
+        ),
+        migrations.RemoveField(
+            model_name="match",
+            name="legacy_second_player_board",
+        ),
+    ]
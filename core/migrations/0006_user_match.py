@@ -0,0 +1,120 @@
+# Generated by Django 4.2.4 on 2026-10-18 17:49
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_user_matches(apps, schema_editor):
+    Match = apps.get_model("core", "Match")
+    UserMatch = apps.get_model("core", "UserMatch")
+
+    user_matches = []
+    matches = Match.objects.order_by("id").values_list(
+        "id", "first_player_id", "second_player_id", "status"
+    )
+    for match_id, first_player_id, second_player_id, status in matches.iterator(
+        chunk_size=2000
+    ):
+        if first_player_id is not None:
+            user_matches.append(
+                UserMatch(
+                    user_id=first_player_id,
+                    match_id=match_id,
+                    role="first player",
+                    status=status,
+                )
+            )
+        if second_player_id is not None:
+            user_matches.append(
+                UserMatch(
+                    user_id=second_player_id,
+                    match_id=match_id,
+                    role="second player",
+                    status=status,
+                )
+            )
+
+        if len(user_matches) >= 2000:
+            UserMatch.objects.bulk_create(user_matches)
+            user_matches = []
+
+    UserMatch.objects.bulk_create(user_matches)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0005_match_board_dimensions"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserMatch",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "role",
+                    models.CharField(
+                        choices=[
+                            ("first player", "First Player"),
+                            ("second player", "Second Player"),
+                        ],
+                        help_text="Whether the user is the first or the second player of the match",
+                        max_length=100,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("awaiting", "Awaiting"),
+                            ("in progress", "In Progress"),
+                            ("finished", "Finished"),
+                        ],
+                        default="awaiting",
+                        help_text="Copy of the status of the match",
+                        max_length=100,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="usermatch",
+            name="match",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="user_matches",
+                to="core.match",
+            ),
+        ),
+        migrations.AddField(
+            model_name="usermatch",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="user_matches",
+                to="core.user",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="usermatch",
+            index=models.Index(
+                fields=["user", "status", "match"], name="user_match_status_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="usermatch",
+            constraint=models.UniqueConstraint(
+                fields=("user", "match"), name="unique_user_match"
+            ),
+        ),
+        migrations.RunPython(backfill_user_matches, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.4 on 2026-10-18 17:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_user_match"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="match",
+            index=models.Index(
+                condition=models.Q(("status", "awaiting")),
+                fields=["id"],
+                name="match_awaiting_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.4 on 2026-10-18 18:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_match_awaiting_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RevokedUser",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "user_id",
+                    models.PositiveBigIntegerField(
+                        help_text="Id of the user whose tokens are no longer accepted",
+                        unique=True,
+                    ),
+                ),
+                (
+                    "revoked_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="When the tokens of the user were revoked",
+                    ),
+                ),
+            ],
+        ),
+    ]
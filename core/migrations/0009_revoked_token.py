@@ -0,0 +1,48 @@
+# Generated by Django 4.2.4 on 2026-10-18 18:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0008_revoked_user"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RevokedToken",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "jti",
+                    models.CharField(
+                        help_text="Unique id claim of the revoked token",
+                        max_length=32,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "expires_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        help_text="When the revoked token would have expired",
+                    ),
+                ),
+                (
+                    "revoked_at",
+                    models.DateTimeField(
+                        auto_now_add=True, help_text="When the token was revoked"
+                    ),
+                ),
+            ],
+        ),
+    ]
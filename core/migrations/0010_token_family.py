@@ -0,0 +1,53 @@
+# Generated by Django 4.2.4 on 2026-10-18 18:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_revoked_token"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TokenFamily",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "family_hash",
+                    models.BigIntegerField(
+                        help_text="64-bit digest of the family claim shared by the refresh tokens issued since a login",
+                        unique=True,
+                    ),
+                ),
+                (
+                    "user_id",
+                    models.PositiveBigIntegerField(
+                        help_text="Id of the logged in user"
+                    ),
+                ),
+                (
+                    "token_hash",
+                    models.BigIntegerField(
+                        help_text="64-bit digest of the jti of the only refresh token of the family that is still accepted"
+                    ),
+                ),
+                (
+                    "expires_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        help_text="When the last refresh token of the family expires",
+                    ),
+                ),
+            ],
+        ),
+    ]
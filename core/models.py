@@ -1,3 +1,7 @@
 from core.domain.models.user import User
 from core.domain.models.match import Match
 from core.domain.models.movement import Movement
+from core.domain.models.user_match import UserMatch
+from core.domain.models.revoked_user import RevokedUser
+from core.domain.models.revoked_token import RevokedToken
+from core.domain.models.token_family import TokenFamily
@@ -19,4 +19,10 @@ class TestCreateMatchCommand(TestCase):
         with self.assertRaises(CreateMatchCommandInfo):
             self.command.handle(self.user)
 
-        self.match_repository.save.assert_called_once_with(self.user)
+        self.match_repository.save.assert_called_once_with(self.user, 3, 3, 3)
+
+    def test_handle_custom_board(self) -> None:
+        with self.assertRaises(CreateMatchCommandInfo):
+            self.command.handle(self.user, 15, 15, 5)
+
+        self.match_repository.save.assert_called_once_with(self.user, 15, 15, 5)
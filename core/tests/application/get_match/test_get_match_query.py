@@ -28,6 +28,9 @@ class TestGetMatchQuery(TestCase):
         expected_response = GetMatchQueryResponse(
             status=self.match.status,
             number_of_movements=self.match.number_of_movements,
+            width=self.match.width,
+            height=self.match.height,
+            line_length=self.match.line_length,
             board=[],
             first_player=self.match.first_player,
             second_player=self.match.second_player,
@@ -40,6 +43,28 @@ class TestGetMatchQuery(TestCase):
         self.match_repository.find_or_fail_by_id.assert_called_once_with(10)
         self.board_generator.generate.assert_called_once_with(self.match, True)
 
+    def test_handle_string_board(self) -> None:
+        self.match.first_player_id = 1
+        self.match_repository.find_or_fail_by_id.return_value = self.match
+        self.board_generator.generate_string.return_value = "---------"
+
+        retrieved_response = self.query.handle(10, self.user, "string")
+
+        self.assertEqual("---------", retrieved_response.board)
+        self.board_generator.generate_string.assert_called_once_with(self.match)
+        self.board_generator.generate.assert_not_called()
+
+    def test_handle_code_board(self) -> None:
+        self.match.first_player_id = 1
+        self.match_repository.find_or_fail_by_id.return_value = self.match
+        self.board_generator.generate_code.return_value = 0
+
+        retrieved_response = self.query.handle(10, self.user, "code")
+
+        self.assertEqual(0, retrieved_response.board)
+        self.board_generator.generate_code.assert_called_once_with(self.match)
+        self.board_generator.generate.assert_not_called()
+
     def test_handle_foreign_user(self) -> None:
         self.match.first_player_id = 2
         self.match.second_player_id = 3
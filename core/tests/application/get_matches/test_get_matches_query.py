@@ -24,3 +24,14 @@ class TestGetMatchesQuery(TestCase):
             GetMatchesQueryResponse(matches=[self.match]), retrieved_response
         )
         self.match_repository.find_by_user_id.assert_called_once_with(1)
+
+    def test_handle_page(self) -> None:
+        self.match_repository.find_page_by_user_id.return_value = [self.match]
+
+        retrieved_response = self.query.handle(1, 5, 10)
+
+        self.assertEqual(
+            GetMatchesQueryResponse(matches=[self.match]), retrieved_response
+        )
+        self.match_repository.find_page_by_user_id.assert_called_once_with(1, 5, 10)
+        self.match_repository.find_by_user_id.assert_not_called()
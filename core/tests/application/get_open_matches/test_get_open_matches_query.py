@@ -0,0 +1,28 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from core.application.get_open_matches.get_open_matches_query import (
+    GetOpenMatchesQuery,
+)
+from core.application.get_open_matches.get_open_matches_query_response import (
+    GetOpenMatchesQueryResponse,
+)
+from core.domain.models.match import Match
+from core.domain.repositories.match_repository import MatchRepository
+
+
+class TestGetOpenMatchesQuery(TestCase):
+    def setUp(self) -> None:
+        self.match_repository = Mock(spec=MatchRepository)
+        self.query = GetOpenMatchesQuery(self.match_repository)
+        self.match = Mock(spec=Match)
+
+    def test_handle(self) -> None:
+        self.match_repository.find_open.return_value = [self.match]
+
+        retrieved_response = self.query.handle(5, 10)
+
+        self.assertEqual(
+            GetOpenMatchesQueryResponse(matches=[self.match]), retrieved_response
+        )
+        self.match_repository.find_open.assert_called_once_with(5, 10)
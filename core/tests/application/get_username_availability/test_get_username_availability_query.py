@@ -0,0 +1,52 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from core.application.get_username_availability.get_username_availability_query import (
+    GetUsernameAvailabilityQuery,
+)
+from core.application.get_username_availability.get_username_availability_query_response import (
+    GetUsernameAvailabilityQueryResponse,
+)
+from core.domain.models.user import User
+from core.domain.repositories.user_repository import UserRepository
+from core.infrastructure.caches.username_filter import UsernameFilter
+
+
+class TestGetUsernameAvailabilityQuery(TestCase):
+    def setUp(self) -> None:
+        self.user_repository = Mock(spec=UserRepository)
+        self.username_filter = Mock(spec=UsernameFilter)
+        self.query = GetUsernameAvailabilityQuery(
+            self.user_repository, self.username_filter
+        )
+
+    def test_handle_filter_miss(self) -> None:
+        self.username_filter.might_exist.return_value = False
+
+        retrieved_response = self.query.handle("user1")
+
+        self.assertEqual(
+            GetUsernameAvailabilityQueryResponse(available=True), retrieved_response
+        )
+        self.user_repository.find_user_by_username.assert_not_called()
+
+    def test_handle_taken(self) -> None:
+        self.username_filter.might_exist.return_value = True
+        self.user_repository.find_user_by_username.return_value = Mock(spec=User)
+
+        retrieved_response = self.query.handle("user1")
+
+        self.assertEqual(
+            GetUsernameAvailabilityQueryResponse(available=False), retrieved_response
+        )
+        self.user_repository.find_user_by_username.assert_called_once_with("user1")
+
+    def test_handle_false_positive(self) -> None:
+        self.username_filter.might_exist.return_value = True
+        self.user_repository.find_user_by_username.return_value = None
+
+        retrieved_response = self.query.handle("user1")
+
+        self.assertEqual(
+            GetUsernameAvailabilityQueryResponse(available=True), retrieved_response
+        )
@@ -0,0 +1,37 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from core.application.join_any_match.join_any_match_command import (
+    JoinAnyMatchCommand,
+)
+from core.application.join_any_match.join_any_match_command_info import (
+    JoinAnyMatchCommandInfo,
+)
+from core.domain.exceptions.open_match_not_found_exception import (
+    OpenMatchNotFoundException,
+)
+from core.domain.models.match import Match
+from core.domain.models.user import User
+from core.domain.repositories.match_repository import MatchRepository
+
+
+class TestJoinAnyMatchCommand(TestCase):
+    def setUp(self) -> None:
+        self.match_repository = Mock(spec=MatchRepository)
+        self.command = JoinAnyMatchCommand(self.match_repository)
+        self.guest = Mock(spec=User)
+
+    def test_handle(self) -> None:
+        self.match_repository.save_any_guest.return_value = Mock(spec=Match, id=7)
+
+        with self.assertRaises(JoinAnyMatchCommandInfo) as context:
+            self.command.handle(self.guest)
+
+        self.assertEqual(7, context.exception.match_id)
+        self.match_repository.save_any_guest.assert_called_once_with(self.guest)
+
+    def test_handle_without_open_matches(self) -> None:
+        self.match_repository.save_any_guest.side_effect = OpenMatchNotFoundException
+
+        with self.assertRaises(OpenMatchNotFoundException):
+            self.command.handle(self.guest)
@@ -1,6 +1,9 @@
 from unittest import TestCase
 from unittest.mock import Mock
 
+from django.contrib.auth.hashers import make_password
+from django.test import override_settings
+
 from core.application.login_user.login_user_command import LoginUserCommand
 from core.application.login_user.login_user_command_info import LoginUserCommandInfo
 from core.domain.exceptions.incorrect_user_password_exception import (
@@ -8,7 +11,9 @@ from core.domain.exceptions.incorrect_user_password_exception import (
 )
 from core.domain.exceptions.user_not_found_exception import UserNotFoundException
 from core.domain.models.user import User
+from core.domain.repositories.token_family_repository import TokenFamilyRepository
 from core.domain.repositories.user_repository import UserRepository
+from core.infrastructure.hashers.password_hasher import PasswordHasher
 
 
 class TestLoginUserCommand(TestCase):
@@ -18,7 +23,12 @@ class TestLoginUserCommand(TestCase):
 
     def setUp(self) -> None:
         self.user_repository = Mock(spec=UserRepository)
-        self.command = LoginUserCommand(self.user_repository)
+        self.token_family_repository = Mock(spec=TokenFamilyRepository)
+        self.command = LoginUserCommand(
+            self.user_repository,
+            self.token_family_repository,
+            PasswordHasher(maximum_workers=1, maximum_pending=1),
+        )
 
     def test_handle(self) -> None:
         self.user_repository.find_user_by_username.return_value = self.user
@@ -29,6 +39,11 @@ class TestLoginUserCommand(TestCase):
             self.assertEqual(e.user, self.user)
 
         self.user_repository.find_user_by_username.assert_called_once_with("user1")
+        self.user_repository.update_password_hash.assert_not_called()
+        family, user_id, jti, _ = self.token_family_repository.save.call_args.args
+        self.assertEqual(1, user_id)
+        self.assertEqual(e.exception.family, family)
+        self.assertEqual(e.exception.jti, jti)
 
     def test_handle_no_user(self) -> None:
         self.user_repository.find_user_by_username.return_value = None
@@ -45,3 +60,21 @@ class TestLoginUserCommand(TestCase):
             self.command.handle("user1", "abc2d")
 
         self.user_repository.find_user_by_username.assert_called_once_with("user1")
+        self.token_family_repository.save.assert_not_called()
+
+    @override_settings(
+        PASSWORD_HASHERS=[
+            "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+            "django.contrib.auth.hashers.MD5PasswordHasher",
+        ]
+    )
+    def test_handle_rehashes_outdated_password(self) -> None:
+        user = User(id=2, username="user2")
+        user._password = make_password("abcd", hasher="md5")
+        self.user_repository.find_user_by_username.return_value = user
+
+        with self.assertRaises(LoginUserCommandInfo):
+            self.command.handle("user2", "abcd")
+
+        _, password_hash = self.user_repository.update_password_hash.call_args.args
+        self.assertTrue(password_hash.startswith("pbkdf2_sha256$"))
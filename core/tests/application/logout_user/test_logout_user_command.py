@@ -0,0 +1,66 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import Mock, call
+
+from core.application.logout_user.logout_user_command import LogoutUserCommand
+from core.domain.exceptions.jwt_verification_exception import JWTVerificationException
+from core.domain.repositories.token_family_repository import TokenFamilyRepository
+from core.infrastructure.verifiers.jwt_verifier import JWTVerifier
+from core.infrastructure.verifiers.token_revocation_list import TokenRevocationList
+
+
+class TestLogoutUserCommand(TestCase):
+    def setUp(self) -> None:
+        self.jwt_verifier = Mock(spec=JWTVerifier)
+        self.token_revocation_list = Mock(spec=TokenRevocationList)
+        self.token_family_repository = Mock(spec=TokenFamilyRepository)
+        self.command = LogoutUserCommand(
+            self.jwt_verifier, self.token_revocation_list, self.token_family_repository
+        )
+        self.expires_at = datetime(2023, 8, 23, tzinfo=timezone.utc)
+
+    def test_handle(self) -> None:
+        self.jwt_verifier.verify.return_value = {
+            "user_id": 1,
+            "exp": 1692748800,
+            "jti": "access",
+        }
+
+        self.command.handle("access_token")
+
+        self.jwt_verifier.verify.assert_called_once_with("access_token")
+        self.token_revocation_list.revoke.assert_called_once_with(
+            "access", self.expires_at
+        )
+
+    def test_handle_refresh_token(self) -> None:
+        self.jwt_verifier.verify.side_effect = [
+            {"user_id": 1, "exp": 1692748800, "jti": "access"},
+            {"user_id": 1, "exp": 1692748800, "jti": "refresh", "family": "family"},
+        ]
+
+        self.command.handle("access_token", "refresh_token")
+
+        self.token_revocation_list.revoke.assert_has_calls(
+            [call("access", self.expires_at), call("refresh", self.expires_at)]
+        )
+        self.token_family_repository.delete.assert_called_once_with("family")
+
+    def test_handle_refresh_token_of_other_user(self) -> None:
+        self.jwt_verifier.verify.side_effect = [
+            {"user_id": 1, "exp": 1692748800, "jti": "access"},
+            {"user_id": 2, "exp": 1692748800, "jti": "refresh"},
+        ]
+
+        with self.assertRaises(JWTVerificationException):
+            self.command.handle("access_token", "refresh_token")
+
+        self.token_revocation_list.revoke.assert_not_called()
+        self.token_family_repository.delete.assert_not_called()
+
+    def test_handle_without_jti(self) -> None:
+        self.jwt_verifier.verify.return_value = {"user_id": 1, "exp": 1692748800}
+
+        self.command.handle("access_token")
+
+        self.token_revocation_list.revoke.assert_not_called()
@@ -2,12 +2,12 @@ from unittest import TestCase
 from unittest.mock import Mock
 
 from core.application.make_movement.make_movement_command import MakeMovementCommand
-from core.domain.exceptions.last_movement_made_exception import (
-    LastMovementMadeException,
+from core.domain.exceptions.concurrent_movement_exception import (
+    ConcurrentMovementException,
 )
+from core.domain.models.match import Match
 from core.domain.models.user import User
-from core.domain.repositories.match_repository import MatchRepository
-from core.domain.repositories.movement_repository import MovementRepository
+from core.domain.repositories.match_unit_of_work import MatchUnitOfWork
 from core.infrastructure.checkers.victory_checker import VictoryChecker
 
 
@@ -17,37 +17,74 @@ class TestMakeMovementCommand(TestCase):
         cls.user = Mock(spec=User)
 
     def setUp(self) -> None:
-        self.movement_repository = Mock(spec=MovementRepository)
+        self.match = Mock(spec=Match, is_board_full=False)
+        self.match.play.return_value = "first player"
+        self.match_unit_of_work = Mock(spec=MatchUnitOfWork)
+        self.match_unit_of_work.find_or_fail_by_id.return_value = self.match
         self.victory_checker = Mock(spec=VictoryChecker)
-        self.match_repository = Mock(spec=MatchRepository)
         self.command = MakeMovementCommand(
-            self.movement_repository, self.victory_checker, self.match_repository
+            self.match_unit_of_work, self.victory_checker
         )
 
     def test_handle_no_finish(self) -> None:
-        self.victory_checker.check.return_value = None
+        self.victory_checker.check_movement.return_value = None
 
         self.command.handle(1, self.user, 0, 0)
 
-        self.movement_repository.save.assert_called_once_with(1, self.user, 0, 0)
-        self.victory_checker.check.assert_called_once_with(1)
-        self.match_repository.end_match.assert_not_called()
+        self.match_unit_of_work.find_or_fail_by_id.assert_called_once_with(1)
+        self.match.play.assert_called_once_with(self.user, 0, 0)
+        self.victory_checker.check_movement.assert_called_once_with(
+            self.match, 0, 0, "first player"
+        )
+        self.match.finish.assert_not_called()
+        self.match_unit_of_work.commit.assert_called_once_with(self.match, 0, 0)
 
     def test_handle_winner(self) -> None:
-        self.victory_checker.check.return_value = "first player"
+        self.victory_checker.check_movement.return_value = "first player"
 
         self.command.handle(1, self.user, 0, 0)
 
-        self.movement_repository.save.assert_called_once_with(1, self.user, 0, 0)
-        self.victory_checker.check.assert_called_once_with(1)
-        self.match_repository.end_match.assert_called_once_with(1, "first player")
+        self.match.finish.assert_called_once_with("first player")
+        self.match_unit_of_work.commit.assert_called_once_with(self.match, 0, 0)
 
     def test_handle_end(self) -> None:
-        self.movement_repository.save.side_effect = LastMovementMadeException()
-        self.victory_checker.check.return_value = None
+        self.match.is_board_full = True
+        self.victory_checker.check_movement.return_value = None
+
+        self.command.handle(1, self.user, 0, 0)
+
+        self.match.finish.assert_called_once_with(None)
+        self.match_unit_of_work.commit.assert_called_once_with(self.match, 0, 0)
+
+    def test_handle_illegal_movement(self) -> None:
+        self.match.play.side_effect = ValueError()
+
+        with self.assertRaises(ValueError):
+            self.command.handle(1, self.user, 0, 0)
+
+        self.victory_checker.check_movement.assert_not_called()
+        self.match_unit_of_work.commit.assert_not_called()
+
+    def test_handle_retries_concurrent_movement(self) -> None:
+        self.victory_checker.check_movement.return_value = None
+        self.match_unit_of_work.commit.side_effect = [
+            ConcurrentMovementException(),
+            None,
+        ]
 
         self.command.handle(1, self.user, 0, 0)
 
-        self.movement_repository.save.assert_called_once_with(1, self.user, 0, 0)
-        self.victory_checker.check.assert_called_once_with(1)
-        self.match_repository.end_match.assert_called_once_with(1, None)
+        self.assertEqual(2, self.match_unit_of_work.find_or_fail_by_id.call_count)
+        self.assertEqual(2, self.match_unit_of_work.commit.call_count)
+
+    def test_handle_concurrent_movement_exhausted(self) -> None:
+        self.victory_checker.check_movement.return_value = None
+        self.match_unit_of_work.commit.side_effect = ConcurrentMovementException()
+
+        with self.assertRaises(ConcurrentMovementException):
+            self.command.handle(1, self.user, 0, 0)
+
+        self.assertEqual(
+            MakeMovementCommand.MAXIMUM_ATTEMPTS,
+            self.match_unit_of_work.commit.call_count,
+        )
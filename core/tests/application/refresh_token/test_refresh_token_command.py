@@ -1,14 +1,18 @@
+from datetime import datetime, timezone
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
 
 from core.application.refresh_token.refresh_token_command import RefreshTokenCommand
 from core.application.refresh_token.refresh_token_command_info import (
     RefreshTokenCommandInfo,
 )
+from core.domain.exceptions.jwt_verification_exception import JWTVerificationException
 from core.domain.exceptions.user_not_found_exception import UserNotFoundException
 from core.domain.models.user import User
+from core.domain.repositories.token_family_repository import TokenFamilyRepository
 from core.domain.repositories.user_repository import UserRepository
 from core.infrastructure.verifiers.jwt_verifier import JWTVerifier
+from core.infrastructure.verifiers.token_revocation_list import TokenRevocationList
 
 
 class TestRefreshTokenCommand(TestCase):
@@ -19,26 +23,118 @@ class TestRefreshTokenCommand(TestCase):
     def setUp(self) -> None:
         self.user_repository = Mock(spec=UserRepository)
         self.jwt_verifier = Mock(spec=JWTVerifier)
-        self.command = RefreshTokenCommand(self.user_repository, self.jwt_verifier)
+        self.token_family_repository = Mock(spec=TokenFamilyRepository)
+        self.token_revocation_list = Mock(spec=TokenRevocationList)
+        self.command = RefreshTokenCommand(
+            self.user_repository,
+            self.jwt_verifier,
+            self.token_family_repository,
+            self.token_revocation_list,
+        )
 
     def test_handle(self) -> None:
-        self.jwt_verifier.verify.return_value = {"user_id": 1}
+        self.jwt_verifier.verify.return_value = {
+            "user_id": 1,
+            "refresh_token": True,
+            "family": "family",
+            "jti": "jti",
+        }
         self.user_repository.find_by_id.return_value = self.user
+        self.token_family_repository.rotate.return_value = True
 
         with self.assertRaises(RefreshTokenCommandInfo) as e:
-            self.command.handle("access_token")
-
-            self.assertEqual(self.user, e.user)
+            self.command.handle("refresh_token")
 
-        self.jwt_verifier.verify.assert_called_once_with("access_token")
+        self.assertEqual(self.user, e.exception.user)
+        self.assertEqual("family", e.exception.family)
+        self.assertNotEqual("jti", e.exception.jti)
+        self.jwt_verifier.verify.assert_called_once_with("refresh_token")
         self.user_repository.find_by_id.assert_called_once_with(1)
+        self.token_family_repository.rotate.assert_called_once_with(
+            "family", "jti", e.exception.jti, ANY
+        )
+
+        self.token_revocation_list.revoke.assert_not_called()
+
+    def test_handle_without_family(self) -> None:
+        self.jwt_verifier.verify.return_value = {
+            "user_id": 1,
+            "refresh_token": True,
+            "jti": "jti",
+            "exp": 1692748800,
+        }
+        self.user_repository.find_by_id.return_value = self.user
+        self.token_revocation_list.revoke.return_value = True
+
+        with self.assertRaises(RefreshTokenCommandInfo) as e:
+            self.command.handle("refresh_token")
+
+        self.token_revocation_list.revoke.assert_called_once_with(
+            "jti", datetime(2023, 8, 23, tzinfo=timezone.utc)
+        )
+        self.token_family_repository.save.assert_called_once_with(
+            e.exception.family, 1, e.exception.jti, ANY
+        )
+        self.token_family_repository.rotate.assert_not_called()
+
+    def test_handle_without_family_or_jti(self) -> None:
+        self.jwt_verifier.verify.return_value = {
+            "user_id": 1,
+            "refresh_token": True,
+            "exp": 1692748800,
+        }
+        self.user_repository.find_by_id.return_value = self.user
+        self.token_revocation_list.revoke.return_value = True
+
+        with self.assertRaises(RefreshTokenCommandInfo):
+            self.command.handle("refresh_token")
+
+        self.token_revocation_list.revoke.assert_called_once_with(
+            "6c8a7d4aa21708a432174e4cb5c6cfaf", ANY
+        )
+
+    def test_handle_without_family_already_exchanged(self) -> None:
+        self.jwt_verifier.verify.return_value = {
+            "user_id": 1,
+            "refresh_token": True,
+            "jti": "jti",
+            "exp": 1692748800,
+        }
+        self.user_repository.find_by_id.return_value = self.user
+        self.token_revocation_list.revoke.return_value = False
+
+        with self.assertRaises(JWTVerificationException):
+            self.command.handle("refresh_token")
+
+        self.token_family_repository.save.assert_not_called()
+
+    def test_handle_retired_token(self) -> None:
+        self.jwt_verifier.verify.return_value = {
+            "user_id": 1,
+            "refresh_token": True,
+            "family": "family",
+            "jti": "jti",
+        }
+        self.user_repository.find_by_id.return_value = self.user
+        self.token_family_repository.rotate.return_value = False
+
+        with self.assertRaises(JWTVerificationException):
+            self.command.handle("refresh_token")
+
+    def test_handle_access_token(self) -> None:
+        self.jwt_verifier.verify.return_value = {"user_id": 1, "refresh_token": False}
+
+        with self.assertRaises(JWTVerificationException):
+            self.command.handle("access_token")
+
+        self.user_repository.find_by_id.assert_not_called()
 
     def test_handle_no_user(self) -> None:
-        self.jwt_verifier.verify.return_value = {"user_id": 5}
+        self.jwt_verifier.verify.return_value = {"user_id": 5, "refresh_token": True}
         self.user_repository.find_by_id.return_value = None
 
         with self.assertRaises(UserNotFoundException):
-            self.command.handle("access_token")
+            self.command.handle("refresh_token")
 
-        self.jwt_verifier.verify.assert_called_once_with("access_token")
+        self.jwt_verifier.verify.assert_called_once_with("refresh_token")
         self.user_repository.find_by_id.assert_called_once_with(5)
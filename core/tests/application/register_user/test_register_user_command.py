@@ -1,6 +1,7 @@
 from unittest import TestCase
 from unittest.mock import Mock
 
+from django.contrib.auth.hashers import check_password
 from django.db import IntegrityError
 
 from core.application.register_user.register_user_command import RegisterUserCommand
@@ -11,7 +12,10 @@ from core.domain.exceptions.user_already_exists_exception import (
     UserAlreadyExistsException,
 )
 from core.domain.models.user import User
+from core.domain.repositories.token_family_repository import TokenFamilyRepository
 from core.domain.repositories.user_repository import UserRepository
+from core.infrastructure.caches.username_filter import UsernameFilter
+from core.infrastructure.hashers.password_hasher import PasswordHasher
 
 
 class TestRegisterUserCommand(TestCase):
@@ -21,22 +25,69 @@ class TestRegisterUserCommand(TestCase):
 
     def setUp(self) -> None:
         self.user_repository = Mock(spec=UserRepository)
-        self.command = RegisterUserCommand(self.user_repository)
+        self.token_family_repository = Mock(spec=TokenFamilyRepository)
+        self.password_hasher = PasswordHasher(maximum_workers=1, maximum_pending=1)
+        self.username_filter = Mock(spec=UsernameFilter)
+        self.username_filter.might_exist.return_value = False
+        self.command = RegisterUserCommand(
+            self.user_repository,
+            self.token_family_repository,
+            self.password_hasher,
+            self.username_filter,
+        )
 
     def test_handle(self) -> None:
-        self.user_repository.save.return_value = self.user
+        self.user_repository.save_hashed.return_value = self.user
 
         with self.assertRaises(RegisterUserCommandInfo) as e:
             self.command.handle("user1", "abcd")
 
             self.assertEqual(e.user, self.user)
 
-        self.user_repository.save.assert_called_once_with("user1", "abcd")
+        username, password_hash = self.user_repository.save_hashed.call_args.args
+        self.assertEqual("user1", username)
+        self.assertTrue(check_password("abcd", password_hash))
+        family, user_id, jti, _ = self.token_family_repository.save.call_args.args
+        self.assertEqual(1, user_id)
+        self.assertEqual(e.exception.family, family)
+        self.assertEqual(e.exception.jti, jti)
+        self.user_repository.find_user_by_username.assert_not_called()
+        self.username_filter.add.assert_called_once_with("user1")
 
     def test_handle_fails(self) -> None:
-        self.user_repository.save.side_effect = IntegrityError()
+        self.user_repository.save_hashed.side_effect = IntegrityError()
 
         with self.assertRaises(UserAlreadyExistsException):
             self.command.handle("user1", "abcd")
 
-        self.user_repository.save.assert_called_once_with("user1", "abcd")
+        self.user_repository.save_hashed.assert_called_once()
+        self.token_family_repository.save.assert_not_called()
+        self.username_filter.add.assert_not_called()
+
+    def test_handle_fails_before_hashing(self) -> None:
+        self.username_filter.might_exist.return_value = True
+        self.user_repository.find_user_by_username.return_value = self.user
+        self.password_hasher = Mock(spec=PasswordHasher)
+        command = RegisterUserCommand(
+            self.user_repository,
+            self.token_family_repository,
+            self.password_hasher,
+            self.username_filter,
+        )
+
+        with self.assertRaises(UserAlreadyExistsException):
+            command.handle("user1", "abcd")
+
+        self.user_repository.find_user_by_username.assert_called_once_with("user1")
+        self.password_hasher.hash.assert_not_called()
+        self.user_repository.save_hashed.assert_not_called()
+
+    def test_handle_filter_false_positive(self) -> None:
+        self.username_filter.might_exist.return_value = True
+        self.user_repository.find_user_by_username.return_value = None
+        self.user_repository.save_hashed.return_value = self.user
+
+        with self.assertRaises(RegisterUserCommandInfo):
+            self.command.handle("user1", "abcd")
+
+        self.user_repository.save_hashed.assert_called_once()
@@ -0,0 +1,95 @@
+from unittest import TestCase
+
+from core.domain.exceptions.illegal_movement_exception import IllegalMovementException
+from core.domain.exceptions.invalid_turn_exception import InvalidTurnException
+from core.domain.exceptions.match_not_accepting_movements_exception import (
+    MatchNotAcceptingMovementsException,
+)
+from core.domain.exceptions.maximum_number_of_movements_exceeded_exception import (
+    MaximumNumberOfMovementsExceededException,
+)
+from core.domain.exceptions.not_in_game_exception import NotInGameException
+from core.domain.exceptions.repeated_movement_exception import RepeatedMovementException
+from core.domain.models.match import Match, MatchStatuses
+from core.domain.models.user import User
+
+
+class TestMatch(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.user = User(id=1, username="user1", password="1234")
+        cls.guest = User(id=2, username="user2", password="1234")
+        cls.guest2 = User(id=3, username="user3", password="1234")
+
+    def setUp(self) -> None:
+        self.match = Match(
+            status=MatchStatuses.IN_PROGRESS,
+            number_of_movements=1,
+            first_player=self.user,
+            second_player=self.guest,
+            first_player_board=0b000000001,
+        )
+
+    def test_play(self) -> None:
+        turn = self.match.play(self.guest, 1, 2)
+
+        self.assertEqual("second player", turn)
+        self.assertEqual(2, self.match.number_of_movements)
+        self.assertEqual(0b000000001, self.match.first_player_board)
+        self.assertEqual(0b000100000, self.match.second_player_board)
+        self.assertFalse(self.match.is_board_full)
+
+    def test_play_large_board(self) -> None:
+        match = Match(
+            status=MatchStatuses.IN_PROGRESS,
+            first_player=self.user,
+            second_player=self.guest,
+            width=15,
+            height=15,
+            line_length=5,
+        )
+
+        match.play(self.user, 14, 14)
+
+        self.assertEqual(1 << 224, match.first_player_board)
+
+    def test_play_last(self) -> None:
+        self.match.number_of_movements = 8
+
+        self.match.play(self.user, 1, 2)
+
+        self.assertTrue(self.match.is_board_full)
+
+    def test_play_not_in_progress(self) -> None:
+        self.match.status = MatchStatuses.FINISHED
+
+        with self.assertRaises(MatchNotAcceptingMovementsException):
+            self.match.play(self.guest, 1, 2)
+
+    def test_play_not_in_game(self) -> None:
+        with self.assertRaises(NotInGameException):
+            self.match.play(self.guest2, 1, 2)
+
+    def test_play_not_turn(self) -> None:
+        with self.assertRaises(InvalidTurnException):
+            self.match.play(self.user, 1, 0)
+
+    def test_play_repeated_movement(self) -> None:
+        with self.assertRaises(RepeatedMovementException):
+            self.match.play(self.guest, 0, 0)
+
+    def test_play_movements_exceeded(self) -> None:
+        self.match.number_of_movements = 9
+
+        with self.assertRaises(MaximumNumberOfMovementsExceededException):
+            self.match.play(self.guest, 1, 2)
+
+    def test_play_illegal_movement(self) -> None:
+        with self.assertRaises(IllegalMovementException):
+            self.match.play(self.guest, 3, 0)
+
+    def test_finish(self) -> None:
+        self.match.finish("first player")
+
+        self.assertEqual(MatchStatuses.FINISHED, self.match.status)
+        self.assertEqual(self.user, self.match.winner)
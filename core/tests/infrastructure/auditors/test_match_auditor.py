@@ -0,0 +1,140 @@
+from django.test import TestCase
+
+from core.domain.models.match import Match, MatchPlayer, MatchStatuses
+from core.domain.models.movement import Movement
+from core.domain.models.user import User
+from core.domain.models.user_match import UserMatch
+from core.infrastructure.auditors.match_auditor import MatchAuditor
+from core.infrastructure.auditors.match_mismatch import MatchMismatch
+from core.infrastructure.checkers.board_outcome_table import BoardOutcomeTable
+from core.infrastructure.checkers.victory_checker import VictoryChecker
+from core.infrastructure.repositories.db_match_repository import DbMatchRepository
+
+
+class TestMatchAuditor(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.creator = User(username="user1", password="1234")
+        cls.creator.save()
+
+        cls.guest = User(username="user2", password="1234")
+        cls.guest.save()
+
+        cls.awaiting_match = Match(first_player=cls.creator)
+        cls.awaiting_match.save()
+
+        cls.finished_match = Match(
+            first_player=cls.creator,
+            second_player=cls.guest,
+            status=MatchStatuses.FINISHED,
+            _winner=MatchPlayer.FIRST_PLAYER.value,
+            number_of_movements=5,
+        )
+        cls.finished_match.save()
+        for number, (x, y, player) in enumerate(
+            [(0, 0, cls.creator), (1, 0, cls.guest), (0, 1, cls.creator)]
+            + [(1, 1, cls.guest), (0, 2, cls.creator)],
+            start=1,
+        ):
+            Movement.objects.create(
+                x=x, y=y, player=player, number=number, match=cls.finished_match
+            )
+
+        cls.unfinished_match = Match(
+            first_player=cls.creator,
+            second_player=cls.guest,
+            status=MatchStatuses.IN_PROGRESS,
+            number_of_movements=5,
+        )
+        cls.unfinished_match.save()
+        UserMatch.objects.create(
+            user=cls.creator,
+            match=cls.unfinished_match,
+            role=MatchPlayer.FIRST_PLAYER,
+            status=MatchStatuses.IN_PROGRESS,
+        )
+        for number, (x, y, player) in enumerate(
+            [(2, 0, cls.creator), (1, 0, cls.guest), (2, 1, cls.creator)]
+            + [(1, 1, cls.guest), (2, 2, cls.creator)],
+            start=1,
+        ):
+            Movement.objects.create(
+                x=x, y=y, player=player, number=number, match=cls.unfinished_match
+            )
+
+        cls.gomoku_match = Match(
+            first_player=cls.creator,
+            second_player=cls.guest,
+            status=MatchStatuses.FINISHED,
+            _winner=MatchPlayer.SECOND_PLAYER.value,
+            number_of_movements=2,
+            width=15,
+            height=15,
+            line_length=5,
+        )
+        cls.gomoku_match.save()
+        Movement.objects.create(
+            x=7, y=7, player=cls.creator, number=1, match=cls.gomoku_match
+        )
+        Movement.objects.create(
+            x=8, y=8, player=cls.guest, number=2, match=cls.gomoku_match
+        )
+
+    def setUp(self) -> None:
+        self.match_auditor = MatchAuditor(
+            VictoryChecker(DbMatchRepository(), BoardOutcomeTable()),
+            BoardOutcomeTable(),
+        )
+
+    def test_audit(self) -> None:
+        number_of_matches, mismatches = self.match_auditor.audit(chunk_size=2)
+
+        self.assertEqual(4, number_of_matches)
+        self.assertEqual(
+            [
+                MatchMismatch(
+                    match_id=self.unfinished_match.id,
+                    stored_status=MatchStatuses.IN_PROGRESS.value,
+                    stored_winner=None,
+                    expected_status=MatchStatuses.FINISHED.value,
+                    expected_winner=MatchPlayer.FIRST_PLAYER.value,
+                ),
+                MatchMismatch(
+                    match_id=self.gomoku_match.id,
+                    stored_status=MatchStatuses.FINISHED.value,
+                    stored_winner=MatchPlayer.SECOND_PLAYER.value,
+                    expected_status=MatchStatuses.IN_PROGRESS.value,
+                    expected_winner=None,
+                ),
+            ],
+            mismatches,
+        )
+
+    def test_audit_range(self) -> None:
+        number_of_matches, mismatches = self.match_auditor.audit(
+            first_match_id=self.awaiting_match.id,
+            last_match_id=self.finished_match.id,
+        )
+
+        self.assertEqual(2, number_of_matches)
+        self.assertEqual([], mismatches)
+
+    def test_fix(self) -> None:
+        _, mismatches = self.match_auditor.audit()
+
+        self.match_auditor.fix(mismatches)
+
+        self.unfinished_match.refresh_from_db()
+        self.gomoku_match.refresh_from_db()
+        self.assertEqual(MatchStatuses.FINISHED.value, self.unfinished_match.status)
+        self.assertEqual(
+            MatchPlayer.FIRST_PLAYER.value,
+            self.unfinished_match.get_which_player_wins(),
+        )
+        self.assertEqual(
+            MatchStatuses.FINISHED.value,
+            UserMatch.objects.get(match=self.unfinished_match).status,
+        )
+        self.assertEqual(MatchStatuses.IN_PROGRESS.value, self.gomoku_match.status)
+        self.assertIsNone(self.gomoku_match.get_which_player_wins())
+        self.assertEqual((4, []), self.match_auditor.audit())
@@ -0,0 +1,33 @@
+from unittest import TestCase
+
+from core.infrastructure.caches.bloom_filter import BloomFilter
+
+
+class TestBloomFilter(TestCase):
+    def setUp(self) -> None:
+        self.bloom_filter = BloomFilter(capacity=1000, false_positive_rate=0.01)
+
+    def test_contains(self) -> None:
+        self.assertNotIn("key", self.bloom_filter)
+
+        self.bloom_filter.add("key")
+
+        self.assertIn("key", self.bloom_filter)
+        self.assertEqual(1, len(self.bloom_filter))
+
+    def test_no_false_negatives(self) -> None:
+        keys = [f"key{number}" for number in range(1000)]
+        for key in keys:
+            self.bloom_filter.add(key)
+
+        self.assertTrue(all(key in self.bloom_filter for key in keys))
+
+    def test_false_positive_rate(self) -> None:
+        for number in range(1000):
+            self.bloom_filter.add(f"key{number}")
+
+        false_positives = sum(
+            f"missing{number}" in self.bloom_filter for number in range(10000)
+        )
+
+        self.assertLess(false_positives, 300)
@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from core.infrastructure.caches.id_watermark import IdWatermark
+
+
+class TestIdWatermark(TestCase):
+    def setUp(self) -> None:
+        self.watermark = IdWatermark(overlap=10)
+
+    def test_unseen(self) -> None:
+        self.assertEqual(0, self.watermark.since())
+
+        self.assertEqual(["a", "b"], self.watermark.unseen([(1, "a"), (20, "b")]))
+        self.assertEqual(10, self.watermark.since())
+
+        self.assertEqual(["c"], self.watermark.unseen([(15, "c"), (20, "b")]))
+        self.assertEqual(10, self.watermark.since())
+
+    def test_unseen_forgets_ids_behind_the_overlap(self) -> None:
+        self.watermark.unseen([(5, "a")])
+        self.watermark.unseen([(30, "b")])
+
+        self.assertEqual(20, self.watermark.since())
+        self.assertEqual(["b2"], self.watermark.unseen([(25, "b2"), (30, "b")]))
+
+    def test_reset(self) -> None:
+        self.watermark.unseen([(20, "a")])
+
+        self.watermark.reset()
+
+        self.assertEqual(0, self.watermark.since())
+        self.assertEqual(["a"], self.watermark.unseen([(20, "a")]))
@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+from freezegun import freeze_time
+
+from core.infrastructure.caches.ttl_cache import TtlCache
+
+
+class TestTtlCache(TestCase):
+    def setUp(self) -> None:
+        self.cache = TtlCache(ttl=2, maximum_size=2)
+
+    def test_get(self) -> None:
+        self.cache.set("key", "value")
+
+        self.assertEqual("value", self.cache.get("key"))
+        self.assertIsNone(self.cache.get("missing"))
+
+    def test_get_expired(self) -> None:
+        with freeze_time("2023-08-22 00:00:00") as frozen_time:
+            self.cache.set("key", "value")
+            self.cache.set("short", "value", ttl=1)
+
+            frozen_time.tick(1)
+            self.assertEqual("value", self.cache.get("key"))
+            self.assertIsNone(self.cache.get("short"))
+
+            frozen_time.tick(1)
+            self.assertIsNone(self.cache.get("key"))
+            self.assertEqual(0, len(self.cache))
+
+    def test_set_evicts_least_recently_used(self) -> None:
+        self.cache.set("first", 1)
+        self.cache.set("second", 2)
+        self.cache.get("first")
+
+        self.cache.set("third", 3)
+
+        self.assertEqual(1, self.cache.get("first"))
+        self.assertIsNone(self.cache.get("second"))
+        self.assertEqual(3, self.cache.get("third"))
+
+    def test_delete_and_clear(self) -> None:
+        self.cache.set("first", 1)
+        self.cache.set("second", 2)
+
+        self.cache.delete("first")
+        self.assertIsNone(self.cache.get("first"))
+
+        self.cache.clear()
+        self.assertIsNone(self.cache.get("second"))
+
+    def test_hits_and_misses(self) -> None:
+        self.cache.set("key", "value")
+
+        self.cache.get("key")
+        self.cache.get("key")
+        self.cache.get("missing")
+
+        self.assertEqual(2, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
@@ -0,0 +1,79 @@
+from django.test import TestCase
+from freezegun import freeze_time
+
+from core.domain.models.user import User
+from core.infrastructure.caches.username_filter import UsernameFilter
+
+
+class TestUsernameFilter(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        User.objects.create(id=1, username="user1", password="1234")
+
+    def setUp(self) -> None:
+        self.username_filter = UsernameFilter(
+            refresh_interval=5,
+            capacity=1000,
+            false_positive_rate=0.01,
+            refresh_overlap=100,
+        )
+
+    def test_might_exist(self) -> None:
+        self.assertTrue(self.username_filter.might_exist("user1"))
+        self.assertFalse(self.username_filter.might_exist("user2"))
+
+    def test_might_exist_skips_table_until_stale(self) -> None:
+        self.username_filter.refresh()
+
+        with self.assertNumQueries(0):
+            self.assertFalse(self.username_filter.might_exist("user2"))
+
+    def test_add(self) -> None:
+        self.username_filter.refresh()
+
+        self.username_filter.add("user2")
+
+        self.assertTrue(self.username_filter.might_exist("user2"))
+
+    def test_refresh_loads_new_users(self) -> None:
+        with freeze_time("2023-08-22 00:00:00") as frozen_time:
+            self.assertFalse(self.username_filter.might_exist("user2"))
+            User.objects.create(id=2, username="user2", password="1234")
+
+            self.assertFalse(self.username_filter.might_exist("user2"))
+
+            frozen_time.tick(5)
+            with self.assertNumQueries(1):
+                self.assertTrue(self.username_filter.might_exist("user2"))
+            self.assertTrue(self.username_filter.might_exist("user1"))
+
+    def test_refresh_loads_users_committed_out_of_order(self) -> None:
+        User.objects.create(id=10, username="user10", password="1234")
+        self.username_filter.refresh()
+        User.objects.create(id=5, username="user5", password="1234")
+
+        self.username_filter.refresh()
+
+        self.assertTrue(self.username_filter.might_exist("user5"))
+
+    def test_refresh_grows_past_capacity(self) -> None:
+        username_filter = UsernameFilter(
+            refresh_interval=5,
+            capacity=1,
+            false_positive_rate=0.01,
+            refresh_overlap=100,
+        )
+        User.objects.create(id=2, username="user2", password="1234")
+
+        username_filter.refresh()
+
+        self.assertTrue(username_filter.might_exist("user1"))
+        self.assertTrue(username_filter.might_exist("user2"))
+
+    def test_clear(self) -> None:
+        self.username_filter.add("user2")
+
+        self.username_filter.clear()
+
+        self.assertTrue(self.username_filter.might_exist("user1"))
+        self.assertFalse(self.username_filter.might_exist("user2"))
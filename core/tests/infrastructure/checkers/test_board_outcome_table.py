@@ -0,0 +1,56 @@
+from unittest import TestCase
+
+from core.infrastructure.checkers.board_outcome_table import (
+    BoardOutcome,
+    BoardOutcomeTable,
+)
+
+
+class TestBoardOutcomeTable(TestCase):
+    def setUp(self) -> None:
+        self.board_outcome_table = BoardOutcomeTable()
+
+    def test_encode(self) -> None:
+        code = self.board_outcome_table.encode(0b000000001, 0b100000000)
+
+        self.assertEqual(1 + 2 * 3**8, code)
+
+    def test_classify_empty(self) -> None:
+        outcome = self.board_outcome_table.classify(0, 0)
+
+        self.assertEqual(BoardOutcome.ONGOING, outcome)
+
+    def test_classify_first_player_wins(self) -> None:
+        outcome = self.board_outcome_table.classify(0b100010001, 0b000001010)
+
+        self.assertEqual(BoardOutcome.FIRST_PLAYER_WINS, outcome)
+
+    def test_classify_second_player_wins(self) -> None:
+        outcome = self.board_outcome_table.classify(0b000011001, 0b111000000)
+
+        self.assertEqual(BoardOutcome.SECOND_PLAYER_WINS, outcome)
+
+    def test_classify_draw(self) -> None:
+        outcome = self.board_outcome_table.classify(0b110001101, 0b001110010)
+
+        self.assertEqual(BoardOutcome.DRAW, outcome)
+
+    def test_classify_codes(self) -> None:
+        codes = [
+            self.board_outcome_table.encode(0, 0),
+            self.board_outcome_table.encode(0b000000111, 0b000011000),
+            self.board_outcome_table.encode(0b000011000, 0b000000111),
+        ]
+
+        outcomes = self.board_outcome_table.classify_codes(codes)
+
+        self.assertEqual(
+            bytes(
+                [
+                    BoardOutcome.ONGOING,
+                    BoardOutcome.FIRST_PLAYER_WINS,
+                    BoardOutcome.SECOND_PLAYER_WINS,
+                ]
+            ),
+            outcomes,
+        )
@@ -4,7 +4,7 @@ from core.domain.models.match import Match, MatchStatuses
 from core.domain.models.movement import Movement
 from core.domain.models.user import User
 from core.infrastructure.checkers.victory_checker import VictoryChecker
-from core.infrastructure.generators.board_generator import BoardGenerator
+from core.infrastructure.checkers.board_outcome_table import BoardOutcomeTable
 from core.infrastructure.repositories.db_match_repository import DbMatchRepository
 
 
@@ -21,6 +21,7 @@ class TestVictoryChecker(TestCase):
             first_player=cls.creator,
             second_player=cls.guest,
             status=MatchStatuses.IN_PROGRESS,
+            first_player_board=0b100010001,
         )
         cls.match_with_winner.save()
 
@@ -38,6 +39,8 @@ class TestVictoryChecker(TestCase):
             first_player=cls.creator,
             second_player=cls.guest,
             status=MatchStatuses.IN_PROGRESS,
+            first_player_board=0b000010001,
+            second_player_board=0b100000000,
         )
         cls.match_without_winner.save()
 
@@ -51,8 +54,20 @@ class TestVictoryChecker(TestCase):
             x=2, y=2, player=cls.guest, number=3, match=cls.match_without_winner
         )
 
+        cls.gomoku_match = Match(
+            first_player=cls.creator,
+            second_player=cls.guest,
+            status=MatchStatuses.IN_PROGRESS,
+            width=15,
+            height=15,
+            line_length=5,
+            first_player_board=sum(1 << (i * 15 + 10 - i) for i in range(3, 8)),
+            second_player_board=sum(1 << (i * 15 + 11 - i) for i in range(3, 7)),
+        )
+        cls.gomoku_match.save()
+
     def setUp(self) -> None:
-        self.victory_checker = VictoryChecker(DbMatchRepository(), BoardGenerator())
+        self.victory_checker = VictoryChecker(DbMatchRepository(), BoardOutcomeTable())
 
     def test_check_victory(self) -> None:
         winner = self.victory_checker.check(self.match_with_winner.id)
@@ -63,3 +78,61 @@ class TestVictoryChecker(TestCase):
         winner = self.victory_checker.check(self.match_without_winner.id)
 
         self.assertIsNone(winner)
+
+    def test_check_movement_victory(self) -> None:
+        with self.assertNumQueries(0):
+            winner = self.victory_checker.check_movement(
+                self.match_with_winner, 2, 2, "first player"
+            )
+
+        self.assertEqual("first player", winner)
+
+    def test_check_movement_no_victory(self) -> None:
+        with self.assertNumQueries(0):
+            winner = self.victory_checker.check_movement(
+                self.match_without_winner, 2, 2, "second player"
+            )
+
+        self.assertIsNone(winner)
+
+    def test_check_movement_only_lines_through_slot(self) -> None:
+        match = Match(first_player_board=0b000000111)
+
+        winner = self.victory_checker.check_movement(match, 2, 2, "first player")
+
+        self.assertIsNone(winner)
+
+    def test_check_victory_large_board(self) -> None:
+        winner = self.victory_checker.check(self.gomoku_match.id)
+
+        self.assertEqual("first player", winner)
+
+    def test_check_movement_large_board(self) -> None:
+        with self.assertNumQueries(0):
+            winner = self.victory_checker.check_movement(
+                self.gomoku_match, 5, 5, "first player"
+            )
+
+        self.assertEqual("first player", winner)
+
+    def test_check_movement_large_board_no_victory(self) -> None:
+        winner = self.victory_checker.check_movement(
+            self.gomoku_match, 5, 6, "second player"
+        )
+
+        self.assertIsNone(winner)
+
+    def test_check_large_board_does_not_wrap_lines(self) -> None:
+        match = Match.objects.create(
+            first_player=self.creator,
+            second_player=self.guest,
+            width=5,
+            height=5,
+            line_length=4,
+            first_player_board=sum(1 << slot for slot in (3, 4, 5, 6)),
+        )
+
+        self.assertIsNone(
+            self.victory_checker.check_movement(match, 1, 0, "first player")
+        )
+        self.assertIsNone(self.victory_checker.check(match.id))
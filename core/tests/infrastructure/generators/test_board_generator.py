@@ -1,50 +1,20 @@
 from unittest import TestCase
-from unittest.mock import Mock
 
+from core.domain.exceptions.board_code_too_large_exception import (
+    BoardCodeTooLargeException,
+)
 from core.domain.models.match import Match
-from core.domain.models.movement import Movement
 from core.infrastructure.generators.board_generator import BoardGenerator
 
 
 class TestBoardGenerator(TestCase):
     def setUp(self) -> None:
-        self.match = Mock(spec=Match)
+        self.match = Match(
+            first_player_board=0b001001001, second_player_board=0b000010100
+        )
         self.board_generator = BoardGenerator()
 
     def test_generate(self) -> None:
-        self.match.movements.all.return_value = [
-            Mock(
-                spec=Movement,
-                x=0,
-                y=0,
-                **{"get_which_player.return_value": "first player"}
-            ),
-            Mock(
-                spec=Movement,
-                x=1,
-                y=1,
-                **{"get_which_player.return_value": "second player"}
-            ),
-            Mock(
-                spec=Movement,
-                x=1,
-                y=0,
-                **{"get_which_player.return_value": "first player"}
-            ),
-            Mock(
-                spec=Movement,
-                x=0,
-                y=2,
-                **{"get_which_player.return_value": "second player"}
-            ),
-            Mock(
-                spec=Movement,
-                x=2,
-                y=0,
-                **{"get_which_player.return_value": "first player"}
-            ),
-        ]
-
         board = self.board_generator.generate(self.match)
 
         self.assertEqual(
@@ -57,48 +27,58 @@ class TestBoardGenerator(TestCase):
         )
 
     def test_generate_game_mode(self) -> None:
-        self.match.movements.all.return_value = [
-            Mock(
-                spec=Movement,
-                x=0,
-                y=0,
-                **{"get_which_player.return_value": "first player"}
-            ),
-            Mock(
-                spec=Movement,
-                x=1,
-                y=1,
-                **{"get_which_player.return_value": "second player"}
-            ),
-            Mock(
-                spec=Movement,
-                x=1,
-                y=0,
-                **{"get_which_player.return_value": "first player"}
-            ),
-            Mock(
-                spec=Movement,
-                x=0,
-                y=2,
-                **{"get_which_player.return_value": "second player"}
-            ),
-            Mock(
-                spec=Movement,
-                x=2,
-                y=0,
-                **{"get_which_player.return_value": "first player"}
-            ),
-        ]
-
         board = self.board_generator.generate(self.match, True)
 
         self.assertEqual([["X", None, "O"], ["X", "O", None], ["X", None, None]], board)
 
     def test_generate_empty(self) -> None:
-        self.match.movements.all.return_value = []
-
-        board = self.board_generator.generate(self.match)
+        board = self.board_generator.generate(Match())
 
         self.assertEqual(
             [[None, None, None], [None, None, None], [None, None, None]], board
         )
+
+    def test_generate_rectangular(self) -> None:
+        match = Match(
+            width=2, height=4, first_player_board=0b10000001, second_player_board=0b100
+        )
+
+        board = self.board_generator.generate(match, True)
+
+        self.assertEqual([["X", None, "O", None], [None, None, None, "X"]], board)
+
+    def test_generate_string(self) -> None:
+        board = self.board_generator.generate_string(self.match)
+
+        self.assertEqual("X-OXO-X--", board)
+
+    def test_generate_string_rectangular(self) -> None:
+        match = Match(
+            width=2, height=4, first_player_board=0b10000001, second_player_board=0b100
+        )
+
+        board = self.board_generator.generate_string(match)
+
+        self.assertEqual("X-O----X", board)
+
+    def test_generate_code(self) -> None:
+        board = self.board_generator.generate_code(self.match)
+
+        self.assertEqual(1 + 2 * 3**2 + 3**3 + 2 * 3**4 + 3**6, board)
+
+    def test_generate_code_largest_board(self) -> None:
+        match = Match(width=3, height=11, second_player_board=(1 << 33) - 1)
+
+        board = self.board_generator.generate_code(match)
+
+        self.assertEqual(3**33 - 1, board)
+        self.assertLess(board, 2**53)
+
+    def test_generate_code_too_large(self) -> None:
+        with self.assertRaises(BoardCodeTooLargeException):
+            self.board_generator.generate_code(Match(width=15, height=15))
+
+    def test_generate_code_empty(self) -> None:
+        board = self.board_generator.generate_code(Match())
+
+        self.assertEqual(0, board)
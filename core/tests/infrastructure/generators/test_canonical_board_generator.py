@@ -0,0 +1,52 @@
+from unittest import TestCase
+
+from core.infrastructure.generators.canonical_board_generator import (
+    CanonicalBoardGenerator,
+)
+
+
+class TestCanonicalBoardGenerator(TestCase):
+    def setUp(self) -> None:
+        self.canonical_board_generator = CanonicalBoardGenerator()
+
+    def test_generate_empty(self) -> None:
+        key, symmetry = self.canonical_board_generator.generate(0, 0)
+
+        self.assertEqual(0, key)
+        self.assertEqual(0, symmetry)
+
+    def test_generate_symmetric_boards(self) -> None:
+        corners = [0b000000001, 0b000000100, 0b001000000, 0b100000000]
+
+        keys = {
+            self.canonical_board_generator.generate(corner, 0b000010000)[0]
+            for corner in corners
+        }
+
+        self.assertEqual({1 + 2 * 3**4}, keys)
+
+    def test_generate_different_boards(self) -> None:
+        corner_key, _ = self.canonical_board_generator.generate(0b000000001, 0)
+        edge_key, _ = self.canonical_board_generator.generate(0b000000010, 0)
+        center_key, _ = self.canonical_board_generator.generate(0b000010000, 0)
+
+        self.assertEqual(3, len({corner_key, edge_key, center_key}))
+
+    def test_slot_round_trip(self) -> None:
+        _, symmetry = self.canonical_board_generator.generate(0b100000000, 0b000000010)
+
+        canonical_slot = self.canonical_board_generator.to_canonical_slot(
+            2, 2, symmetry
+        )
+        original_slot = self.canonical_board_generator.to_original_slot(
+            *canonical_slot, symmetry
+        )
+
+        self.assertEqual((2, 2), original_slot)
+
+    def test_to_canonical_slot_follows_key(self) -> None:
+        key, symmetry = self.canonical_board_generator.generate(0b100000000, 0)
+
+        x, y = self.canonical_board_generator.to_canonical_slot(2, 2, symmetry)
+
+        self.assertEqual(3 ** (x * 3 + y), key)
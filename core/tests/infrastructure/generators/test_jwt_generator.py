@@ -1,5 +1,6 @@
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+from uuid import UUID
 
 from freezegun import freeze_time
 
@@ -7,20 +8,22 @@ from core.domain.models.user import User
 from core.infrastructure.generators.jwt_generator import JWTGenerator
 
 
+@patch("core.infrastructure.generators.jwt_generator.uuid4", return_value=UUID(int=1))
 class TestJWTGenerator(TestCase):
     @classmethod
     def setUpClass(cls) -> None:
-        cls.user = Mock(spec=User, id=1)
+        cls.user = Mock(spec=User, id=1, username="user")
 
     def setUp(self) -> None:
         self.jwt_generator = JWTGenerator()
 
     @freeze_time("2023-08-22")
-    def test_generate_access(self) -> None:
+    def test_generate_access(self, _) -> None:
         expected_jwt = (
             "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJ1c2VyX2lkIjoxLCJleHAiO"
-            "jE2OTI3NDg4MDAsImlhdCI6MTY5MjY2MjQwMCwicmVmcmVzaF90b2tlbiI6ZmFsc2V9."
-            "r-2WjLeEj8_-6zf4wbYs9-oqr2FWd93YiUmn2itnSzw"
+            "jE2OTI3NDg4MDAsImlhdCI6MTY5MjY2MjQwMCwicmVmcmVzaF90b2tlbiI6ZmFsc2"
+            "UsImp0aSI6IjAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAxIiwidXNlcm5h"
+            "bWUiOiJ1c2VyIn0.X6ZF58sgO5YFo2Grf6TLDY1cztWdHKocHlwPys4iuN8"
         )
 
         retrieved_jwt = self.jwt_generator.generate(self.user)
@@ -28,13 +31,22 @@ class TestJWTGenerator(TestCase):
         self.assertEqual(expected_jwt, retrieved_jwt)
 
     @freeze_time("2023-08-22")
-    def test_generate_refresh(self) -> None:
+    def test_generate_refresh(self, _) -> None:
         expected_jwt = (
             "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJ1c2VyX2lkIjoxLCJleHAiO"
             "jE2OTI3NDg4MDAsImlhdCI6MTY5MjY2MjQwMCwicmVmcmVzaF90b2tlbiI6dHJ"
-            "1ZX0.MQNTszhO0rDP13hXfXwiNE4qORHz7De4lTJFHBKL8s8"
+            "1ZSwianRpIjoiMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDEifQ."
+            "Jt5HOnkli8FzYPXDLggCKTOGBROSUYjUYV1StP4ajBI"
         )
 
         retrieved_jwt = self.jwt_generator.generate(self.user, refresh_token=True)
 
         self.assertEqual(expected_jwt, retrieved_jwt)
+
+    def test_generate_unique_ids(self, uuid4) -> None:
+        uuid4.side_effect = [UUID(int=1), UUID(int=2)]
+
+        self.assertNotEqual(
+            self.jwt_generator.generate(self.user),
+            self.jwt_generator.generate(self.user),
+        )
@@ -0,0 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from django.contrib.auth.hashers import check_password, make_password
+from django.test import override_settings
+
+from core.infrastructure.hashers.password_hasher import PasswordHasher
+
+
+class TestPasswordHasher(TestCase):
+    def setUp(self) -> None:
+        self.password_hasher = PasswordHasher(maximum_workers=2, maximum_pending=2)
+
+    def test_hash(self) -> None:
+        password_hash = self.password_hasher.hash("1234")
+
+        self.assertTrue(check_password("1234", password_hash))
+
+    def test_verify(self) -> None:
+        password_hash = make_password("1234")
+
+        self.assertEqual(
+            (True, None), self.password_hasher.verify("1234", password_hash)
+        )
+        self.assertEqual(
+            (False, None), self.password_hasher.verify("4321", password_hash)
+        )
+
+    @override_settings(
+        PASSWORD_HASHERS=[
+            "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+            "django.contrib.auth.hashers.MD5PasswordHasher",
+        ]
+    )
+    def test_verify_outdated_hash(self) -> None:
+        password_hash = make_password("1234", hasher="md5")
+
+        is_correct, new_password_hash = self.password_hasher.verify(
+            "1234", password_hash
+        )
+
+        self.assertTrue(is_correct)
+        self.assertTrue(new_password_hash.startswith("pbkdf2_sha256$"))
+        self.assertTrue(check_password("1234", new_password_hash))
+        self.assertEqual(
+            (False, None), self.password_hasher.verify("4321", password_hash)
+        )
+
+    def test_concurrent(self) -> None:
+        with ThreadPoolExecutor(6) as executor:
+            password_hashes = list(
+                executor.map(self.password_hasher.hash, map(str, range(6)))
+            )
+            results = list(
+                executor.map(
+                    self.password_hasher.verify, map(str, range(6)), password_hashes
+                )
+            )
+
+        self.assertEqual([(True, None)] * 6, results)
+
+    def test_failed_submit_releases_slot(self) -> None:
+        password_hasher = PasswordHasher(maximum_workers=1, maximum_pending=0)
+        password_hasher.shutdown()
+
+        with ThreadPoolExecutor(1) as executor:
+            for _ in range(2):
+                with self.assertRaises(RuntimeError):
+                    executor.submit(password_hasher.hash, "1234").result(timeout=5)
@@ -0,0 +1,209 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from typing import Optional
+from unittest import TestCase
+from unittest.mock import Mock
+
+from freezegun import freeze_time
+
+from core.domain.exceptions.matchmaking_already_paired_exception import (
+    MatchmakingAlreadyPairedException,
+)
+from core.domain.exceptions.matchmaking_cancelled_exception import (
+    MatchmakingCancelledException,
+)
+from core.domain.exceptions.matchmaking_queue_full_exception import (
+    MatchmakingQueueFullException,
+)
+from core.domain.exceptions.matchmaking_ticket_not_found_exception import (
+    MatchmakingTicketNotFoundException,
+)
+from core.domain.exceptions.matchmaking_timeout_exception import (
+    MatchmakingTimeoutException,
+)
+from core.domain.models.match import Match
+from core.domain.models.user import User
+from core.domain.repositories.match_repository import MatchRepository
+from core.infrastructure.matchmaking.matchmaking_queue import MatchmakingQueue
+
+
+class TestMatchmakingQueue(TestCase):
+    def setUp(self) -> None:
+        self.match_repository = Mock(spec=MatchRepository)
+        self.match_repository.save_pair.side_effect = lambda first, second: Mock(
+            spec=Match, id=first.id * 100 + second.id
+        )
+        self.queue = MatchmakingQueue(
+            self.match_repository, maximum_size=3, maximum_wait=60
+        )
+        self.users = [Mock(spec=User, id=user_id) for user_id in range(1, 6)]
+
+    def test_pairs_in_arrival_order(self) -> None:
+        tickets = [self.queue.enqueue(user) for user in self.users[:4]]
+
+        self.assertEqual(
+            [102, 102, 304, 304], [self.queue.wait(ticket, 0) for ticket in tickets]
+        )
+        self.assertEqual(2, self.match_repository.save_pair.call_count)
+        self.assertEqual(0, self.queue.metrics().queue_depth)
+        self.assertEqual(4, self.queue.metrics().paired)
+
+    def test_enqueue_twice(self) -> None:
+        ticket = self.queue.enqueue(self.users[0])
+
+        self.assertIs(ticket, self.queue.enqueue(self.users[0]))
+        self.assertIsNone(self.queue.wait(ticket, 0))
+        self.assertEqual(1, self.queue.metrics().queue_depth)
+
+    def test_enqueue_after_pairing(self) -> None:
+        self.queue.enqueue(self.users[0])
+        self.queue.enqueue(self.users[1])
+
+        ticket = self.queue.enqueue(self.users[0])
+        self.assertEqual(102, self.queue.wait(ticket, 0))
+
+        new_ticket = self.queue.enqueue(self.users[0])
+        self.assertIsNot(ticket, new_ticket)
+        self.assertIsNone(self.queue.wait(new_ticket, 0))
+
+    def test_enqueue_full(self) -> None:
+        self.match_repository.save_pair.side_effect = Exception("database down")
+        self.queue.enqueue(self.users[0])
+        for user in self.users[1:3]:
+            with self.assertRaises(Exception):
+                self.queue.enqueue(user)
+
+        with self.assertRaises(MatchmakingQueueFullException):
+            self.queue.enqueue(self.users[3])
+
+    def test_failed_pairing_keeps_order(self) -> None:
+        self.match_repository.save_pair.side_effect = [Exception("database down")]
+        first_ticket = self.queue.enqueue(self.users[0])
+        with self.assertRaises(Exception):
+            self.queue.enqueue(self.users[1])
+
+        self.match_repository.save_pair.side_effect = lambda first, second: Mock(
+            spec=Match, id=first.id * 100 + second.id
+        )
+        self.queue.enqueue(self.users[2])
+
+        self.assertEqual(102, self.queue.wait(first_ticket, 0))
+        self.assertEqual(1, self.queue.metrics().queue_depth)
+
+    def test_wait_until_paired(self) -> None:
+        ticket = self.queue.enqueue(self.users[0])
+
+        with ThreadPoolExecutor(1) as executor:
+            waiting = executor.submit(self.queue.wait, ticket, 10)
+            self.queue.enqueue(self.users[1])
+
+            self.assertEqual(102, waiting.result())
+
+    def test_cancel(self) -> None:
+        ticket = self.queue.enqueue(self.users[0])
+
+        with ThreadPoolExecutor(1) as executor:
+            waiting = executor.submit(self.queue.wait, ticket, 10)
+            self.queue.cancel(self.users[0])
+
+            with self.assertRaises(MatchmakingCancelledException):
+                waiting.result()
+
+        self.assertEqual(0, self.queue.metrics().queue_depth)
+        self.assertEqual(1, self.queue.metrics().cancelled)
+        self.queue.enqueue(self.users[1])
+        self.match_repository.save_pair.assert_not_called()
+
+    def test_cancel_not_queued(self) -> None:
+        with self.assertRaises(MatchmakingTicketNotFoundException):
+            self.queue.cancel(self.users[0])
+
+    def test_enqueue_while_pairing(self) -> None:
+        pairing, paired = self.__block_save_pair()
+        ticket = self.queue.enqueue(self.users[0])
+
+        with ThreadPoolExecutor(2) as executor:
+            executor.submit(self.queue.enqueue, self.users[1])
+            pairing.wait(10)
+
+            self.assertIs(ticket, self.queue.enqueue(self.users[0]))
+            self.queue.enqueue(self.users[2])
+            cancelling = executor.submit(self.queue.cancel, self.users[0])
+            self.assertFalse(cancelling.done())
+
+            paired.set()
+            with self.assertRaises(MatchmakingAlreadyPairedException):
+                cancelling.result()
+
+        self.assertEqual(102, self.queue.wait(ticket, 0))
+        self.match_repository.save_pair.assert_called_once()
+        self.assertEqual(1, self.queue.metrics().queue_depth)
+
+    def test_cancel_while_pairing_fails(self) -> None:
+        pairing, paired = self.__block_save_pair(Exception("database down"))
+        ticket = self.queue.enqueue(self.users[0])
+
+        with ThreadPoolExecutor(2) as executor:
+            enqueuing = executor.submit(self.queue.enqueue, self.users[1])
+            pairing.wait(10)
+            cancelling = executor.submit(self.queue.cancel, self.users[0])
+
+            paired.set()
+            with self.assertRaises(Exception):
+                enqueuing.result()
+            cancelling.result()
+
+        with self.assertRaises(MatchmakingCancelledException):
+            self.queue.wait(ticket, 0)
+        self.assertEqual(1, self.queue.metrics().queue_depth)
+
+    def test_expire(self) -> None:
+        with freeze_time("2023-08-22 00:00:00") as frozen_time:
+            ticket = self.queue.enqueue(self.users[0])
+
+            frozen_time.tick(30)
+            self.assertIsNone(self.queue.wait(ticket, 0))
+
+            frozen_time.tick(30)
+            with self.assertRaises(MatchmakingTimeoutException):
+                self.queue.wait(ticket, 0)
+
+            self.queue.enqueue(self.users[1])
+            self.assertEqual(1, self.queue.metrics().expired)
+            self.assertEqual(1, self.queue.metrics().queue_depth)
+            self.match_repository.save_pair.assert_not_called()
+
+    def test_wait_time_percentiles(self) -> None:
+        with freeze_time("2023-08-22 00:00:00") as frozen_time:
+            for user in self.users[:4]:
+                self.queue.enqueue(user)
+                frozen_time.tick(10)
+
+            metrics = self.queue.metrics()
+
+        self.assertEqual(0, metrics.wait_time_p50)
+        self.assertEqual(10, metrics.wait_time_p90)
+        self.assertEqual(10, metrics.wait_time_p99)
+
+    def test_metrics_without_waits(self) -> None:
+        metrics = self.queue.metrics()
+
+        self.assertEqual(0, metrics.queue_depth)
+        self.assertIsNone(metrics.wait_time_p50)
+
+    def __block_save_pair(
+        self, error: Optional[Exception] = None
+    ) -> tuple[Event, Event]:
+        pairing, paired = Event(), Event()
+
+        def save_pair(first: User, second: User) -> Match:
+            pairing.set()
+            paired.wait(10)
+            if error is not None:
+                raise error
+
+            return Mock(spec=Match, id=first.id * 100 + second.id)
+
+        self.match_repository.save_pair.side_effect = save_pair
+
+        return pairing, paired
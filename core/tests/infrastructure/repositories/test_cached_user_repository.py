@@ -0,0 +1,76 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from core.domain.models.user import User
+from core.domain.repositories.user_repository import UserRepository
+from core.infrastructure.caches.ttl_cache import TtlCache
+from core.infrastructure.repositories.cached_user_repository import (
+    CachedUserRepository,
+)
+
+
+class TestCachedUserRepository(TestCase):
+    def setUp(self) -> None:
+        self.user_repository = Mock(spec=UserRepository)
+        self.user_cache = TtlCache(ttl=60, maximum_size=2)
+        self.cached_user_repository = CachedUserRepository(
+            self.user_repository, self.user_cache
+        )
+        self.user = Mock(spec=User, id=1)
+
+    def test_find_by_id(self) -> None:
+        self.user_repository.find_by_id.return_value = self.user
+
+        self.assertEqual(self.user, self.cached_user_repository.find_by_id(1))
+        self.assertEqual(self.user, self.cached_user_repository.find_by_id(1))
+
+        self.user_repository.find_by_id.assert_called_once_with(1)
+        self.assertEqual(1, self.user_cache.hits)
+        self.assertEqual(1, self.user_cache.misses)
+
+    def test_find_by_id_invalidated(self) -> None:
+        self.user_repository.find_by_id.return_value = self.user
+        self.cached_user_repository.find_by_id(1)
+
+        self.user_cache.delete(1)
+        self.cached_user_repository.find_by_id(1)
+
+        self.assertEqual(2, self.user_repository.find_by_id.call_count)
+
+    def test_find_by_id_not_found(self) -> None:
+        self.user_repository.find_by_id.return_value = None
+
+        self.assertIsNone(self.cached_user_repository.find_by_id(1))
+        self.assertIsNone(self.cached_user_repository.find_by_id(1))
+
+        self.assertEqual(2, self.user_repository.find_by_id.call_count)
+        self.assertEqual(0, len(self.user_cache))
+
+    def test_find_user_by_username(self) -> None:
+        self.user_repository.find_user_by_username.return_value = self.user
+
+        self.assertEqual(
+            self.user, self.cached_user_repository.find_user_by_username("user")
+        )
+        self.assertEqual(0, len(self.user_cache))
+
+    def test_save(self) -> None:
+        self.user_repository.save.return_value = self.user
+
+        self.assertEqual(self.user, self.cached_user_repository.save("user", "1234"))
+        self.user_repository.save.assert_called_once_with("user", "1234")
+
+    def test_save_hashed(self) -> None:
+        self.user_repository.save_hashed.return_value = self.user
+
+        self.assertEqual(
+            self.user, self.cached_user_repository.save_hashed("user", "hash")
+        )
+        self.user_repository.save_hashed.assert_called_once_with("user", "hash")
+
+    def test_update_password_hash(self) -> None:
+        self.cached_user_repository.update_password_hash(self.user, "hash")
+
+        self.user_repository.update_password_hash.assert_called_once_with(
+            self.user, "hash"
+        )
@@ -1,12 +1,23 @@
-from django.test import TestCase
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+
 from core.domain.exceptions.match_not_accepting_guests_exception import (
     MatchNotAcceptingGuestsException,
 )
 from core.domain.exceptions.match_not_found_exception import MatchNotFoundException
+from core.domain.exceptions.open_match_not_found_exception import (
+    OpenMatchNotFoundException,
+)
 from core.domain.exceptions.repeated_player_exception import RepeatedPlayerException
 from core.domain.models.match import Match, MatchStatuses
+from core.domain.models.principal import Principal
 from core.domain.models.user import User
+from core.domain.models.user_match import UserMatch
+from core.infrastructure.caches.ttl_cache import TtlCache
 from core.infrastructure.repositories.db_match_repository import DbMatchRepository
+from core.infrastructure.repositories.db_match_unit_of_work import DbMatchUnitOfWork
 
 
 class TestIntegrationDbMatchRepository(TestCase):
@@ -26,7 +37,14 @@ class TestIntegrationDbMatchRepository(TestCase):
 
     def test_find_by_user_id(self) -> None:
         match_created = Match.objects.create(first_player=self.user)
+        UserMatch.objects.create(
+            user=self.user, match=match_created, role="first player"
+        )
         match_guest = Match.objects.create(second_player=self.user)
+        UserMatch.objects.create(
+            user=self.user, match=match_guest, role="second player"
+        )
+        Match.objects.create(first_player=self.guest)
 
         retrieved_matches = self.db_match_repository.find_by_user_id(self.user.id)
 
@@ -35,6 +53,70 @@ class TestIntegrationDbMatchRepository(TestCase):
         match_created.delete()
         match_guest.delete()
 
+    def test_find_page_by_user_id(self) -> None:
+        matches = [self.db_match_repository.save(self.user) for _ in range(5)]
+        self.db_match_repository.save_guest(self.guest, matches[1].id)
+        self.db_match_repository.save_guest(self.guest, matches[2].id)
+        other_match = self.db_match_repository.save(self.guest)
+
+        first_page = self.db_match_repository.find_page_by_user_id(self.user.id, 0, 3)
+        second_page = self.db_match_repository.find_page_by_user_id(
+            self.user.id, first_page[-1].id, 3
+        )
+
+        guest_page = self.db_match_repository.find_page_by_user_id(self.guest.id, 0, 3)
+
+        self.assertEqual(matches[:3], first_page)
+        self.assertEqual(matches[3:], second_page)
+        self.assertEqual([matches[1], matches[2], other_match], guest_page)
+
+    def test_find_open(self) -> None:
+        matches = [self.db_match_repository.save(self.user) for _ in range(4)]
+        self.db_match_repository.save_guest(self.guest, matches[2].id)
+
+        first_page = self.db_match_repository.find_open(None, 2)
+        second_page = self.db_match_repository.find_open(first_page[-1].id, 2)
+
+        self.assertEqual([matches[3], matches[1]], first_page)
+        self.assertEqual([matches[0]], second_page)
+
+    def test_find_open_skips_deleted_creators(self) -> None:
+        creator = User.objects.create(username="creator", password="1234")
+        self.db_match_repository.save(creator)
+        match = self.db_match_repository.save(self.user)
+        creator.delete()
+
+        self.assertEqual([match], self.db_match_repository.find_open(None, 10))
+
+    def test_find_open_cached(self) -> None:
+        db_match_repository = DbMatchRepository(TtlCache(ttl=60, maximum_size=8))
+        match = db_match_repository.save(self.user)
+
+        self.assertEqual([match], db_match_repository.find_open(None, 10))
+        Match.objects.filter(id=match.id).update(status=MatchStatuses.IN_PROGRESS)
+        with self.assertNumQueries(0):
+            self.assertEqual([match], db_match_repository.find_open(None, 10))
+
+        new_match = db_match_repository.save(self.guest)
+        self.assertEqual([new_match], db_match_repository.find_open(None, 10))
+
+        db_match_repository.save_guest(self.user, new_match.id)
+        self.assertEqual([], db_match_repository.find_open(None, 10))
+
+    def test_forgets_cached_users(self) -> None:
+        user_cache = TtlCache(ttl=60, maximum_size=8)
+        db_match_repository = DbMatchRepository(user_cache=user_cache)
+        for user in (self.user, self.guest):
+            user_cache.set(user.id, user)
+
+        match = db_match_repository.save(self.user)
+        self.assertIsNone(user_cache.get(self.user.id))
+
+        user_cache.set(self.user.id, self.user)
+        db_match_repository.save_guest(self.guest, match.id)
+        self.assertIsNone(user_cache.get(self.guest.id))
+        self.assertEqual(self.user, user_cache.get(self.user.id))
+
     def test_find_or_fail_by_id(self) -> None:
         match = Match.objects.create(first_player=self.user)
 
@@ -63,9 +145,57 @@ class TestIntegrationDbMatchRepository(TestCase):
         self.assertIsNone(match.winner)
         self.assertIsNone(match.second_player)
         self.assertEqual(0, match.number_of_movements)
+        self.assertEqual(1, User.objects.get(id=self.user.id).matches_total)
+        self.assertTrue(
+            UserMatch.objects.filter(
+                user=self.user, match=match, role="first player", status="awaiting"
+            ).exists()
+        )
+
+        match.delete()
+
+    def test_save_custom_board(self) -> None:
+        match = self.db_match_repository.save(self.user, 15, 15, 5)
+
+        match = Match.objects.get(id=match.id)
+        self.assertEqual(15, match.width)
+        self.assertEqual(15, match.height)
+        self.assertEqual(5, match.line_length)
+        self.assertEqual(0, match.first_player_board)
 
         match.delete()
 
+    def test_save_with_principals(self) -> None:
+        creator = Principal(id=self.user.id, username=self.user.username)
+        guest = Principal(id=self.guest.id, username=self.guest.username)
+
+        match = self.db_match_repository.save(creator)
+        self.db_match_repository.save_guest(guest, match.id)
+
+        match = Match.objects.get(id=match.id)
+        self.assertEqual(self.user, match.first_player)
+        self.assertEqual(self.guest, match.second_player)
+        self.assertEqual(2, UserMatch.objects.filter(match=match).count())
+
+    def test_save_pair(self) -> None:
+        with self.assertNumQueries(5):
+            match = self.db_match_repository.save_pair(self.user, self.guest)
+
+        match = Match.objects.get(id=match.id)
+        self.assertEqual(self.user, match.first_player)
+        self.assertEqual(self.guest, match.second_player)
+        self.assertEqual(MatchStatuses.IN_PROGRESS.value, match.status)
+        self.assertEqual(
+            [("first player", "in progress"), ("second player", "in progress")],
+            list(
+                UserMatch.objects.filter(match=match)
+                .order_by("role")
+                .values_list("role", "status")
+            ),
+        )
+        self.assertEqual(1, User.objects.get(id=self.user.id).matches_total)
+        self.assertEqual(1, User.objects.get(id=self.guest.id).matches_total)
+
     def test_save_guest(self) -> None:
         match = Match(first_player=self.user)
         match.save()
@@ -85,6 +215,12 @@ class TestIntegrationDbMatchRepository(TestCase):
         self.assertIsNone(match.winner)
         self.assertEqual(self.guest, match.second_player)
         self.assertEqual(0, match.number_of_movements)
+        self.assertEqual(1, User.objects.get(id=self.guest.id).matches_total)
+        self.assertTrue(
+            UserMatch.objects.filter(
+                user=self.guest, match=match, role="second player", status="in progress"
+            ).exists()
+        )
 
         match.delete()
 
@@ -132,54 +268,172 @@ class TestIntegrationDbMatchRepository(TestCase):
 
         match.delete()
 
-    def test_end_match_with_winner(self) -> None:
-        match = Match(
-            first_player=self.user,
-            second_player=self.guest,
-            status=MatchStatuses.IN_PROGRESS,
+    def test_save_any_guest(self) -> None:
+        guest_match = self.db_match_repository.save(self.guest)
+        first_match = self.db_match_repository.save(self.user)
+        second_match = self.db_match_repository.save(self.user)
+
+        with self.assertNumQueries(7):
+            joined_match = self.db_match_repository.save_any_guest(self.guest)
+
+        self.assertEqual(first_match, joined_match)
+        self.assertEqual(self.guest, Match.objects.get(id=first_match.id).second_player)
+        self.assertEqual(2, User.objects.get(id=self.guest.id).matches_total)
+        self.assertEqual(
+            {"in progress"},
+            set(
+                UserMatch.objects.filter(match=first_match).values_list(
+                    "status", flat=True
+                )
+            ),
+        )
+        self.assertEqual(
+            guest_match, self.db_match_repository.save_any_guest(self.guest2)
+        )
+        self.assertEqual(
+            second_match, self.db_match_repository.save_any_guest(self.guest2)
         )
-        match.save()
 
-        self.assertEqual(self.user, match.first_player)
-        self.assertEqual(self.guest, match.second_player)
-        self.assertEqual(MatchStatuses.IN_PROGRESS.value, match.status)
-        self.assertIsNone(match.winner)
+    def test_save_any_guest_no_open_match(self) -> None:
+        self.db_match_repository.save(self.guest)
 
-        self.db_match_repository.end_match(match.id, "first player")
+        with self.assertRaises(OpenMatchNotFoundException):
+            self.db_match_repository.save_any_guest(self.guest)
 
-        match = Match.objects.get(id=match.id)
+        self.assertEqual(1, User.objects.get(id=self.guest.id).matches_total)
 
-        self.assertEqual(self.user, match.first_player)
-        self.assertEqual(self.guest, match.second_player)
-        self.assertEqual(MatchStatuses.FINISHED.value, match.status)
-        self.assertEqual(self.user, match.winner)
+    def test_save_any_guest_skips_deleted_creators(self) -> None:
+        creator = User.objects.create(username="creator", password="1234")
+        orphan_match = self.db_match_repository.save(creator)
+        creator.delete()
 
-        match.delete()
+        with self.assertRaises(OpenMatchNotFoundException):
+            self.db_match_repository.save_any_guest(self.guest)
 
-    def test_end_match_without_winner(self) -> None:
-        match = Match(
-            first_player=self.user,
-            second_player=self.guest,
-            status=MatchStatuses.IN_PROGRESS,
+        self.assertEqual(
+            MatchStatuses.AWAITING.value, Match.objects.get(id=orphan_match.id).status
         )
-        match.save()
+        self.assertEqual(0, User.objects.get(id=self.guest.id).matches_total)
 
-        self.assertEqual(self.user, match.first_player)
-        self.assertEqual(self.guest, match.second_player)
-        self.assertEqual(MatchStatuses.IN_PROGRESS.value, match.status)
-        self.assertIsNone(match.winner)
 
-        self.db_match_repository.end_match(match.id, None)
+class TestConcurrentDbMatchRepository(TransactionTestCase):
+    NUMBER_OF_MATCHES = 50
 
-        match = Match.objects.get(id=match.id)
+    def setUp(self) -> None:
+        self.user = User.objects.create(username="user1", password="1234")
+        self.guest = User.objects.create(username="user2", password="1234")
+        self.db_match_repository = DbMatchRepository()
 
-        self.assertEqual(self.user, match.first_player)
-        self.assertEqual(self.guest, match.second_player)
-        self.assertEqual(MatchStatuses.FINISHED.value, match.status)
-        self.assertIsNone(match.winner)
+    def test_concurrent_counters(self) -> None:
+        matches = [
+            self.db_match_repository.save(self.user)
+            for _ in range(self.NUMBER_OF_MATCHES)
+        ]
 
-        match.delete()
+        self.__run_in_threads(
+            lambda match: self.db_match_repository.save_guest(self.guest, match.id),
+            matches,
+        )
+        for match in matches:
+            Match.objects.filter(id=match.id).update(
+                first_player_board=0b000000011,
+                second_player_board=0b000011000,
+                number_of_movements=4 if match.id % 2 else 5,
+            )
+        self.__run_in_threads(self.__win, matches)
+
+        user = User.objects.get(id=self.user.id)
+        guest = User.objects.get(id=self.guest.id)
+        first_player_wins = sum(1 for match in matches if match.id % 2)
+        self.assertEqual(self.NUMBER_OF_MATCHES, user.matches_total)
+        self.assertEqual(self.NUMBER_OF_MATCHES, guest.matches_total)
+        self.assertEqual(first_player_wins, user.matches_won)
+        self.assertEqual(self.NUMBER_OF_MATCHES - first_player_wins, guest.matches_won)
+
+    def test_concurrent_save_any_guest(self) -> None:
+        guests = [
+            User.objects.create(username=f"guest{guest}", password="1234")
+            for guest in range(self.NUMBER_OF_MATCHES)
+        ]
+        matches = [
+            self.db_match_repository.save(self.user)
+            for _ in range(self.NUMBER_OF_MATCHES // 2)
+        ]
+
+        joined_matches = []
+
+        def join_any(guest: User) -> None:
+            try:
+                joined_matches.append(self.db_match_repository.save_any_guest(guest))
+            except OpenMatchNotFoundException:
+                pass
+
+        self.__run_in_threads(join_any, guests)
+
+        self.assertEqual(
+            sorted(match.id for match in matches),
+            sorted(match.id for match in joined_matches),
+        )
+        self.assertEqual(
+            len(matches),
+            UserMatch.objects.filter(role="second player").count(),
+        )
+        self.assertEqual(
+            len(matches),
+            User.objects.filter(id__in=[guest.id for guest in guests])
+            .filter(matches_total=1)
+            .count(),
+        )
 
-    def test_end_match_no_match(self) -> None:
-        with self.assertRaises(MatchNotFoundException):
-            self.db_match_repository.end_match(0, None)
+    def test_concurrent_save_guest(self) -> None:
+        guests = [
+            User.objects.create(username=f"guest{guest}", password="1234")
+            for guest in range(self.NUMBER_OF_MATCHES)
+        ]
+        match = self.db_match_repository.save(self.user)
+
+        joined_guests = []
+
+        def join(guest: User) -> None:
+            try:
+                self.db_match_repository.save_guest(guest, match.id)
+                joined_guests.append(guest)
+            except MatchNotAcceptingGuestsException:
+                pass
+
+        self.__run_in_threads(join, guests)
+
+        self.assertEqual(1, len(joined_guests))
+        self.assertEqual(joined_guests[0], Match.objects.get(id=match.id).second_player)
+        self.assertEqual(
+            1,
+            UserMatch.objects.filter(match=match, role="second player").count(),
+        )
+        self.assertEqual(
+            1,
+            User.objects.filter(id__in=[guest.id for guest in guests])
+            .filter(matches_total=1)
+            .count(),
+        )
+
+    def __win(self, match: Match) -> None:
+        db_match_unit_of_work = DbMatchUnitOfWork()
+        match = db_match_unit_of_work.find_or_fail_by_id(match.id)
+        if match.id % 2:
+            match.play(self.user, 0, 2)
+            match.finish("first player")
+            db_match_unit_of_work.commit(match, 0, 2)
+        else:
+            match.play(self.guest, 1, 2)
+            match.finish("second player")
+            db_match_unit_of_work.commit(match, 1, 2)
+
+    def __run_in_threads(self, operation, matches: list[Match]) -> None:
+        def run(match: Match) -> None:
+            try:
+                operation(match)
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(run, matches))
@@ -0,0 +1,129 @@
+from django.test import TestCase
+
+from core.domain.exceptions.concurrent_movement_exception import (
+    ConcurrentMovementException,
+)
+from core.domain.exceptions.match_not_found_exception import MatchNotFoundException
+from core.domain.models.match import Match, MatchStatuses
+from core.domain.models.movement import Movement
+from core.domain.models.user import User
+from core.domain.models.user_match import UserMatch
+from core.infrastructure.caches.ttl_cache import TtlCache
+from core.infrastructure.repositories.db_match_unit_of_work import DbMatchUnitOfWork
+
+
+class TestDbMatchUnitOfWork(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create(username="user1", password="1234")
+        cls.guest = User.objects.create(username="user2", password="1234")
+
+        cls.match = Match.objects.create(
+            status=MatchStatuses.IN_PROGRESS,
+            number_of_movements=0,
+            first_player=cls.user,
+            second_player=cls.guest,
+        )
+        cls.match_about_to_win = Match.objects.create(
+            status=MatchStatuses.IN_PROGRESS,
+            number_of_movements=5,
+            first_player=cls.user,
+            second_player=cls.guest,
+            first_player_board=0b000000011,
+            second_player_board=0b000011000,
+        )
+        UserMatch.objects.create(
+            user=cls.user,
+            match=cls.match_about_to_win,
+            role="first player",
+            status=MatchStatuses.IN_PROGRESS,
+        )
+        cls.gomoku_match = Match.objects.create(
+            status=MatchStatuses.IN_PROGRESS,
+            number_of_movements=0,
+            first_player=cls.user,
+            second_player=cls.guest,
+            width=15,
+            height=15,
+            line_length=5,
+        )
+
+    def setUp(self) -> None:
+        self.user_cache = TtlCache(ttl=60, maximum_size=8)
+        self.db_match_unit_of_work = DbMatchUnitOfWork(self.user_cache)
+
+    def test_find_or_fail_by_id(self) -> None:
+        match = self.db_match_unit_of_work.find_or_fail_by_id(self.match.id)
+
+        self.assertEqual(self.match, match)
+
+    def test_find_or_fail_by_id_not_found(self) -> None:
+        with self.assertRaises(MatchNotFoundException):
+            self.db_match_unit_of_work.find_or_fail_by_id(0)
+
+    def test_commit(self) -> None:
+        match = self.db_match_unit_of_work.find_or_fail_by_id(self.match.id)
+        match.play(self.user, 0, 0)
+
+        self.db_match_unit_of_work.commit(match, 0, 0)
+
+        match = Match.objects.get(id=self.match.id)
+        self.assertEqual(1, match.number_of_movements)
+        self.assertEqual(0b000000001, match.first_player_board)
+        self.assertEqual(0, match.second_player_board)
+        self.assertTrue(
+            Movement.objects.filter(
+                match=match, x=0, y=0, number=1, _player="first player"
+            ).exists()
+        )
+
+    def test_commit_concurrent_movement(self) -> None:
+        match = self.db_match_unit_of_work.find_or_fail_by_id(self.match.id)
+        concurrent_match = self.db_match_unit_of_work.find_or_fail_by_id(self.match.id)
+        match.play(self.user, 0, 0)
+        concurrent_match.play(self.user, 1, 1)
+        self.db_match_unit_of_work.commit(match, 0, 0)
+
+        with self.assertRaises(ConcurrentMovementException):
+            self.db_match_unit_of_work.commit(concurrent_match, 1, 1)
+
+        match = Match.objects.get(id=self.match.id)
+        self.assertEqual(1, match.number_of_movements)
+        self.assertEqual(0b000000001, match.first_player_board)
+        self.assertEqual(1, Movement.objects.filter(match=match).count())
+
+    def test_commit_winner(self) -> None:
+        match = self.db_match_unit_of_work.find_or_fail_by_id(
+            self.match_about_to_win.id
+        )
+        match.play(self.guest, 1, 2)
+        match.finish("second player")
+        self.user_cache.set(self.user.id, self.user)
+        self.user_cache.set(self.guest.id, self.guest)
+
+        with self.assertNumQueries(6):
+            self.db_match_unit_of_work.commit(match, 1, 2)
+
+        match = Match.objects.get(id=self.match_about_to_win.id)
+        self.assertEqual(MatchStatuses.FINISHED.value, match.status)
+        self.assertEqual(self.guest, match.winner)
+        self.assertEqual(0b000111000, match.second_player_board)
+        self.assertEqual(1, User.objects.get(id=self.guest.id).matches_won)
+        self.assertEqual(0, User.objects.get(id=self.user.id).matches_won)
+        self.assertIsNone(self.user_cache.get(self.guest.id))
+        self.assertEqual(self.user, self.user_cache.get(self.user.id))
+        self.assertEqual(
+            MatchStatuses.FINISHED.value,
+            UserMatch.objects.get(match=self.match_about_to_win).status,
+        )
+
+    def test_commit_large_board(self) -> None:
+        match = self.db_match_unit_of_work.find_or_fail_by_id(self.gomoku_match.id)
+        match.play(self.user, 14, 14)
+
+        self.db_match_unit_of_work.commit(match, 14, 14)
+
+        match = Match.objects.get(id=self.gomoku_match.id)
+        self.assertEqual(1, match.number_of_movements)
+        self.assertEqual(1 << 224, match.first_player_board)
+        self.assertEqual("first player", match.get_slot(14, 14))
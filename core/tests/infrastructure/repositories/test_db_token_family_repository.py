@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+
+from django.test import TestCase
+from freezegun import freeze_time
+
+from core.domain.models.token_family import TokenFamily
+from core.infrastructure.repositories.db_token_family_repository import (
+    DbTokenFamilyRepository,
+)
+
+
+@freeze_time("2023-08-22")
+class TestDbTokenFamilyRepository(TestCase):
+    def setUp(self) -> None:
+        self.db_token_family_repository = DbTokenFamilyRepository()
+        self.expires_at = datetime(2023, 8, 23, tzinfo=timezone.utc)
+        self.db_token_family_repository.save("family", 1, "jti1", self.expires_at)
+
+    def test_rotate(self) -> None:
+        later = datetime(2023, 8, 24, tzinfo=timezone.utc)
+
+        with self.assertNumQueries(1):
+            rotated = self.db_token_family_repository.rotate(
+                "family", "jti1", "jti2", later
+            )
+
+        self.assertTrue(rotated)
+        self.assertEqual(later, TokenFamily.objects.get().expires_at)
+        self.assertTrue(
+            self.db_token_family_repository.rotate(
+                "family", "jti2", "jti3", self.expires_at
+            )
+        )
+
+    def test_rotate_retired_token_revokes_family(self) -> None:
+        self.db_token_family_repository.rotate(
+            "family", "jti1", "jti2", self.expires_at
+        )
+
+        rotated = self.db_token_family_repository.rotate(
+            "family", "jti1", "jti3", self.expires_at
+        )
+
+        self.assertFalse(rotated)
+        self.assertFalse(TokenFamily.objects.exists())
+        self.assertFalse(
+            self.db_token_family_repository.rotate(
+                "family", "jti2", "jti3", self.expires_at
+            )
+        )
+
+    def test_rotate_unknown_family(self) -> None:
+        self.assertFalse(
+            self.db_token_family_repository.rotate(
+                "other", "jti1", "jti2", self.expires_at
+            )
+        )
+        self.assertEqual(1, TokenFamily.objects.count())
+
+    def test_delete(self) -> None:
+        self.db_token_family_repository.delete("family")
+
+        self.assertFalse(TokenFamily.objects.exists())
+
+    def test_purge_expired(self) -> None:
+        expired_at = datetime(2023, 8, 21, tzinfo=timezone.utc)
+        for number in range(5):
+            self.db_token_family_repository.save(
+                f"expired{number}", 1, "jti", expired_at
+            )
+
+        with self.assertNumQueries(7):
+            number_of_purged = self.db_token_family_repository.purge_expired(2)
+
+        self.assertEqual(5, number_of_purged)
+        self.assertEqual(1, TokenFamily.objects.count())
@@ -1,4 +1,4 @@
-from django.contrib.auth.hashers import check_password
+from django.contrib.auth.hashers import check_password, make_password
 from django.test import TestCase
 
 from core.domain.models.user import User
@@ -53,3 +53,39 @@ class TestIntegrationDbUserRepository(TestCase):
         self.assertTrue(check_password("test", user.password))
 
         user.delete()
+
+    def test_save_hashed(self) -> None:
+        password_hash = make_password("test")
+
+        user = self.db_user_repository.save_hashed("user_test", password_hash)
+
+        self.assertEqual(password_hash, User.objects.get(id=user.id).password)
+
+    def test_update_password_hash(self) -> None:
+        user = self.db_user_repository.save("user_test", "test")
+        password_hash = make_password("test2")
+
+        self.db_user_repository.update_password_hash(user, password_hash)
+
+        self.assertEqual(password_hash, User.objects.get(id=user.id).password)
+
+    def test_save_many_hashed(self) -> None:
+        User.objects.create(username="taken", password="test")
+        password_hash = make_password("test")
+
+        with self.assertNumQueries(4):
+            conflicts = self.db_user_repository.save_many_hashed(
+                [
+                    ("user1", password_hash),
+                    ("taken", password_hash),
+                    ("user2", password_hash),
+                    ("user1", password_hash),
+                ]
+            )
+
+        self.assertEqual([1, 3], conflicts)
+        self.assertEqual(
+            ["taken", "user1", "user2"],
+            list(User.objects.order_by("username").values_list("username", flat=True)),
+        )
+        self.assertEqual(password_hash, User.objects.get(username="user2").password)
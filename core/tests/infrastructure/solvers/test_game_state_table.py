@@ -0,0 +1,74 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from core.infrastructure.checkers.board_outcome_table import BoardOutcomeTable
+from core.infrastructure.generators.canonical_board_generator import (
+    CanonicalBoardGenerator,
+)
+from core.infrastructure.solvers.game_state_table import GameStateTable
+from core.infrastructure.solvers.game_state_table_writer import GameStateTableWriter
+from core.infrastructure.solvers.negamax_solver import NegamaxSolver
+
+
+class TestGameStateTable(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, "game_state_table.bin")
+        cls.solver = NegamaxSolver(CanonicalBoardGenerator())
+        cls.board_outcome_table = BoardOutcomeTable()
+        cls.writer = GameStateTableWriter(cls.solver, cls.board_outcome_table)
+        cls.number_of_positions = cls.writer.write(cls.path)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.directory.cleanup()
+
+    def setUp(self) -> None:
+        self.table = GameStateTable(self.path)
+
+    def test_write(self) -> None:
+        self.assertEqual(5478, self.number_of_positions)
+        self.assertTrue(self.table.is_available())
+        self.assertEqual(5478, self.table.number_of_positions())
+
+    def test_lookup_matches_solver(self) -> None:
+        for first_player_board, second_player_board in self.writer.legal_positions():
+            self.assertEqual(
+                self.solver.solve(first_player_board, second_player_board),
+                self.table.lookup(first_player_board, second_player_board),
+            )
+
+    def test_lookup_illegal_position(self) -> None:
+        self.assertIsNone(self.table.lookup(0b000000111, 0b000111000))
+
+    def test_classify_matches_board_outcome_table(self) -> None:
+        for code in range(3**9):
+            self.assertEqual(
+                self.board_outcome_table.classify_code(code),
+                self.table.classify_code(code),
+            )
+
+    def test_missing_file(self) -> None:
+        table = GameStateTable(os.path.join(self.directory.name, "missing.bin"))
+
+        self.assertFalse(table.is_available())
+        self.assertEqual(0, table.classify(0, 0))
+        self.assertEqual(0, table.number_of_positions())
+        self.assertIsNone(table.lookup(0, 0))
+
+    def test_solver_without_table_file(self) -> None:
+        table = GameStateTable(os.path.join(self.directory.name, "missing.bin"))
+        solver = NegamaxSolver(CanonicalBoardGenerator(), table)
+
+        self.assertEqual(self.solver.solve(0, 0), solver.solve(0, 0))
+        self.assertEqual(
+            self.solver.solve(0b000010000, 0b000000001),
+            solver.solve(0b000010000, 0b000000001),
+        )
+
+    def test_solver_uses_table(self) -> None:
+        solver = NegamaxSolver(CanonicalBoardGenerator(), self.table)
+
+        self.assertEqual(self.table.lookup(0, 0), solver.solve(0, 0))
@@ -0,0 +1,64 @@
+from unittest import TestCase
+
+from core.infrastructure.generators.canonical_board_generator import (
+    CanonicalBoardGenerator,
+)
+from core.infrastructure.solvers.negamax_solver import NegamaxSolver
+from core.infrastructure.solvers.solved_position import SolvedPosition
+
+
+class TestNegamaxSolver(TestCase):
+    def setUp(self) -> None:
+        self.solver = NegamaxSolver(CanonicalBoardGenerator())
+
+    def test_solve_empty_board(self) -> None:
+        solved_position = self.solver.solve(0, 0)
+
+        self.assertEqual(0, solved_position.value)
+        self.assertEqual(9, solved_position.depth)
+        self.assertIsNotNone(solved_position.best_move)
+
+    def test_solve_immediate_win(self) -> None:
+        solved_position = self.solver.solve(0b000000011, 0b000011000)
+
+        self.assertEqual(
+            SolvedPosition(value=1, best_move=(0, 2), depth=1), solved_position
+        )
+
+    def test_solve_immediate_win_second_player(self) -> None:
+        solved_position = self.solver.solve(0b100000011, 0b000011000)
+
+        self.assertEqual(
+            SolvedPosition(value=1, best_move=(1, 2), depth=1), solved_position
+        )
+
+    def test_solve_forced_block(self) -> None:
+        solved_position = self.solver.solve(0b000000011, 0b000010000)
+
+        self.assertEqual((0, 2), solved_position.best_move)
+        self.assertEqual(0, solved_position.value)
+
+    def test_solve_symmetric_positions(self) -> None:
+        solved_position = self.solver.solve(0b011000000, 0b000011000)
+        rotated_position = self.solver.solve(0b001001000, 0b000010010)
+
+        self.assertEqual(
+            SolvedPosition(value=1, best_move=(2, 2), depth=1), solved_position
+        )
+        self.assertEqual(
+            SolvedPosition(value=1, best_move=(0, 0), depth=1), rotated_position
+        )
+
+    def test_solve_finished_board(self) -> None:
+        solved_position = self.solver.solve(0b000000111, 0b000011000)
+
+        self.assertEqual(
+            SolvedPosition(value=-1, best_move=None, depth=0), solved_position
+        )
+
+    def test_solve_draw_board(self) -> None:
+        solved_position = self.solver.solve(0b110001101, 0b001110010)
+
+        self.assertEqual(
+            SolvedPosition(value=0, best_move=None, depth=0), solved_position
+        )
@@ -1,11 +1,14 @@
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+import jwt
 from freezegun import freeze_time
 
 from core.domain.exceptions.jwt_verification_exception import JWTVerificationException
 from core.domain.models.user import User
+from core.infrastructure.caches.ttl_cache import TtlCache
 from core.infrastructure.verifiers.jwt_verifier import JWTVerifier
+from core.infrastructure.verifiers.token_revocation_list import TokenRevocationList
 
 
 class TestJWTVerifier(TestCase):
@@ -46,3 +49,78 @@ class TestJWTVerifier(TestCase):
 
         with self.assertRaises(JWTVerificationException):
             self.jwt_verifier.verify(jwt)
+
+
+@freeze_time("2023-08-22")
+class TestCachedJWTVerifier(TestCase):
+    def setUp(self) -> None:
+        self.token_cache = TtlCache(ttl=300, maximum_size=8)
+        self.jwt_verifier = JWTVerifier(self.token_cache)
+        self.token = (
+            "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJ1c2VyX2lkIjoxLCJleHAiO"
+            "jE2OTI3NDg4MDAsImlhdCI6MTY5MjY2MjQwMCwicmVmcmVzaF90b2tlbiI6ZmFsc2V9."
+            "r-2WjLeEj8_-6zf4wbYs9-oqr2FWd93YiUmn2itnSzw"
+        )
+
+    def test_verify_cached(self) -> None:
+        with patch(
+            "core.infrastructure.verifiers.jwt_verifier.jwt.decode",
+            wraps=jwt.decode,
+        ) as decode:
+            first_payload = self.jwt_verifier.verify(self.token)
+            second_payload = self.jwt_verifier.verify(self.token)
+
+        self.assertEqual(first_payload, second_payload)
+        self.assertEqual(1, decode.call_count)
+        self.assertEqual(1, self.token_cache.hits)
+
+    def test_verify_expires_with_token(self) -> None:
+        with freeze_time("2023-08-22 23:58:00") as frozen_time:
+            self.jwt_verifier.verify(self.token)
+
+            frozen_time.tick(119)
+            self.assertEqual(1, self.jwt_verifier.verify(self.token)["user_id"])
+
+            frozen_time.tick(2)
+            with self.assertRaises(JWTVerificationException):
+                self.jwt_verifier.verify(self.token)
+
+    def test_verify_fails_not_cached(self) -> None:
+        tampered_token = self.token[:-2] + "xx"
+
+        for _ in range(2):
+            with self.assertRaises(JWTVerificationException):
+                self.jwt_verifier.verify(tampered_token)
+
+        self.assertEqual(0, len(self.token_cache))
+
+
+@freeze_time("2023-08-22")
+class TestRevokedJWTVerifier(TestCase):
+    def setUp(self) -> None:
+        self.token_revocation_list = Mock(spec=TokenRevocationList)
+        self.token_revocation_list.is_revoked.return_value = False
+        self.jwt_verifier = JWTVerifier(
+            TtlCache(ttl=300, maximum_size=8), self.token_revocation_list
+        )
+        self.token = (
+            "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJ1c2VyX2lkIjoxLCJleHAiO"
+            "jE2OTI3NDg4MDAsImlhdCI6MTY5MjY2MjQwMCwicmVmcmVzaF90b2tlbiI6ZmFsc2"
+            "UsImp0aSI6IjAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAxIiwidXNlcm5h"
+            "bWUiOiJ1c2VyIn0.X6ZF58sgO5YFo2Grf6TLDY1cztWdHKocHlwPys4iuN8"
+        )
+
+    def test_verify(self) -> None:
+        payload = self.jwt_verifier.verify(self.token)
+
+        self.assertEqual("00000000000000000000000000000001", payload["jti"])
+        self.token_revocation_list.is_revoked.assert_called_once_with(
+            "00000000000000000000000000000001"
+        )
+
+    def test_verify_revoked_after_caching(self) -> None:
+        self.jwt_verifier.verify(self.token)
+        self.token_revocation_list.is_revoked.return_value = True
+
+        with self.assertRaises(JWTVerificationException):
+            self.jwt_verifier.verify(self.token)
@@ -0,0 +1,112 @@
+from datetime import datetime, timezone
+
+from django.test import TestCase
+from freezegun import freeze_time
+
+from core.domain.models.revoked_token import RevokedToken
+from core.infrastructure.verifiers.token_revocation_list import TokenRevocationList
+
+
+@freeze_time("2023-08-22 00:00:00")
+class TestTokenRevocationList(TestCase):
+    def setUp(self) -> None:
+        self.token_revocation_list = TokenRevocationList(
+            refresh_interval=5,
+            capacity=1000,
+            false_positive_rate=0.01,
+            refresh_overlap=100,
+        )
+        self.expires_at = datetime(2023, 8, 23, tzinfo=timezone.utc)
+
+    def test_revoke(self) -> None:
+        self.assertFalse(self.token_revocation_list.is_revoked("jti1"))
+
+        self.assertTrue(self.token_revocation_list.revoke("jti1", self.expires_at))
+        self.assertFalse(self.token_revocation_list.revoke("jti1", self.expires_at))
+
+        self.assertTrue(self.token_revocation_list.is_revoked("jti1"))
+        self.assertFalse(self.token_revocation_list.is_revoked("jti2"))
+        self.assertEqual(1, RevokedToken.objects.filter(jti="jti1").count())
+
+    def test_is_revoked_without_jti(self) -> None:
+        with self.assertNumQueries(0):
+            self.assertFalse(self.token_revocation_list.is_revoked(None))
+
+    def test_is_revoked_skips_table_on_filter_miss(self) -> None:
+        self.token_revocation_list.refresh()
+
+        with self.assertNumQueries(0):
+            self.assertFalse(self.token_revocation_list.is_revoked("jti1"))
+
+    def test_refresh(self) -> None:
+        with freeze_time("2023-08-22 00:00:00") as frozen_time:
+            self.assertFalse(self.token_revocation_list.is_revoked("jti1"))
+            RevokedToken.objects.create(jti="jti1", expires_at=self.expires_at)
+
+            self.assertFalse(self.token_revocation_list.is_revoked("jti1"))
+
+            frozen_time.tick(5)
+            self.assertTrue(self.token_revocation_list.is_revoked("jti1"))
+
+    def test_refresh_loads_new_revocations(self) -> None:
+        self.token_revocation_list.revoke("jti1", self.expires_at)
+        self.token_revocation_list.clear()
+        self.token_revocation_list.refresh()
+        RevokedToken.objects.create(jti="jti2", expires_at=self.expires_at)
+
+        with self.assertNumQueries(1):
+            self.token_revocation_list.refresh()
+
+        self.assertTrue(self.token_revocation_list.is_revoked("jti1"))
+        self.assertTrue(self.token_revocation_list.is_revoked("jti2"))
+
+    def test_refresh_loads_revocations_committed_out_of_order(self) -> None:
+        RevokedToken.objects.create(id=10, jti="jti1", expires_at=self.expires_at)
+        self.token_revocation_list.refresh()
+        RevokedToken.objects.create(id=5, jti="jti2", expires_at=self.expires_at)
+
+        self.token_revocation_list.refresh()
+
+        self.assertTrue(self.token_revocation_list.is_revoked("jti2"))
+
+    def test_is_revoked_ignores_expired_tokens(self) -> None:
+        with freeze_time("2023-08-22 00:00:00") as frozen_time:
+            self.token_revocation_list.revoke("jti1", self.expires_at)
+
+            frozen_time.tick(24 * 60 * 60)
+
+            self.assertFalse(self.token_revocation_list.is_revoked("jti1"))
+
+    def test_refresh_rebuilds_past_capacity(self) -> None:
+        token_revocation_list = TokenRevocationList(
+            refresh_interval=5,
+            capacity=1,
+            false_positive_rate=0.01,
+            refresh_overlap=100,
+        )
+        RevokedToken.objects.create(jti="jti1", expires_at=self.expires_at)
+        RevokedToken.objects.create(jti="jti2", expires_at=self.expires_at)
+
+        token_revocation_list.refresh()
+
+        self.assertTrue(token_revocation_list.is_revoked("jti1"))
+        self.assertTrue(token_revocation_list.is_revoked("jti2"))
+
+    def test_clear(self) -> None:
+        self.token_revocation_list.refresh()
+        RevokedToken.objects.create(jti="jti1", expires_at=self.expires_at)
+
+        self.token_revocation_list.clear()
+
+        self.assertTrue(self.token_revocation_list.is_revoked("jti1"))
+
+    def test_purge_expired(self) -> None:
+        self.token_revocation_list.revoke(
+            "jti1", datetime(2023, 8, 21, tzinfo=timezone.utc)
+        )
+        self.token_revocation_list.revoke("jti2", self.expires_at)
+
+        self.assertEqual(1, self.token_revocation_list.purge_expired(1000))
+        self.assertEqual(
+            ["jti2"], list(RevokedToken.objects.values_list("jti", flat=True))
+        )
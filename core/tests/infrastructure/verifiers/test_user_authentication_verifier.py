@@ -7,12 +7,14 @@ from core.domain.exceptions.jwt_verification_exception import JWTVerificationExc
 from core.domain.exceptions.user_authentication_exception import (
     UserAuthenticationException,
 )
+from core.domain.models.principal import Principal
 from core.domain.models.user import User
 from core.domain.repositories.user_repository import UserRepository
 from core.infrastructure.verifiers.jwt_verifier import JWTVerifier
 from core.infrastructure.verifiers.user_authentication_verifier import (
     UserAuthenticationVerifier,
 )
+from core.infrastructure.verifiers.user_revocation_set import UserRevocationSet
 
 
 class TestUSerAuthenticationVerifier(TestCase):
@@ -23,8 +25,10 @@ class TestUSerAuthenticationVerifier(TestCase):
     def setUp(self) -> None:
         self.user_repository = Mock(spec=UserRepository)
         self.jwt_verifier = Mock(spec=JWTVerifier)
+        self.user_revocation_set = Mock(spec=UserRevocationSet)
+        self.user_revocation_set.is_revoked.return_value = False
         self.user_auth_verifier = UserAuthenticationVerifier(
-            self.user_repository, self.jwt_verifier
+            self.user_repository, self.jwt_verifier, self.user_revocation_set
         )
         self.request = Mock(spec=HttpRequest)
         self.request.META = {"HTTP_AUTHORIZATION": "Bearer ey29..."}
@@ -66,3 +70,43 @@ class TestUSerAuthenticationVerifier(TestCase):
 
         self.jwt_verifier.verify.assert_called_once_with("ey29...")
         self.user_repository.find_by_id.assert_called_once_with(2)
+
+    def test_verify_principal(self) -> None:
+        self.jwt_verifier.verify.return_value = {"user_id": 1, "username": "user"}
+
+        principal = self.user_auth_verifier.verify_principal(self.request)
+
+        self.assertEqual(Principal(id=1, username="user"), principal)
+        self.user_revocation_set.is_revoked.assert_called_once_with(1)
+        self.user_repository.find_by_id.assert_not_called()
+
+    def test_verify_principal_without_username_claim(self) -> None:
+        self.jwt_verifier.verify.return_value = {"user_id": 1}
+        self.user_repository.find_by_id.return_value = self.user
+
+        principal = self.user_auth_verifier.verify_principal(self.request)
+
+        self.assertEqual(Principal(id=1, username="user"), principal)
+        self.user_repository.find_by_id.assert_called_once_with(1)
+
+    def test_verify_principal_no_user(self) -> None:
+        self.jwt_verifier.verify.return_value = {"user_id": 2}
+        self.user_repository.find_by_id.return_value = None
+
+        with self.assertRaises(UserAuthenticationException):
+            self.user_auth_verifier.verify_principal(self.request)
+
+    def test_verify_principal_revoked(self) -> None:
+        self.jwt_verifier.verify.return_value = {"user_id": 1, "username": "user"}
+        self.user_revocation_set.is_revoked.return_value = True
+
+        with self.assertRaises(UserAuthenticationException):
+            self.user_auth_verifier.verify_principal(self.request)
+
+    def test_verify_principal_invalid_token(self) -> None:
+        self.jwt_verifier.verify.side_effect = JWTVerificationException()
+
+        with self.assertRaises(UserAuthenticationException):
+            self.user_auth_verifier.verify_principal(self.request)
+
+        self.user_revocation_set.is_revoked.assert_not_called()
@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from freezegun import freeze_time
+
+from core.dependency_injection_factories.infrastructure.verifiers.user_revocation_set_factory import (
+    UserRevocationSetFactory,
+)
+from core.domain.models.revoked_user import RevokedUser
+from core.domain.models.user import User
+from core.infrastructure.verifiers.user_revocation_set import UserRevocationSet
+
+
+class TestUserRevocationSet(TestCase):
+    def setUp(self) -> None:
+        self.user_revocation_set = UserRevocationSet(refresh_interval=5)
+
+    def test_revoke(self) -> None:
+        self.assertFalse(self.user_revocation_set.is_revoked(1))
+
+        self.user_revocation_set.revoke(1)
+        self.user_revocation_set.revoke(1)
+
+        self.assertTrue(self.user_revocation_set.is_revoked(1))
+        self.assertFalse(self.user_revocation_set.is_revoked(2))
+        self.assertEqual(1, RevokedUser.objects.filter(user_id=1).count())
+
+    def test_refresh(self) -> None:
+        with freeze_time("2023-08-22 00:00:00") as frozen_time:
+            self.assertFalse(self.user_revocation_set.is_revoked(1))
+            RevokedUser.objects.create(user_id=1)
+
+            with self.assertNumQueries(0):
+                self.assertFalse(self.user_revocation_set.is_revoked(1))
+
+            frozen_time.tick(5)
+            self.assertTrue(self.user_revocation_set.is_revoked(1))
+
+    def test_refresh_forgets_old_revocations(self) -> None:
+        with freeze_time("2023-08-22 00:00:00") as frozen_time:
+            self.user_revocation_set.revoke(1)
+
+            frozen_time.tick(timedelta(days=1, seconds=1))
+            self.user_revocation_set.refresh()
+
+            self.assertFalse(self.user_revocation_set.is_revoked(1))
+
+    def test_purge_expired(self) -> None:
+        with freeze_time("2023-08-22 00:00:00") as frozen_time:
+            self.user_revocation_set.revoke(1)
+
+            frozen_time.tick(timedelta(days=1, seconds=1))
+            self.user_revocation_set.revoke(2)
+
+            self.assertEqual(1, self.user_revocation_set.purge_expired(1000))
+            self.assertEqual(
+                [2], list(RevokedUser.objects.values_list("user_id", flat=True))
+            )
+
+    def test_deleted_user_is_revoked(self) -> None:
+        user = User.objects.create(username="user", password="1234")
+        user_id = user.id
+        user_revocation_set = UserRevocationSetFactory.create()
+
+        try:
+            user.delete()
+
+            self.assertTrue(user_revocation_set.is_revoked(user_id))
+        finally:
+            RevokedUser.objects.all().delete()
+            user_revocation_set.refresh()
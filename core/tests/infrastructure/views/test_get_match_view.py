@@ -49,6 +49,7 @@ class TestGetMatchView(TestCase):
         self.assertEqual(200, retrieved_response.status_code)
         self.assertEqual(
             b'{"status": "in progress", "number_of_movements": 0, '
+            b'"width": 3, "height": 3, "line_length": 3, '
             b'"board": [[null, null, null], [null, null, null], [null, null, null]], '
             b'"first_player_id": 1, "first_player_username": "user", '
             b'"second_player_id": 2, "second_player_username": "user2"}',
@@ -66,6 +67,7 @@ class TestGetMatchView(TestCase):
         self.assertEqual(200, retrieved_response.status_code)
         self.assertEqual(
             b'{"status": "finished", "number_of_movements": 0, '
+            b'"width": 3, "height": 3, "line_length": 3, '
             b'"board": [[null, null, null], [null, null, null], [null, null, null]], '
             b'"first_player_id": 1, "first_player_username": "user", '
             b'"second_player_id": 2, "second_player_username": "user2", '
@@ -84,11 +86,64 @@ class TestGetMatchView(TestCase):
         self.assertEqual(200, retrieved_response.status_code)
         self.assertEqual(
             b'{"status": "awaiting", "number_of_movements": 0, '
+            b'"width": 3, "height": 3, "line_length": 3, '
             b'"board": [[null, null, null], [null, null, null], [null, null, null]], '
             b'"first_player_id": 1, "first_player_username": "user"}',
             retrieved_response.content,
         )
 
+    def test_get_string_board(self) -> None:
+        url = reverse("get_match", kwargs={"match_id": self.match.id})
+
+        retrieved_response = self.client.get(
+            url, {"board_format": "string"}, headers={"Authorization": self.auth_token}
+        )
+
+        self.assertEqual(200, retrieved_response.status_code)
+        self.assertEqual("---------", retrieved_response.json()["board"])
+
+    def test_get_code_board(self) -> None:
+        self.match.first_player_board = 0b000000001
+        self.match.second_player_board = 0b000010000
+        self.match.save()
+        url = reverse("get_match", kwargs={"match_id": self.match.id})
+
+        retrieved_response = self.client.get(
+            url, {"board_format": "code"}, headers={"Authorization": self.auth_token}
+        )
+
+        self.assertEqual(200, retrieved_response.status_code)
+        self.assertEqual(1 + 2 * 3**4, retrieved_response.json()["board"])
+
+    def test_get_code_board_too_large(self) -> None:
+        match = Match.objects.create(
+            first_player=self.user, width=15, height=15, line_length=5
+        )
+        url = reverse("get_match", kwargs={"match_id": match.id})
+
+        retrieved_response = self.client.get(
+            url, {"board_format": "code"}, headers={"Authorization": self.auth_token}
+        )
+
+        self.assertEqual(400, retrieved_response.status_code)
+        self.assertEqual(
+            b'{"error": "The board is too large for the \'code\' format"}',
+            retrieved_response.content,
+        )
+
+    def test_get_unknown_board_format(self) -> None:
+        url = reverse("get_match", kwargs={"match_id": self.match.id})
+
+        retrieved_response = self.client.get(
+            url, {"board_format": "compact"}, headers={"Authorization": self.auth_token}
+        )
+
+        self.assertEqual(400, retrieved_response.status_code)
+        self.assertEqual(
+            b'{"error": "Unknown board format \'compact\'"}',
+            retrieved_response.content,
+        )
+
     def test_unauthorized_get(self) -> None:
         url = reverse("get_match", kwargs={"match_id": self.match.id})
 
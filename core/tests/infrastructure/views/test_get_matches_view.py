@@ -3,8 +3,12 @@ from django.test import TestCase
 from freezegun import freeze_time
 from rest_framework.reverse import reverse
 
+from core.dependency_injection_factories.infrastructure.caches.user_cache_factory import (
+    UserCacheFactory,
+)
 from core.domain.models.match import Match
 from core.domain.models.user import User
+from core.domain.models.user_match import UserMatch
 
 
 @freeze_time("2023-08-22")
@@ -23,6 +27,12 @@ class TestGetMatchesView(TestCase):
         )
 
         cls.awaiting_match = Match.objects.create(id=1, first_player=cls.user)
+        UserMatch.objects.create(
+            user=cls.user, match=cls.awaiting_match, role="first player"
+        )
+
+    def setUp(self) -> None:
+        UserCacheFactory.create().clear()
 
     def test_get(self) -> None:
         url = reverse("get_matches")
@@ -35,7 +45,65 @@ class TestGetMatchesView(TestCase):
         self.assertEqual(200, retrieved_response.status_code)
         self.assertEqual(
             b'{"count":1,"next":null,"previous":null,'
-            b'"results":[{"id":1,"status":"awaiting","number_of_movements":0}]}',
+            b'"results":[{"id":1,"status":"awaiting","number_of_movements":0,'
+            b'"width":3,"height":3,"line_length":3}]}',
+            retrieved_response.content,
+        )
+
+    def test_get_after(self) -> None:
+        User.objects.filter(id=1).update(matches_total=12)
+        matches = [
+            (
+                Match.objects.create(first_player=self.user, second_player=self.guest)
+                if number % 2
+                else Match.objects.create(
+                    first_player=self.guest, second_player=self.user
+                )
+            )
+            for number in range(11)
+        ]
+        UserMatch.objects.bulk_create(
+            UserMatch(user=self.user, match=match, role="first player")
+            for match in matches
+        )
+        url = reverse("get_matches")
+
+        with self.assertNumQueries(2):
+            first_page = self.client.get(
+                url, {"after": 0}, headers={"Authorization": self.auth_token}
+            )
+        second_page = self.client.get(
+            first_page.json()["next"], headers={"Authorization": self.auth_token}
+        )
+
+        self.assertEqual(200, first_page.status_code)
+        self.assertEqual(12, first_page.json()["count"])
+        self.assertEqual(
+            [1] + [match.id for match in matches[:9]],
+            [match["id"] for match in first_page.json()["results"]],
+        )
+        self.assertEqual(
+            f"http://testserver/matches/all/?after={matches[8].id}",
+            first_page.json()["next"],
+        )
+        self.assertEqual(200, second_page.status_code)
+        self.assertEqual(
+            [match.id for match in matches[9:]],
+            [match["id"] for match in second_page.json()["results"]],
+        )
+        self.assertIsNone(second_page.json()["next"])
+        self.assertIsNone(first_page.json()["previous"])
+
+    def test_get_invalid_after(self) -> None:
+        url = reverse("get_matches")
+
+        retrieved_response = self.client.get(
+            url, {"after": "-1"}, headers={"Authorization": self.auth_token}
+        )
+
+        self.assertEqual(400, retrieved_response.status_code)
+        self.assertEqual(
+            b'{"error":"The cursor must be a non negative integer"}',
             retrieved_response.content,
         )
 
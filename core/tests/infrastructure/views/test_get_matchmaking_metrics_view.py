@@ -0,0 +1,60 @@
+from django.test import TestCase, override_settings
+from freezegun import freeze_time
+from rest_framework.reverse import reverse
+
+from core.dependency_injection_factories.infrastructure.matchmaking.matchmaking_queue_factory import (
+    MatchmakingQueueFactory,
+)
+from core.domain.models.user import User
+
+
+@freeze_time("2023-08-22")
+@override_settings(MATCHMAKING_POLL_TIMEOUT=0)
+class TestIntegrationGetMatchmakingMetricsView(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User(id=1, username="user", password="1234")
+        cls.user.save()
+
+        cls.auth_token = (
+            "Bearer eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJ1c2"
+            "VyX2lkIjoxLCJleHAiOjE2OTI3NDg4MDAsImlhdCI6MTY5MjY2M"
+            "jQwMCwicmVmcmVzaF90b2tlbiI6ZmFsc2V9.r-2WjLeEj8_-6zf4"
+            "wbYs9-oqr2FWd93YiUmn2itnSzw"
+        )
+
+    def setUp(self) -> None:
+        MatchmakingQueueFactory.create().clear()
+
+    def tearDown(self) -> None:
+        MatchmakingQueueFactory.create().clear()
+
+    def test_get(self) -> None:
+        self.client.post(
+            reverse("matchmaking"), headers={"Authorization": self.auth_token}
+        )
+        url = reverse("get_matchmaking_metrics")
+
+        retrieved_response = self.client.get(
+            url, headers={"Authorization": self.auth_token}
+        )
+
+        self.assertEqual("/matchmaking/metrics/", url)
+        self.assertEqual(200, retrieved_response.status_code)
+        self.assertEqual(
+            {
+                "queue_depth": 1,
+                "paired": 0,
+                "cancelled": 0,
+                "expired": 0,
+                "wait_time_p50": None,
+                "wait_time_p90": None,
+                "wait_time_p99": None,
+            },
+            retrieved_response.json(),
+        )
+
+    def test_unauthorized_get(self) -> None:
+        retrieved_response = self.client.get(reverse("get_matchmaking_metrics"))
+
+        self.assertEqual(401, retrieved_response.status_code)
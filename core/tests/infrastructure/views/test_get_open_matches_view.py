@@ -0,0 +1,88 @@
+from django.test import TestCase, override_settings
+from freezegun import freeze_time
+from rest_framework.reverse import reverse
+
+from core.dependency_injection_factories.infrastructure.caches.open_matches_cache_factory import (
+    OpenMatchesCacheFactory,
+)
+from core.domain.models.match import Match
+from core.domain.models.user import User
+
+
+@freeze_time("2023-08-22")
+@override_settings(REST_FRAMEWORK={"PAGE_SIZE": 2})
+class TestGetOpenMatchesView(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create(id=1, username="user", password="1234")
+        cls.guest = User.objects.create(id=2, username="user2", password="1234")
+
+        cls.auth_token = (
+            "Bearer eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJ1c2"
+            "VyX2lkIjoxLCJleHAiOjE2OTI3NDg4MDAsImlhdCI6MTY5MjY2M"
+            "jQwMCwicmVmcmVzaF90b2tlbiI6ZmFsc2V9.r-2WjLeEj8_-6zf4"
+            "wbYs9-oqr2FWd93YiUmn2itnSzw"
+        )
+
+        Match.objects.create(id=1, first_player=cls.user)
+        Match.objects.create(id=2, first_player=cls.guest, width=15, height=15)
+        Match.objects.create(
+            id=3, first_player=cls.user, second_player=cls.guest, status="in progress"
+        )
+        Match.objects.create(id=4, first_player=cls.guest)
+
+    def setUp(self) -> None:
+        OpenMatchesCacheFactory.create().clear()
+
+    def tearDown(self) -> None:
+        OpenMatchesCacheFactory.create().clear()
+
+    def test_get(self) -> None:
+        url = reverse("get_open_matches")
+
+        first_page = self.client.get(url, headers={"Authorization": self.auth_token})
+        second_page = self.client.get(
+            first_page.json()["next"], headers={"Authorization": self.auth_token}
+        )
+
+        self.assertEqual("/matches/open/", url)
+        self.assertEqual(200, first_page.status_code)
+        self.assertEqual(
+            b'{"next": "http://testserver/matches/open/?before=2", "results": ['
+            b'{"id": 4, "width": 3, "height": 3, "line_length": 3, '
+            b'"first_player_id": 2, "first_player_username": "user2"}, '
+            b'{"id": 2, "width": 15, "height": 15, "line_length": 3, '
+            b'"first_player_id": 2, "first_player_username": "user2"}]}',
+            first_page.content,
+        )
+        self.assertEqual(200, second_page.status_code)
+        self.assertEqual(
+            b'{"next": null, "results": ['
+            b'{"id": 1, "width": 3, "height": 3, "line_length": 3, '
+            b'"first_player_id": 1, "first_player_username": "user"}]}',
+            second_page.content,
+        )
+
+    def test_get_invalid_before(self) -> None:
+        url = reverse("get_open_matches")
+
+        retrieved_response = self.client.get(
+            url, {"before": "first"}, headers={"Authorization": self.auth_token}
+        )
+
+        self.assertEqual(400, retrieved_response.status_code)
+        self.assertEqual(
+            b'{"error": "The cursor must be a non negative integer"}',
+            retrieved_response.content,
+        )
+
+    def test_unauthorized_get(self) -> None:
+        url = reverse("get_open_matches")
+
+        retrieved_response = self.client.get(url)
+
+        self.assertEqual(401, retrieved_response.status_code)
+        self.assertEqual(
+            b'{"error": "Authentication failed"}',
+            retrieved_response.content,
+        )
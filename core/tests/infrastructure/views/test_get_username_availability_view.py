@@ -0,0 +1,63 @@
+from django.test import TestCase
+from rest_framework.reverse import reverse
+
+from core.dependency_injection_factories.infrastructure.caches.username_filter_factory import (
+    UsernameFilterFactory,
+)
+from core.domain.models.user import User
+
+
+class TestGetUsernameAvailabilityView(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        User.objects.create(id=1, username="user", password="1234")
+
+    def setUp(self) -> None:
+        UsernameFilterFactory.create().clear()
+
+    def tearDown(self) -> None:
+        UsernameFilterFactory.create().clear()
+
+    def test_get(self) -> None:
+        url = reverse("get_username_availability")
+
+        taken_response = self.client.get(url, {"username": "user"})
+        available_response = self.client.get(url, {"username": "user1"})
+
+        self.assertEqual("/users/available/", url)
+        self.assertEqual(200, taken_response.status_code)
+        self.assertEqual(
+            b'{"username": "user", "available": false}', taken_response.content
+        )
+        self.assertEqual(200, available_response.status_code)
+        self.assertEqual(
+            b'{"username": "user1", "available": true}', available_response.content
+        )
+
+    def test_get_after_registration(self) -> None:
+        url = reverse("get_username_availability")
+
+        self.client.get(url, {"username": "user1"})
+        self.client.post(
+            reverse("create_user"),
+            {"username": "user1", "password": "1234"},
+            content_type="application/json",
+        )
+        retrieved_response = self.client.get(url, {"username": "user1"})
+
+        self.assertEqual(
+            b'{"username": "user1", "available": false}', retrieved_response.content
+        )
+
+    def test_get_invalid_username(self) -> None:
+        url = reverse("get_username_availability")
+
+        missing_response = self.client.get(url)
+        long_response = self.client.get(url, {"username": "u" * 31})
+
+        self.assertEqual(400, missing_response.status_code)
+        self.assertEqual(400, long_response.status_code)
+        self.assertEqual(
+            b'{"error": "The username must have between 1 and 30 characters"}',
+            long_response.content,
+        )
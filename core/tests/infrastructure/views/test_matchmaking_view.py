@@ -0,0 +1,115 @@
+from django.test import TestCase, override_settings
+from freezegun import freeze_time
+from rest_framework.reverse import reverse
+
+from core.dependency_injection_factories.infrastructure.matchmaking.matchmaking_queue_factory import (
+    MatchmakingQueueFactory,
+)
+from core.domain.models.match import Match, MatchStatuses
+from core.domain.models.user import User
+
+
+@freeze_time("2023-08-22")
+@override_settings(MATCHMAKING_POLL_TIMEOUT=0)
+class TestIntegrationMatchmakingView(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User(id=1, username="user", password="1234")
+        cls.user.save()
+
+        cls.opponent = User(id=3, username="user3", password="1234")
+        cls.opponent.save()
+
+        cls.auth_token = (
+            "Bearer eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJ1c2"
+            "VyX2lkIjoxLCJleHAiOjE2OTI3NDg4MDAsImlhdCI6MTY5MjY2M"
+            "jQwMCwicmVmcmVzaF90b2tlbiI6ZmFsc2V9.r-2WjLeEj8_-6zf4"
+            "wbYs9-oqr2FWd93YiUmn2itnSzw"
+        )
+        cls.opponent_auth_token = (
+            "Bearer eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJ1c2VyX"
+            "2lkIjozLCJleHAiOjE2OTI3NDg4MDAsImlhdCI6MTY5MjY2MjQwMC"
+            "wicmVmcmVzaF90b2tlbiI6ZmFsc2V9.deYZBfghkuB5e3iOStB-kpq"
+            "qIH26r2nFWDwnbZSfiuc"
+        )
+
+    def setUp(self) -> None:
+        MatchmakingQueueFactory.create().clear()
+
+    def tearDown(self) -> None:
+        MatchmakingQueueFactory.create().clear()
+
+    def test_post(self) -> None:
+        url = reverse("matchmaking")
+
+        queued_response = self.client.post(
+            url, headers={"Authorization": self.auth_token}
+        )
+        paired_response = self.client.post(
+            url, headers={"Authorization": self.opponent_auth_token}
+        )
+        polled_response = self.client.post(
+            url, headers={"Authorization": self.auth_token}
+        )
+
+        self.assertEqual("/matchmaking/", url)
+        self.assertEqual(202, queued_response.status_code)
+        self.assertEqual({"status": "queued"}, queued_response.json())
+        self.assertEqual(201, paired_response.status_code)
+        self.assertEqual(paired_response.json(), polled_response.json())
+
+        match = Match.objects.get(id=paired_response.json()["match_id"])
+        self.assertEqual(self.user, match.first_player)
+        self.assertEqual(self.opponent, match.second_player)
+        self.assertEqual(MatchStatuses.IN_PROGRESS.value, match.status)
+
+    def test_unauthorized_post(self) -> None:
+        retrieved_response = self.client.post(reverse("matchmaking"))
+
+        self.assertEqual(401, retrieved_response.status_code)
+        self.assertEqual(
+            b'{"error": "Authentication failed"}',
+            retrieved_response.content,
+        )
+
+    def test_delete(self) -> None:
+        url = reverse("matchmaking")
+        self.client.post(url, headers={"Authorization": self.auth_token})
+
+        deleted_response = self.client.delete(
+            url, headers={"Authorization": self.auth_token}
+        )
+        not_queued_response = self.client.delete(
+            url, headers={"Authorization": self.auth_token}
+        )
+        queued_response = self.client.post(
+            url, headers={"Authorization": self.opponent_auth_token}
+        )
+
+        self.assertEqual(204, deleted_response.status_code)
+        self.assertEqual(404, not_queued_response.status_code)
+        self.assertEqual(
+            b'{"error": "User not in the matchmaking queue"}',
+            not_queued_response.content,
+        )
+        self.assertEqual(202, queued_response.status_code)
+
+    def test_delete_already_paired(self) -> None:
+        url = reverse("matchmaking")
+        self.client.post(url, headers={"Authorization": self.auth_token})
+        self.client.post(url, headers={"Authorization": self.opponent_auth_token})
+
+        retrieved_response = self.client.delete(
+            url, headers={"Authorization": self.auth_token}
+        )
+
+        self.assertEqual(409, retrieved_response.status_code)
+        self.assertEqual(
+            b'{"error": "User already paired with an opponent"}',
+            retrieved_response.content,
+        )
+
+    def test_unauthorized_delete(self) -> None:
+        retrieved_response = self.client.delete(reverse("matchmaking"))
+
+        self.assertEqual(401, retrieved_response.status_code)
@@ -0,0 +1,85 @@
+from django.test import TestCase
+from freezegun import freeze_time
+from rest_framework.reverse import reverse
+
+from core.domain.models.match import Match, MatchStatuses
+from core.domain.models.user import User
+from core.domain.models.user_match import UserMatch
+
+
+@freeze_time("2023-08-22")
+class TestIntegrationPostJoinAnyView(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User(id=2, username="user", password="1234")
+        cls.user.save()
+
+        cls.guest = User(id=1, username="user2", password="1234")
+        cls.guest.save()
+
+        cls.auth_token = (
+            "Bearer eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJ1c2"
+            "VyX2lkIjoxLCJleHAiOjE2OTI3NDg4MDAsImlhdCI6MTY5MjY2M"
+            "jQwMCwicmVmcmVzaF90b2tlbiI6ZmFsc2V9.r-2WjLeEj8_-6zf4"
+            "wbYs9-oqr2FWd93YiUmn2itnSzw"
+        )
+
+        cls.guest_match = Match(id=1, first_player=cls.guest)
+        cls.guest_match.save()
+
+        cls.started_match = Match(id=2, first_player=cls.user, status="in progress")
+        cls.started_match.save()
+
+        for match_id in (3, 4):
+            match = Match(id=match_id, first_player=cls.user)
+            match.save()
+            UserMatch(user=cls.user, match=match).save()
+
+    def test_post(self) -> None:
+        url = reverse("join_any_match")
+
+        retrieved_response = self.client.post(
+            url, headers={"Authorization": self.auth_token}
+        )
+
+        self.assertEqual("/matches/join-any/", url)
+        self.assertEqual(200, retrieved_response.status_code)
+        self.assertEqual({"match_id": 3}, retrieved_response.json())
+
+        match = Match.objects.get(id=3)
+        self.assertEqual(self.guest, match.second_player)
+        self.assertEqual(MatchStatuses.IN_PROGRESS.value, match.status)
+        self.assertEqual(
+            {MatchStatuses.IN_PROGRESS.value},
+            set(UserMatch.objects.filter(match=match).values_list("status", flat=True)),
+        )
+
+    def test_post_until_no_open_matches(self) -> None:
+        url = reverse("join_any_match")
+
+        joined_matches = [
+            self.client.post(url, headers={"Authorization": self.auth_token}).json()
+            for _ in range(2)
+        ]
+        retrieved_response = self.client.post(
+            url, headers={"Authorization": self.auth_token}
+        )
+
+        self.assertEqual([{"match_id": 3}, {"match_id": 4}], joined_matches)
+        self.assertEqual(404, retrieved_response.status_code)
+        self.assertEqual(
+            b'{"error": "No open match found"}',
+            retrieved_response.content,
+        )
+        self.assertEqual(2, User.objects.get(id=self.guest.id).matches_total)
+
+    def test_unauthorized_post(self) -> None:
+        url = reverse("join_any_match")
+
+        retrieved_response = self.client.post(url)
+
+        self.assertEqual(401, retrieved_response.status_code)
+        self.assertEqual(
+            b'{"error": "Authentication failed"}',
+            retrieved_response.content,
+        )
@@ -0,0 +1,89 @@
+from django.test import TestCase
+from rest_framework.reverse import reverse
+
+from core.dependency_injection_factories.infrastructure.verifiers.token_revocation_list_factory import (
+    TokenRevocationListFactory,
+)
+from core.domain.models.user import User
+
+
+class TestIntegrationPostLogoutView(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        existing_user = User(id=1, username="user", password="1234")
+        existing_user.save()
+
+    def setUp(self) -> None:
+        tokens = self.client.post(
+            reverse("login_user"),
+            {"username": "user", "password": "1234"},
+            content_type="application/json",
+        ).json()
+        self.access_token = tokens["access_token"]
+        self.refresh_token = tokens["refresh_token"]
+
+    def tearDown(self) -> None:
+        TokenRevocationListFactory.create().clear()
+
+    def test_post(self) -> None:
+        url = reverse("logout_user")
+
+        retrieved_response = self.client.post(
+            url,
+            {"refresh_token": self.refresh_token},
+            headers={"Authorization": f"Bearer {self.access_token}"},
+            content_type="application/json",
+        )
+        match_response = self.client.post(
+            reverse("create_match"),
+            headers={"Authorization": f"Bearer {self.access_token}"},
+        )
+        refresh_response = self.client.post(
+            reverse("refresh_token"),
+            {"refresh_token": self.refresh_token},
+            content_type="application/json",
+        )
+
+        self.assertEqual("/logout/", url)
+        self.assertEqual(204, retrieved_response.status_code)
+        self.assertEqual(401, match_response.status_code)
+        self.assertEqual(400, refresh_response.status_code)
+
+    def test_post_without_refresh_token(self) -> None:
+        url = reverse("logout_user")
+
+        retrieved_response = self.client.post(
+            url,
+            headers={"Authorization": f"Bearer {self.access_token}"},
+            content_type="application/json",
+        )
+        refresh_response = self.client.post(
+            reverse("refresh_token"),
+            {"refresh_token": self.refresh_token},
+            content_type="application/json",
+        )
+
+        self.assertEqual(204, retrieved_response.status_code)
+        self.assertEqual(200, refresh_response.status_code)
+
+    def test_post_unauthenticated(self) -> None:
+        url = reverse("logout_user")
+
+        retrieved_response = self.client.post(url)
+
+        self.assertEqual(401, retrieved_response.status_code)
+        self.assertEqual(
+            b'{"error": "Authentication failed"}', retrieved_response.content
+        )
+
+    def test_post_invalid_schema(self) -> None:
+        url = reverse("logout_user")
+
+        retrieved_response = self.client.post(
+            url,
+            {"refresh_token": 1},
+            headers={"Authorization": f"Bearer {self.access_token}"},
+            content_type="application/json",
+        )
+
+        self.assertEqual(400, retrieved_response.status_code)
@@ -2,6 +2,7 @@ from django.test import TestCase
 from freezegun import freeze_time
 from rest_framework.reverse import reverse
 
+from core.domain.models.match import Match
 from core.domain.models.user import User
 
 
@@ -29,6 +30,54 @@ class TestIntegrationPostMatchView(TestCase):
         self.assertEqual("/matches/", url)
         self.assertEqual(201, retrieved_response.status_code)
 
+    def test_post_custom_board(self) -> None:
+        url = reverse("create_match")
+
+        retrieved_response = self.client.post(
+            url,
+            data={"width": 15, "height": 15, "line_length": 5},
+            headers={"Authorization": self.auth_token},
+            content_type="application/json",
+        )
+
+        self.assertEqual(201, retrieved_response.status_code)
+        match = Match.objects.get(id=retrieved_response.json()["match_id"])
+        self.assertEqual(15, match.width)
+        self.assertEqual(15, match.height)
+        self.assertEqual(5, match.line_length)
+
+    def test_post_board_too_big(self) -> None:
+        url = reverse("create_match")
+
+        retrieved_response = self.client.post(
+            url,
+            data={"width": 20},
+            headers={"Authorization": self.auth_token},
+            content_type="application/json",
+        )
+
+        self.assertEqual(400, retrieved_response.status_code)
+        self.assertEqual(
+            b'{"error": "value must be at most 19 for dictionary value @ data[\'width\']"}',
+            retrieved_response.content,
+        )
+
+    def test_post_line_longer_than_board(self) -> None:
+        url = reverse("create_match")
+
+        retrieved_response = self.client.post(
+            url,
+            data={"width": 4, "height": 4, "line_length": 5},
+            headers={"Authorization": self.auth_token},
+            content_type="application/json",
+        )
+
+        self.assertEqual(400, retrieved_response.status_code)
+        self.assertEqual(
+            b'{"error": "line_length cannot be greater than the board size"}',
+            retrieved_response.content,
+        )
+
     def test_unauthorized_post(self) -> None:
         url = reverse("create_match")
 
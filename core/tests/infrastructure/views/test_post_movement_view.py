@@ -2,8 +2,19 @@ from django.test import TestCase
 from freezegun import freeze_time
 from rest_framework.reverse import reverse
 
+from core.dependency_injection_factories.infrastructure.caches.user_cache_factory import (
+    UserCacheFactory,
+)
+from core.dependency_injection_factories.infrastructure.verifiers.token_revocation_list_factory import (
+    TokenRevocationListFactory,
+)
+from core.dependency_injection_factories.infrastructure.verifiers.user_revocation_set_factory import (
+    UserRevocationSetFactory,
+)
 from core.domain.models.match import Match
+from core.domain.models.revoked_user import RevokedUser
 from core.domain.models.user import User
+from core.infrastructure.generators.jwt_generator import JWTGenerator
 
 
 @freeze_time("2023-08-22")
@@ -36,6 +47,22 @@ class TestIntegrationPostJoinView(TestCase):
             id=2, first_player=cls.user, second_player=cls.guest, status="finished"
         )
 
+        cls.match_about_to_win = Match.objects.create(
+            id=3,
+            first_player=cls.user,
+            second_player=cls.guest,
+            status="in progress",
+            number_of_movements=4,
+            first_player_board=0b000000011,
+            second_player_board=0b000011000,
+        )
+
+    def setUp(self) -> None:
+        UserCacheFactory.create().clear()
+        UserRevocationSetFactory.create().refresh()
+        TokenRevocationListFactory.create().clear()
+        TokenRevocationListFactory.create().refresh()
+
     def test_post(self) -> None:
         url = reverse("make_movement", kwargs={"match_id": 1})
 
@@ -49,6 +76,85 @@ class TestIntegrationPostJoinView(TestCase):
         self.assertEqual("/matches/1/movements/", url)
         self.assertEqual(204, retrieved_response.status_code)
 
+    def test_post_number_of_queries(self) -> None:
+        url = reverse("make_movement", kwargs={"match_id": 1})
+
+        with self.assertNumQueries(6):
+            retrieved_response = self.client.post(
+                url,
+                data={"x": 0, "y": 0},
+                headers={"Authorization": self.auth_token},
+                content_type="application/json",
+            )
+
+        self.assertEqual(204, retrieved_response.status_code)
+
+    def test_post_cached_user_number_of_queries(self) -> None:
+        url = reverse("make_movement", kwargs={"match_id": 1})
+        self.client.get(
+            reverse("get_match", kwargs={"match_id": 1}),
+            headers={"Authorization": self.auth_token},
+        )
+
+        with self.assertNumQueries(5):
+            retrieved_response = self.client.post(
+                url,
+                data={"x": 0, "y": 0},
+                headers={"Authorization": self.auth_token},
+                content_type="application/json",
+            )
+
+        self.assertEqual(204, retrieved_response.status_code)
+
+    def test_post_username_claim_number_of_queries(self) -> None:
+        url = reverse("make_movement", kwargs={"match_id": 1})
+        auth_token = f"Bearer {JWTGenerator().generate(self.user)}"
+
+        with self.assertNumQueries(5):
+            retrieved_response = self.client.post(
+                url,
+                data={"x": 0, "y": 0},
+                headers={"Authorization": auth_token},
+                content_type="application/json",
+            )
+
+        self.assertEqual(204, retrieved_response.status_code)
+
+    def test_post_revoked_user(self) -> None:
+        url = reverse("make_movement", kwargs={"match_id": 1})
+        auth_token = f"Bearer {JWTGenerator().generate(self.user)}"
+        UserRevocationSetFactory.create().revoke(self.user.id)
+
+        try:
+            retrieved_response = self.client.post(
+                url,
+                data={"x": 0, "y": 0},
+                headers={"Authorization": auth_token},
+                content_type="application/json",
+            )
+        finally:
+            RevokedUser.objects.all().delete()
+            UserRevocationSetFactory.create().refresh()
+
+        self.assertEqual(401, retrieved_response.status_code)
+
+    def test_post_winner_number_of_queries(self) -> None:
+        url = reverse("make_movement", kwargs={"match_id": 3})
+
+        with self.assertNumQueries(8):
+            retrieved_response = self.client.post(
+                url,
+                data={"x": 0, "y": 2},
+                headers={"Authorization": self.auth_token},
+                content_type="application/json",
+            )
+
+        self.assertEqual(204, retrieved_response.status_code)
+        match = Match.objects.get(id=3)
+        self.assertEqual("finished", match.status)
+        self.assertEqual(self.user, match.winner)
+        self.assertEqual(1, User.objects.get(id=1).matches_won)
+
     def test_unauthorized_post(self) -> None:
         url = reverse("make_movement", kwargs={"match_id": 1})
 
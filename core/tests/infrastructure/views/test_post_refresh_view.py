@@ -36,6 +36,19 @@ class TestIntegrationPostRefreshView(TestCase):
         self.assertEqual("/login/refresh/", url)
         self.assertEqual(200, retrieved_response.status_code)
 
+    def test_post_exchanges_legacy_refresh_token_once(self) -> None:
+        url = reverse("refresh_token")
+
+        first_response = self.client.post(
+            url, {"refresh_token": self.refresh_token}, content_type="application/json"
+        )
+        reused_response = self.client.post(
+            url, {"refresh_token": self.refresh_token}, content_type="application/json"
+        )
+
+        self.assertEqual(200, first_response.status_code)
+        self.assertEqual(400, reused_response.status_code)
+
     def test_post_invalid_schema(self) -> None:
         url = reverse("refresh_token")
 
@@ -63,3 +76,27 @@ class TestIntegrationPostRefreshView(TestCase):
             b'{"error": "Invalid refresh token"}',
             retrieved_response.content,
         )
+
+    def test_post_rotates_refresh_token(self) -> None:
+        url = reverse("refresh_token")
+        first_refresh_token = self.client.post(
+            reverse("login_user"),
+            {"username": "user", "password": "1234"},
+            content_type="application/json",
+        ).json()["refresh_token"]
+
+        second_response = self.client.post(
+            url, {"refresh_token": first_refresh_token}, content_type="application/json"
+        )
+        reused_response = self.client.post(
+            url, {"refresh_token": first_refresh_token}, content_type="application/json"
+        )
+        revoked_response = self.client.post(
+            url,
+            {"refresh_token": second_response.json()["refresh_token"]},
+            content_type="application/json",
+        )
+
+        self.assertEqual(200, second_response.status_code)
+        self.assertEqual(400, reused_response.status_code)
+        self.assertEqual(400, revoked_response.status_code)
@@ -2,6 +2,9 @@ from django.http import JsonResponse
 from django.test import TestCase
 from rest_framework.reverse import reverse
 
+from core.dependency_injection_factories.infrastructure.caches.username_filter_factory import (
+    UsernameFilterFactory,
+)
 from core.domain.models.user import User
 
 
@@ -11,6 +14,12 @@ class TestIntegrationPostUserView(TestCase):
         existing_user = User(id=1, username="user", password="1234")
         existing_user.save()
 
+    def setUp(self) -> None:
+        UsernameFilterFactory.create().clear()
+
+    def tearDown(self) -> None:
+        UsernameFilterFactory.create().clear()
+
     def test_post(self) -> None:
         url = reverse("create_user")
 
@@ -0,0 +1,99 @@
+import os
+from io import StringIO
+from tempfile import TemporaryDirectory
+
+from django.contrib.auth.hashers import check_password
+from django.core.management import CommandError, call_command
+from django.test import TransactionTestCase, override_settings
+
+from core.domain.models.user import User
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class TestProvisionUsers(TransactionTestCase):
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        User.objects.create(username="user2", password="1234")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_csv(self) -> None:
+        path = self.__write(
+            "users.csv",
+            "username,password\n"
+            "user1,1234\n"
+            "user2,1234\n"
+            ",1234\n"
+            "user3,1234\n"
+            "user1,abcd\n"
+            "user4,\n",
+        )
+
+        output = self.__provision(path)
+
+        self.assertEqual(
+            [
+                "Row 2: username 'user2' already exists",
+                "Row 3: invalid username or password",
+                "Row 5: username 'user1' already exists",
+                "Row 6: invalid username or password",
+                "Provisioned 2 users, 2 conflicts, 2 invalid rows",
+            ],
+            output,
+        )
+        self.assertEqual(
+            ["user1", "user2", "user3"],
+            list(User.objects.order_by("username").values_list("username", flat=True)),
+        )
+        self.assertTrue(
+            check_password("1234", User.objects.get(username="user1").password)
+        )
+
+    def test_ndjson(self) -> None:
+        path = self.__write(
+            "users.ndjson",
+            '{"username": "user1", "password": "1234"}\n'
+            "\n"
+            "not json\n"
+            '["user3", "1234"]\n'
+            '{"username": "user2", "password": "1234"}\n'
+            '{"username": "' + "u" * 31 + '", "password": "1234"}\n',
+        )
+
+        output = self.__provision(path)
+
+        self.assertEqual(
+            [
+                "Row 2: invalid username or password",
+                "Row 3: invalid username or password",
+                "Row 4: username 'user2' already exists",
+                "Row 5: invalid username or password",
+                "Provisioned 1 users, 1 conflicts, 3 invalid rows",
+            ],
+            output,
+        )
+        self.assertTrue(User.objects.filter(username="user1").exists())
+
+    def test_missing_file(self) -> None:
+        with self.assertRaises(CommandError):
+            self.__provision(os.path.join(self.directory.name, "missing.csv"))
+
+    def test_unknown_format(self) -> None:
+        path = self.__write("users.txt", "username,password\n")
+
+        with self.assertRaises(CommandError):
+            self.__provision(path)
+
+    def __write(self, name: str, content: str) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as users_file:
+            users_file.write(content)
+
+        return path
+
+    def __provision(self, path: str) -> list[str]:
+        stdout = StringIO()
+        call_command("provision_users", path, batch_size=2, workers=1, stdout=stdout)
+
+        return stdout.getvalue().splitlines()